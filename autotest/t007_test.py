@@ -1410,6 +1410,44 @@ def test_vertex_model_dot_plot():
     plt.close('all')
 
 
+def test_vertex_plot_array_frames():
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import PatchCollection
+    sim_path = "../examples/data/mf6/test003_gwftri_disv"
+    disv_sim = flopy.mf6.MFSimulation.load(sim_name="mfsim.nam",
+                                           sim_ws=sim_path)
+    mg = disv_sim.get_model('gwf_1').modelgrid
+    a = np.arange(mg.ncpl, dtype=float)
+
+    pmv = flopy.plot.PlotMapView(modelgrid=mg)
+    pc = pmv.plot_array(a)
+    assert isinstance(pc, PatchCollection)
+    patches = pmv._get_cell_patches()
+    # the cell patches are cached on the model grid
+    pmv2 = flopy.plot.PlotMapView(modelgrid=mg)
+    assert pmv2._get_cell_patches() is patches
+    mg.set_coord_info(xoff=10.)
+    assert pmv2._get_cell_patches() is not patches
+    plt.close('all')
+
+    pmv = flopy.plot.PlotMapView(modelgrid=mg)
+    arrays = [a * (i + 1) for i in range(3)]
+    collections = []
+    for i, pc in enumerate(pmv.plot_array_frames(arrays)):
+        assert np.allclose(pc.get_array(), arrays[i])
+        collections.append(pc)
+    assert all(pc is collections[0] for pc in collections)
+    assert len(pmv.ax.collections) == 1
+    plt.close('all')
+
+    fname = os.path.join(tpth, 'vertex_frames.gif')
+    pmv = flopy.plot.PlotMapView(modelgrid=mg)
+    pc = pmv.save_array_animation(arrays, fname)
+    assert os.path.isfile(fname)
+    assert np.allclose(pc.get_array(), arrays[-1])
+    plt.close('all')
+
+
 def test_model_dot_plot():
     import matplotlib.pyplot as plt
     loadpth = os.path.join('..', 'examples', 'data', 'secp')
@@ -1475,6 +1513,96 @@ def test_netcdf_classmethods():
     assert len(diff) == 0, str(diff)
 
 
+def test_netcdf_transient_export():
+    import os
+    import flopy
+
+    # Do not fail if netCDF4 not installed
+    try:
+        import netCDF4
+        import pyproj
+    except:
+        return
+
+    nper = 5
+    m = flopy.modflow.Modflow('transient_nc', model_ws=npth)
+    dis = flopy.modflow.ModflowDis(m, nlay=2, nrow=4, ncol=5, nper=nper,
+                                   perlen=10., lenuni=2)
+    bas = flopy.modflow.ModflowBas(m)
+    # stress periods 1, 3 and 4 reuse the data of the previous period
+    wel = flopy.modflow.ModflowWel(m, stress_period_data={
+        0: [[0, 1, 1, -100.], [1, 2, 3, -50.], [1, 2, 3, -25.]],
+        2: [[0, 3, 4, -10.]]})
+    rch = flopy.modflow.ModflowRch(m, rech={0: 0.001, 2: 0.002})
+
+    d = {}
+    wel.stress_period_data.export(d)
+    rch.rech.export(d)
+    m4d = wel.stress_period_data.masked_4D_arrays['flux']
+    assert np.array_equal(d['wel_flux'], m4d, equal_nan=True)
+    assert np.array_equal(d['rech'], rch.rech.array)
+
+    fnc_name = os.path.join(npth, 'transient_nc.nc')
+    f = m.export(fnc_name)
+    f.write()
+    nc = netCDF4.Dataset(fnc_name, 'r')
+    flux = nc.variables['wel_flux']
+    assert np.allclose(flux[:].filled(np.nan), m4d, equal_nan=True)
+    assert flux.getncattr('min') == -100.
+    assert flux.getncattr('max') == -10.
+    rech = nc.variables['rech']
+    assert np.allclose(rech[:, 0], rch.rech.array[:, 0])
+    assert np.isclose(rech.getncattr('max'), 0.002)
+    nc.close()
+
+
+def build_ensemble_member(ireal):
+    m = flopy.modflow.Modflow('ens_{}'.format(ireal), model_ws=npth)
+    dis = flopy.modflow.ModflowDis(m, nlay=2, nrow=3, ncol=4, nper=2,
+                                   lenuni=2)
+    bas = flopy.modflow.ModflowBas(m)
+    lpf = flopy.modflow.ModflowLpf(m, hk=float(ireal + 1))
+    rch = flopy.modflow.ModflowRch(m, rech={0: 0.001 * (ireal + 1)})
+    return m
+
+
+def test_ensemble_export():
+    import os
+    import flopy
+
+    # Do not fail if netCDF4 not installed
+    try:
+        import netCDF4
+        import pyproj
+    except:
+        return
+
+    nreal = 4
+    models = [build_ensemble_member(i) for i in range(nreal)]
+    hk = np.array([m.lpf.hk.array for m in models])
+
+    for processes in [None, 2]:
+        fnc_name = os.path.join(npth, 'ensemble_{}.nc'.format(processes))
+        if processes is None:
+            f = flopy.export.utils.ensemble_export(fnc_name, models)
+        else:
+            f = flopy.export.utils.ensemble_export(
+                fnc_name, range(nreal), load_member=build_ensemble_member,
+                processes=processes)
+        f.write()
+        nc = netCDF4.Dataset(fnc_name, 'r')
+        assert len(nc.dimensions['realization']) == nreal
+        assert np.array_equal(nc.variables['realization'][:],
+                              np.arange(nreal))
+        assert nc.variables['hk'].dimensions[0] == 'realization'
+        assert np.allclose(nc.variables['hk'][:], hk)
+        assert np.allclose(nc.variables['hk_mean'][:], hk.mean(axis=0))
+        assert np.allclose(nc.variables['hk_stdev'][:], hk.std(axis=0))
+        assert np.allclose(nc.variables['rech'][:, :, 0].max(axis=(1, 2, 3)),
+                           0.001 * np.arange(1, nreal + 1))
+        nc.close()
+
+
 def test_wkt_parse():
     """Test parsing of Coordinate Reference System parameters
     from well-known-text in .prj files."""
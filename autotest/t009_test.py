@@ -572,6 +572,36 @@ def test_SfrFile():
     assert sfrout.times == expected_times, sfrout.times
 
 
+def test_SfrFile_chunks_and_cache():
+    fpth = '../examples/data/sfr_examples/test1tr.flw'
+    sfrout = SfrFile(fpth)
+    chunks = list(sfrout.iter_data(chunksize=100))
+    assert len(chunks) > 1
+    data = np.concatenate(chunks)
+    assert data.shape == (1080,)
+    assert sfrout.times == sorted(set(zip(data['kstp'], data['kper'])),
+                                  key=lambda t: t[::-1])
+
+    cachedir = os.path.join(outpath, 'test1tr_flw_cache')
+    sfrcache = SfrFile(fpth, cache=cachedir)
+    assert len(np.concatenate(list(sfrcache.iter_data()))) == 1080
+    assert os.path.isfile(os.path.join(cachedir, 'cache.json'))
+    assert sfrcache.get_cache(cachedir) is not None
+    if sfrout.pd is not None:
+        df = sfrout.get_dataframe()
+        assert df.equals(sfrcache.get_dataframe())
+
+        # time series of a reach from the index
+        results = sfrcache.get_results(2, 3)
+        assert len(results) == 30
+        assert results.kstpkper.tolist() == sfrout.times
+        expected = df.loc[(df.segment == 2) & (df.reach == 3)]
+        assert results.equals(expected)
+        assert sfrout.get_results(2, 3).equals(expected)
+        results = sfrcache.get_results([1, 2], [1, 3])
+        assert len(results) == 60
+
+
 def test_sfr_plot():
     #m = flopy.modflow.Modflow.load('test1ss.nam', model_ws=path, verbose=False)
     #sfr = m.get_package('SFR')
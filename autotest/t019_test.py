@@ -212,8 +212,86 @@ def test_mf6obsfile_read():
     return
 
 
+def test_mf6obsfile_read_large():
+    # write a binary mf6 observation file with an incomplete last record
+    nobs, ntimes, lenobsname = 500, 2000, 40
+    obsnames = ['OBS{:05d}'.format(i) for i in range(nobs)]
+    dtype = np.dtype([('totim', 'f8')] + [(n, 'f8') for n in obsnames])
+    data = np.zeros(ntimes, dtype=dtype)
+    data['totim'] = np.arange(1, ntimes + 1, dtype=float)
+    for i, name in enumerate(obsnames):
+        data[name] = data['totim'] * 1000. + i
+    pth = os.path.join(mpth, 'large_obs.bin')
+    with open(pth, 'wb') as f:
+        f.write('{:<11s}{:<89d}'.format('cont double',
+                                        lenobsname).encode())
+        np.array([nobs], dtype=np.int32).tofile(f)
+        for name in obsnames:
+            f.write('{:<40s}'.format(name).encode())
+        data.tofile(f)
+        data[:1].tofile(f)
+        f.truncate(f.tell() - 8)
+
+    h = flopy.utils.Mf6Obs(pth)
+    assert h.get_ntimes() == ntimes
+    assert h.get_obsnames() == obsnames
+    assert np.array_equal(h.get_data(), data)
+
+    # memory-mapped data
+    h = flopy.utils.Mf6Obs(pth, load_data=False)
+    assert isinstance(h.data, np.memmap)
+    assert h.get_times() == data['totim'].tolist()
+    r = h.get_data(obsname='OBS00123')
+    assert not isinstance(r, np.memmap)
+    assert r.dtype.names == ('totim', 'OBS00123')
+    assert np.array_equal(r['OBS00123'], data['OBS00123'])
+    r = h.get_data(totim=10.)
+    assert r.shape == (1,)
+    assert r['OBS00499'][0] == 10499.
+    return
+
+
+def test_mf6obs_csv_cache():
+    import time
+    from flopy.mf6.utils import mfobservation
+
+    pth = os.path.join(mpth, 'obs_cache.csv')
+    names = ['OBS{}'.format(i) for i in range(1000)]
+    v = np.arange(5 * 1001, dtype=float).reshape(5, 1001)
+    v[:, 0] = [1., 2., 3., 4., 5.]
+    with open(pth, 'w') as f:
+        f.write(','.join(['time'] + names) + '\n')
+        np.savetxt(f, v, delimiter=',', fmt='%.10G')
+
+    obs = mfobservation.Observations(pth)
+    assert obs.get_times() == [1., 2., 3., 4., 5.]
+    assert obs.get_nrecords() == 1001
+    assert obs.get_data(key='OBS10') == v[:, 11].tolist()
+    assert obs.get_data(key='OBS10', totim=2.) == v[1, 11]
+    assert np.array_equal(obs.get_obs_data(), v[:, 1:])
+    data = obs.get_data()
+    assert data.shape == (6, 1001) and data[0, 0] == 'time'
+
+    df = obs.get_dataframe(keys='OBS3, OBS1', idx=2)
+    assert list(df.columns) == ['OBS1', 'OBS3']
+    assert df.index.tolist() == [3.]
+    assert df.values.tolist() == [[v[2, 2], v[2, 4]]]
+
+    # the file is parsed once and read again after it is changed
+    data = mfobservation._read_obs_csv(pth)
+    assert mfobservation._read_obs_csv(pth) is data
+    time.sleep(0.01)
+    with open(pth, 'a') as f:
+        f.write(','.join(['6'] + ['1.'] * 1000) + '\n')
+    assert obs.get_ntimes() == 6
+    assert obs.get_data(key='OBS999', idx=-1) == 1.
+    return
+
+
 if __name__ == '__main__':
     test_mf6obsfile_read()
+    test_mf6obs_csv_cache()
+    test_mf6obsfile_read_large()
     test_hydmodfile_create()
     test_hydmodfile_load()
     test_hydmodfile_read()
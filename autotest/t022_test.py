@@ -392,6 +392,38 @@ def test_swr_binary_obs(ipos=5):
     return
 
 
+def test_swr_binary_ts_multiple_reaches():
+    import numpy as np
+
+    # stage, flow and exchange time series of several reaches at once
+    sobj = flopy.utils.SwrStage(os.path.join(pth, files[0]))
+    irecs = [0, 5, 17]
+    ts = sobj.get_ts(irec=irecs)
+    assert ts.shape == (336, 3), \
+        'SwrStage timeseries shape does not equal (336, 3)'
+    assert isinstance(sobj._data, np.memmap)
+    for i, irec in enumerate(irecs):
+        assert np.array_equal(ts[:, i], sobj.get_ts(irec=irec))
+    assert np.array_equal(ts[10], sobj.get_data(idx=10)[irecs])
+
+    sobj = flopy.utils.SwrFlow(os.path.join(pth, files[2]))
+    ts = sobj.get_ts(irec=[0, 2], iconn=[1, 3])
+    for i, (irec, iconn) in enumerate([(0, 1), (2, 3)]):
+        assert np.array_equal(ts[:, i], sobj.get_ts(irec=irec, iconn=iconn))
+
+    sobj = flopy.utils.SwrExchange(os.path.join(pth, files[3]))
+    ts = sobj.get_ts(irec=[0, 3, 18], klay=0)
+    assert ts.shape == (350, 3), \
+        'SwrExchange timeseries shape does not equal (350, 3)'
+    for i, irec in enumerate([0, 3, 18]):
+        ts1 = sobj.get_ts(irec=irec)
+        assert np.array_equal(ts[:, i], ts1)
+        r = sobj.get_data(idx=20)
+        r = r[(r['reach'] == irec) & (r['layer'] == 0)]
+        assert np.array_equal(ts1[20:21], r)
+    return
+
+
 if __name__ == '__main__':
     test_swr_binary_obs()
     test_swr_binary_stage()
@@ -399,3 +431,4 @@ if __name__ == '__main__':
     test_swr_binary_qm()
     test_swr_binary_qaq()
     test_swr_binary_structure()
+    test_swr_binary_ts_multiple_reaches()
@@ -216,6 +216,146 @@ def test_get_destination_data():
                            mg=mg4)
 
 
+def test_pathline_segments():
+    pthobj = PathlineFile(os.path.join(path, 'EXAMPLE-3.pathline'))
+    for totim in (None, 1000.):
+        plines = pthobj.get_alldata(totim=totim, ge=False)
+        points, offsets = pthobj.get_segments(totim=totim, ge=False)
+        assert len(offsets) == len(pthobj.nid) + 1
+        assert offsets[-1] == len(points)
+        for n, pid in enumerate(pthobj.nid):
+            p = pthobj.get_data(partid=pid, totim=totim, ge=False)
+            msg = 'segment for particle {} is not correct'.format(pid)
+            assert np.array_equal(points[offsets[n]:offsets[n + 1]], p), msg
+            assert np.array_equal(plines[n], p), msg
+
+    # plot the pathlines directly from the pathline file
+    try:
+        import matplotlib
+        matplotlib.use('agg')
+    except:
+        return
+    m = flopy.modflow.Modflow.load('EXAMPLE.nam', model_ws=path)
+    mm = flopy.plot.PlotMapView(model=m)
+    plines = pthobj.get_alldata()
+    lc0 = mm.plot_pathline(plines, layer='all', travel_time='> 500')
+    lc1 = mm.plot_pathline(pthobj, layer='all', travel_time='> 500')
+    lc2 = mm.plot_pathline(pthobj.get_segments(), layer='all',
+                           travel_time='> 500')
+    segs0 = lc0.get_segments()
+    for lc in (lc1, lc2):
+        segs = lc.get_segments()
+        assert len(segs) == len(segs0)
+        for s0, s in zip(segs0, segs):
+            assert np.allclose(s0, s)
+
+
+def test_destination_queries():
+    pthobj = PathlineFile(os.path.join(path, 'EXAMPLE-3.pathline'))
+    epobj = EndpointFile(os.path.join(path, 'EXAMPLE-3.endpoint'))
+    ep = epobj.get_alldata()
+    dest_cells = [(4, 12, 12), (2, 5, 5), (100, 0, 0)]
+
+    # compare indexed queries with a mask of the full data
+    idx = np.zeros(ep.shape[0], dtype=bool)
+    for k, i, j in dest_cells:
+        idx |= (ep.k == k) & (ep.i == i) & (ep.j == j)
+    epd = epobj.get_destination_endpoint_data(dest_cells)
+    assert np.array_equal(epd, ep[idx])
+    for pid in epd.particleid:
+        assert np.array_equal(epobj.get_data(pid), ep[ep.particleid == pid])
+
+    pth = pthobj._data
+    idx = np.zeros(pth.shape[0], dtype=bool)
+    for k, i, j in dest_cells:
+        idx |= (pth['k'] == k) & (pth['i'] == i) & (pth['j'] == j)
+    pids = np.unique(pth['particleid'][idx])
+    pthd = pthobj.get_destination_pathline_data(dest_cells, to_recarray=True)
+    assert np.array_equal(np.unique(pthd.particleid), pids)
+    assert pthd.shape[0] == np.in1d(pth['particleid'], pids).sum()
+    plist = pthobj.get_destination_pathline_data(dest_cells)
+    assert len(plist) == pids.shape[0]
+
+
+def test_mp7_pathline_load():
+    # write a MODPATH 7 pathline file with three pathlines
+    fpth = os.path.join(path, 'mp7.mppth')
+    counts = [3, 1, 2]
+    f = open(fpth, 'w')
+    f.write('MODPATH_PATHLINE_FILE         7         2\n')
+    f.write('     1     1   0.0E+00   0.0E+00   0.0E+00\n')
+    f.write('END HEADER\n')
+    for n, count in enumerate(counts):
+        f.write('{:10d}{:10d}{:10d}{:10d}\n'.format(n + 1, 1, 10 + n, count))
+        for i in range(count):
+            f.write('{:10d} {:15.7E} {:15.7E} {:15.7E} {:15.7E}'.format(
+                100 * n + i + 1, float(i), float(n), 1., 10. * i))
+            f.write(' 0.5 0.5 0.5{:10d}{:10d}{:10d}\n'.format(n + 1, 1, 1))
+    f.close()
+
+    pthobj = PathlineFile(fpth)
+    assert pthobj.version == 7
+    assert pthobj._data.shape[0] == sum(counts)
+    assert np.array_equal(pthobj.nid, [0, 1, 2])
+    for n, count in enumerate(counts):
+        p = pthobj.get_data(partid=n)
+        assert p.shape[0] == count
+        assert np.allclose(p.x, np.arange(count))
+        assert np.allclose(p.y, n)
+        assert np.allclose(p.time, 10. * np.arange(count))
+        assert np.all(p.k == n)
+    d = pthobj._data
+    assert np.array_equal(np.unique(d['particleidloc']), [9, 10, 11])
+    assert np.array_equal(d['node'][:3], [0, 1, 2])
+
+
+def test_iter_data():
+    fpth = os.path.join(path, 'EXAMPLE-3.pathline')
+    pthobj = PathlineFile(fpth)
+    pthlazy = PathlineFile(fpth, load_data=False)
+    assert pthlazy._data is None
+    epobj = EndpointFile(os.path.join(path, 'EXAMPLE-3.endpoint'))
+    eplazy = EndpointFile(os.path.join(path, 'EXAMPLE-3.endpoint'),
+                          load_data=False)
+    dest_cells = [(4, 12, 12)]
+
+    # all of the data in chunks
+    chunks = list(pthlazy.iter_data(chunksize=50))
+    assert len(chunks) == int(np.ceil(pthobj._data.shape[0] / 50.))
+    pth = np.concatenate(chunks)
+    pth.sort(order=['particleid', 'time'])
+    pth0 = pthobj._data.copy()
+    pth0.sort(order=['particleid', 'time'])
+    assert np.array_equal(pth, pth0)
+
+    # filters
+    pth = np.concatenate(list(pthlazy.iter_data(chunksize=50,
+                                                dest_cells=dest_cells)))
+    pth0 = pthobj.get_destination_pathline_data(dest_cells, to_recarray=True)
+    assert np.array_equal(np.unique(pth['particleid']),
+                          np.unique(pth0.particleid))
+    pth = np.concatenate(list(pthlazy.iter_data(time_range=(1000., 5000.),
+                                                partid=[0, 1, 2])))
+    assert np.all((pth['time'] >= 1000.) & (pth['time'] <= 5000.))
+    assert np.all(np.in1d(pth['particleid'], [0, 1, 2]))
+    ep = np.concatenate(list(eplazy.iter_data(chunksize=7,
+                                              dest_cells=dest_cells)))
+    ep0 = epobj.get_destination_endpoint_data(dest_cells)
+    assert np.array_equal(ep['particleid'], ep0.particleid)
+
+    # columnar cache
+    cachedir = os.path.join(path, 'pathline_cache')
+    if os.path.isdir(cachedir):
+        shutil.rmtree(cachedir)
+    assert pthlazy.get_cache(cachedir) is None
+    pth = np.concatenate(list(pthlazy.iter_data(cache=cachedir)))
+    columns = pthlazy.get_cache(cachedir)
+    assert isinstance(columns['x'], np.memmap)
+    assert np.array_equal(columns['x'], pth['x'])
+    pth1 = np.concatenate(list(pthlazy.iter_data(cache=cachedir)))
+    assert np.array_equal(pth, pth1)
+
+
 def test_loadtxt():
     from flopy.utils.flopy_io import loadtxt
     pthfile = os.path.join(path, 'EXAMPLE-3.pathline')
@@ -369,6 +369,57 @@ def test_zonbud_active_areas_zone_zero(rtol=1e-2):
     return
 
 
+def test_zonebudget_output_formats():
+    from flopy.utils import ZoneBudgetOutput
+    from flopy.modflow import Modflow
+
+    model_ws = os.path.join("..", "examples", "data",
+                            "freyberg_multilayer_transient")
+    ml = Modflow.load("freyberg.nam", model_ws=model_ws,
+                      load_only=["dis"], check=False)
+    zone_array = read_zbarray(zon_f)
+
+    zbtxt = ZoneBudgetOutput(os.path.join(loadpth, "freyberg_mlt.txt"),
+                             ml.dis, zone_array)
+    zbcsv = ZoneBudgetOutput(os.path.join(loadpth, "freyberg_mlt.1.csv"),
+                             ml.dis, zone_array)
+    zbcsv2 = ZoneBudgetOutput(os.path.join(loadpth, "freyberg_mlt.2.csv"),
+                              ml.dis, zone_array)
+    dftxt, dfcsv, dfcsv2 = zbtxt.dataframe, zbcsv.dataframe, zbcsv2.dataframe
+    assert len(dftxt) == len(dfcsv) == len(dfcsv2) == 3291
+    for df in (dfcsv, dfcsv2):
+        df = df.sort_values(["kper", "kstp", "zone"])
+        for col in ("zone", "kstp", "kper", "totim"):
+            assert np.array_equal(dftxt[col].values, df[col].values)
+        for col in ("storage", "constant head"):
+            assert np.allclose(dftxt[col].values, df[col].values,
+                               rtol=1e-3, atol=1.)
+    # the first stress period is steady state
+    assert np.all(dftxt.loc[dftxt.kper == 0, "storage"].values == 0.)
+
+    # flow budgets split over several chunks of the file
+    chunksize = ZoneBudgetOutput._chunksize
+    try:
+        ZoneBudgetOutput._chunksize = 1000
+        for zb in (zbtxt, zbcsv):
+            zbchunk = ZoneBudgetOutput(zb._filename, ml.dis, zone_array)
+            assert zbchunk.dataframe.equals(zb.dataframe)
+    finally:
+        ZoneBudgetOutput._chunksize = chunksize
+
+    # cumulative volumes of each zone
+    for extrapolate_kper in (False, True):
+        vdf = zbcsv.volumetric_flux(extrapolate_kper=extrapolate_kper)
+        cdf = zbcsv.volumetric_flux(extrapolate_kper=extrapolate_kper,
+                                    cumulative=True)
+        assert np.array_equal(vdf.zone.values, cdf.zone.values)
+        for col in ("storage", "zone 1", "total"):
+            expected = vdf.groupby("zone")[col].cumsum().values
+            assert np.allclose(cdf[col].values, expected)
+    assert vdf.kper.max() == len(ml.dis.nstp.array) - 1
+    return
+
+
 if __name__ == '__main__':
     # test_compare2mflist_mlt()
     test_compare2zonebudget()
@@ -383,3 +434,4 @@ if __name__ == '__main__':
     test_get_model_shape()
     test_zonebudget_output_to_netcdf()
     test_zonbud_active_areas_zone_zero()
+    test_zonebudget_output_formats()
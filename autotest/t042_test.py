@@ -95,6 +95,40 @@ def test_get_sat_thickness_gradients():
     sat_thick = get_saturated_thickness(hds, m, nodata)
     assert np.abs(np.sum(sat_thick[:, 1, 1] - np.array([0.2, 1., 1.]))) < 1e-6
 
+def test_postprocessing_headfile():
+    import os
+    fpth = os.path.join('..', 'examples', 'data', 'mf6', 'create_tests',
+                        'test005_advgw_tidal', 'expected_output',
+                        'AdvGW_tidal.hds')
+    hdsobj = flopy.utils.HeadFile(fpth)
+    hds = hdsobj.get_alldata()
+    nodata = hds[0, 0, 0, 0]
+    nt, nl, nr, nc = hds.shape
+
+    # the head file is read one time step at a time
+    wt = get_water_table(hdsobj, nodata=nodata)
+    assert wt.shape == (nt, nr, nc)
+    assert np.array_equal(wt, get_water_table(hds, nodata=nodata))
+    wt = get_water_table(hdsobj, nodata=nodata, per_idx=[3, 10, 50],
+                         processes=2)
+    assert np.array_equal(wt, get_water_table(hds[[3, 10, 50]],
+                                              nodata=nodata))
+
+    botm = np.stack([np.full((nr, nc), z) for z in (-5., -10., -15.)])
+    m = mf.Modflow('junk', version='mfnwt', model_ws='temp')
+    dis = mf.ModflowDis(m, nlay=nl, nrow=nr, ncol=nc, botm=botm, top=10.)
+    lpf = mf.ModflowLpf(m, laytyp=[1, 0, 0])
+    grad = get_gradients(hdsobj, m, nodata, per_idx=[0, 1, 2],
+                         processes=2)
+    assert np.array_equal(grad, get_gradients(hds[:3], m, nodata),
+                          equal_nan=True)
+    sat_thick = get_saturated_thickness(hdsobj, m, nodata, per_idx=5)
+    assert sat_thick.shape == (nl, nr, nc)
+    assert np.array_equal(sat_thick,
+                          get_saturated_thickness(hds[5], m, nodata),
+                          equal_nan=True)
+
+
 if __name__ == '__main__':
     #test_get_transmissivities()
     #test_get_water_table()
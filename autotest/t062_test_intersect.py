@@ -142,5 +142,92 @@ def test_intersection():
             assert all(np.isnan([row, col, cell2d_disv]))
 
 
+def test_spatial_index():
+    import os
+    from flopy.discretization import StructuredGrid, UnstructuredGrid
+
+    ml_dis = dis_model()
+    ml_disv = disv_model()
+    mg_dis = ml_dis.modelgrid
+    mg_disv = ml_disv.modelgrid
+
+    # points inside, on the edges and outside of the grid
+    np.random.seed(0)
+    xl = np.random.uniform(-100., delr * ncol + 100., 500)
+    yl = np.random.uniform(-100., delc * nrow + 100., 500)
+    # points on the inner cell edges
+    xl[:20] = np.random.randint(1, ncol, 20) * delr
+    yl[:20] = np.random.randint(1, nrow, 20) * delc
+    cell2d = mg_disv.intersect(xl, yl, local=True, forgive=True)
+    for k in range(xl.shape[0]):
+        row, col = mg_dis.intersect(xl[k], yl[k], local=True, forgive=True)
+        if np.isnan(row):
+            assert np.isnan(cell2d[k])
+        else:
+            assert cell2d[k] == row * ncol + col
+
+    # the index is in local coordinates and kept by the grid, points on
+    # edges are not compared after the rotation
+    x, y = mg_disv.get_coords(xl, yl)
+    index = mg_disv.get_spatial_index()
+    assert np.array_equal(
+        mg_disv.intersect(x, y, forgive=True)[20:], cell2d[20:],
+        equal_nan=True
+    )
+    mg_disv.set_coord_info(xoff=0., yoff=0., angrot=0.)
+    assert mg_disv.get_spatial_index() is index
+    assert np.array_equal(
+        mg_disv.intersect(xl, yl, forgive=True), cell2d, equal_nan=True
+    )
+
+    # save and load the index
+    fname = os.path.join('temp', 't062_spatial_index.npz')
+    if os.path.isfile(fname):
+        os.remove(fname)
+    mg_dis._spatial_index = None
+    index = mg_dis.get_spatial_index(filename=fname)
+    assert os.path.isfile(fname)
+    mg_dis._spatial_index = None
+    index2 = mg_dis.get_spatial_index(filename=fname)
+    assert index2 is not index
+    assert np.array_equal(index2.xv, index.xv)
+    nodes = index2.query_points(xl, yl)
+    cell = np.where(np.isnan(cell2d), -1, cell2d)
+    assert np.array_equal(nodes, cell)
+    icell = index2.query_bbox(0., 0., delr, delc)
+    assert np.array_equal(icell, [(nrow - 2) * ncol, (nrow - 2) * ncol + 1,
+                                  (nrow - 1) * ncol, (nrow - 1) * ncol + 1])
+
+    # a file of a grid with the same shape but another geometry is rebuilt
+    mg2 = StructuredGrid(delc=np.full(nrow, delc),
+                         delr=np.full(ncol, 2 * delr))
+    index3 = mg2.get_spatial_index(filename=fname)
+    assert index3.fingerprint != index.fingerprint
+    assert np.allclose(index3.xv, 2 * index.xv)
+    mg_dis._spatial_index = None
+    assert mg_dis.get_spatial_index(filename=fname).fingerprint == \
+        index.fingerprint
+
+    # unstructured grid with the cells of two layers that are not layered
+    vertices = [[iv, v[1], v[2]] for iv, v in enumerate(mg_disv._vertices)]
+    iverts = [list(tuple(c)[4:]) for c in mg_disv._cell2d] * 2
+    xc = np.tile(mg_disv._cell2d["xc"], 2)
+    yc = np.tile(mg_disv._cell2d["yc"], 2)
+    mg_usg = UnstructuredGrid(vertices, iverts, xc, yc,
+                              ncpl=2 * nrow * ncol, layered=False)
+    nodes = mg_usg.intersect(xl, yl, forgive=True)
+    assert np.array_equal(nodes, cell2d, equal_nan=True)
+    assert mg_usg.intersect(4001., 4001.) == mg_disv.intersect(4001., 4001.)
+
+    # the index is rebuilt if the geometry of the grid is replaced
+    index = mg_disv.get_spatial_index()
+    assert mg_disv.get_spatial_index() is index
+    mg_disv._vertices = [[iv, x + delr, y] for iv, x, y in mg_disv._vertices]
+    index2 = mg_disv.get_spatial_index()
+    assert index2 is not index
+    assert np.allclose(index2.xv, index.xv + delr)
+
+
 if __name__ == '__main__':
-    test_intersection()
\ No newline at end of file
+    test_intersection()
+    test_spatial_index()
\ No newline at end of file
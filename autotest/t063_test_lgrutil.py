@@ -80,6 +80,39 @@ def test_lgrutil():
     return
 
 
+def test_lgrutil_multiple_children():
+    from flopy.utils.lgrutil import get_exchange_recarrays
+    nlayp, nrowp, ncolp = 3, 6, 9
+    botmp = [-100, -200, -300]
+    # two child grids that share a parent cell face
+    idomain1 = np.ones((nlayp, nrowp, ncolp), dtype=np.int)
+    idomain1[0, 1:4, 1:4] = 0
+    idomain2 = np.ones((nlayp, nrowp, ncolp), dtype=np.int)
+    idomain2[0, 1:4, 4:7] = 0
+    lgrs = [Lgr(nlayp, nrowp, ncolp, 100., 100., 100., botmp, idomain,
+                ncpp=3, ncppl=[2, 0, 0]) for idomain in (idomain1, idomain2)]
+
+    exg1 = lgrs[0].get_exchange_recarray(angldegx=True, cdist=True)
+    assert exg1.dtype.names == ('cellidm1', 'cellidm2', 'ihc', 'cl1', 'cl2',
+                                'hwva', 'angldegx', 'cdist')
+    assert [list(r) for r in exg1.tolist()] == \
+        lgrs[0].get_exchange_data(angldegx=True, cdist=True)
+    assert np.all(exg1.ihc[exg1.angldegx == 0.] == 2)
+
+    # connections to the parent cells of the other child are removed
+    exgs = get_exchange_recarrays(lgrs, angldegx=True)
+    assert len(exgs) == 2
+    for exg, lgr in zip(exgs, lgrs):
+        parent = np.array(exg.cellidm1.tolist())
+        assert np.all(lgr.idomain[tuple(parent.T)] == 1)
+        assert np.all(idomain1[tuple(parent.T)] == 1)
+        assert np.all(idomain2[tuple(parent.T)] == 1)
+    # 2 layers of 9 child cells on the faces between the children
+    assert len(exg1) - len(exgs[0]) == 2 * 9
+    assert len(exgs[0]) == len(exgs[1])
+
+
 if __name__ == '__main__':
     test_lgrutil()
+    test_lgrutil_multiple_children()
 
@@ -213,6 +213,12 @@ def test_rect_grid_multipoint_in_one_cell():
     result = ix.intersect_point(MultiPoint([Point(1., 1.), Point(2., 2.)]))
     assert len(result) == 1
     assert result.cellids[0] == (1, 0)
+    # more than two points in the cell are combined in one multipoint
+    result = ix.intersect_point(
+        MultiPoint([Point(1., 1.), Point(2., 2.), Point(3., 3.)]))
+    assert len(result) == 1
+    assert result.cellids[0] == (1, 0)
+    assert len(result.ixshapes[0].geoms) == 3
     return result
 
 
@@ -407,6 +413,74 @@ def test_tri_grid_multipoint_in_multiple_cells(rtree=True):
     return result
 
 
+# %% test batched points
+
+
+def test_rect_grid_points():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    gr = get_rect_grid()
+    x = [1., 12., 10., 20., 25., 0.]
+    y = [1., 12., 10., 10., 25., 20.]
+    for method in ("structured", "vertex"):
+        ix = GridIntersect(gr, method=method)
+        i, j = ix.intersect_points(x, y)
+        assert np.array_equal(i, [1, 0, 0, 0, -1, 0])
+        assert np.array_equal(j, [0, 1, 0, 1, -1, 0])
+    return
+
+
+def test_tri_grid_points():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    gr = get_tri_grid()
+    ix = GridIntersect(gr)
+    x = np.array([1., 12., 10., 20., 25., 4.])
+    y = np.array([1., 12., 10., 10., 25., 4.])
+    cellids = ix.intersect_points(x, y)
+    for xp, yp, cellid in zip(x, y, cellids):
+        result = ix.intersect_point(Point(xp, yp))
+        if len(result) == 0:
+            assert cellid == -1
+        else:
+            assert cellid == result.cellids[0]
+    return
+
+
+# %% test batched shapes
+
+
+def test_tri_grid_intersect_shapes():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    gr = get_tri_grid()
+    ix = GridIntersect(gr)
+    polygons = [Polygon([(5., 5.), (15., 5.), (15., 15.), (5., 15.)]),
+                Polygon([(20., 20.), (30., 20.), (30., 30.), (20., 30.)]),
+                Polygon([(1., 1.), (4., 1.), (4., 4.), (1., 4.)])]
+    for processes in (None, 2):
+        result = ix.intersect_shapes(polygons, processes=processes)
+        for i, shp in enumerate(polygons):
+            r = ix.intersect_polygon(shp)
+            idx = result.shapeidx == i
+            assert np.array_equal(result.cellids[idx], r.cellids)
+            assert np.allclose(result.areas[idx], r.areas)
+
+    # the STR-tree is built once for the grid
+    ix2 = GridIntersect(gr)
+    assert ix2.strtree is ix.strtree
+    return
+
+
 # %% test linestring structured
 
 
@@ -1277,3 +1351,244 @@ def test_rasters():
         raise AssertionError
 
     del rio
+
+
+def test_raster_grid_statistics():
+    from flopy.utils import Raster
+    import os
+    import flopy as fp
+
+    ws = os.path.join("..", "examples", "data", "options")
+    raster_name = "dem.img"
+
+    try:
+        rio = Raster.load(os.path.join(ws, "dem", raster_name))
+    except:
+        return
+
+    ml = fp.modflow.Modflow.load("sagehen.nam", version="mfnwt",
+                                 model_ws=os.path.join(ws, 'sagehen'))
+    mg = ml.modelgrid
+    xoff = 214110
+    yoff = 4366620
+    mg.set_coord_info(xoff, yoff)
+    band = rio.bands[0]
+
+    # brute force assignment of the pixel centers to the model cells
+    i, j = GridIntersect(mg, method="structured").intersect_points(
+        rio.xcenters, rio.ycenters)
+    arr = rio.get_array(band, masked=False).ravel().astype(float)
+    valid = (i >= 0) & ~np.isnan(arr)
+    for v in rio.nodatavals:
+        valid &= arr != v
+
+    weights = rio.get_grid_weights(mg)
+    assert weights.shape == (mg.nrow * mg.ncol, arr.size)
+    assert rio.get_grid_weights(mg) is weights
+
+    for method in ("mean", "median", "min", "max", "mode"):
+        stats = rio.resample_to_modelgrid(mg, [band], method=method)[band]
+        assert stats.shape == (mg.nrow, mg.ncol)
+        for (ii, jj) in [(10, 10), (40, 30), (50, 50), (70, 60)]:
+            vals = arr[valid & (i == ii) & (j == jj)]
+            if vals.size == 0:
+                assert stats[ii, jj] == rio.nodatavals[0]
+                continue
+            if method == "mean":
+                expected = vals.mean()
+            elif method == "median":
+                expected = np.median(vals)
+            elif method == "min":
+                expected = vals.min()
+            elif method == "max":
+                expected = vals.max()
+            else:
+                u, c = np.unique(vals, return_counts=True)
+                expected = u[np.argmax(c)]
+            assert np.isclose(stats[ii, jj], expected)
+
+    # vertex grid with the cells of the structured grid
+    xe, ye = mg.xyedges
+    xv, yv = np.meshgrid(xe, ye)
+    vertices = [[iv, x, y] for iv, (x, y) in
+                enumerate(zip(xv.ravel(), yv.ravel()))]
+    cell2d = []
+    for ii in range(mg.nrow):
+        for jj in range(mg.ncol):
+            iv = ii * (mg.ncol + 1) + jj
+            cell2d.append([ii * mg.ncol + jj, 0., 0., 4, iv, iv + 1,
+                           iv + mg.ncol + 2, iv + mg.ncol + 1])
+    vg = fgrid.VertexGrid(vertices, cell2d, xoff=xoff, yoff=yoff)
+    stats = rio.resample_to_modelgrid(mg, band, method="max")
+    vstats = rio.resample_to_modelgrid(vg, band, method="max")
+    assert vstats.shape == (mg.nrow * mg.ncol,)
+    assert np.allclose(vstats, stats.ravel())
+
+    # the weights are computed again if the grid is moved
+    mg.set_coord_info(xoff + 100., yoff)
+    assert rio.get_grid_weights(mg) is not weights
+
+
+def test_raster_grid_weights_area():
+    from flopy.utils import Raster
+    try:
+        import affine
+        from shapely.geometry import Polygon, box
+    except ImportError:
+        return
+
+    # rotated grid with cells that are smaller than the pixels
+    nrow, ncol = 30, 40
+    arr = np.random.RandomState(0).rand(1, nrow, ncol)
+    rio = Raster(arr, (1,), 26910,
+                 affine.Affine(10., 0., 1000., 0., -10., 2000.), -999.)
+    mg = fgrid.StructuredGrid(delc=np.full(20, 4.), delr=np.full(25, 6.),
+                              xoff=1030., yoff=1720., angrot=23.)
+    weights = rio.get_grid_weights(mg)
+    x0, x1, y0, y1 = rio.bounds
+    pixels = [box(x0 + j * 10., y1 - (i + 1) * 10., x0 + (j + 1) * 10.,
+                  y1 - i * 10.) for i in range(nrow) for j in range(ncol)]
+    xv, yv = mg.xvertices, mg.yvertices
+    mean = rio.resample_to_modelgrid(mg, 1, method="mean")
+    assert not np.any(mean == -999.)
+    for (i, j) in [(0, 0), (0, 17), (10, 10), (19, 24)]:
+        cell = Polygon([(xv[i, j], yv[i, j]), (xv[i, j + 1], yv[i, j + 1]),
+                        (xv[i + 1, j + 1], yv[i + 1, j + 1]),
+                        (xv[i + 1, j], yv[i + 1, j])])
+        expected = np.array([cell.intersection(p).area / 100.
+                             for p in pixels])
+        w = weights.getrow(i * mg.ncol + j).toarray().ravel()
+        assert np.allclose(w, expected)
+        assert np.isclose(mean[i, j],
+                          np.sum(expected * arr.ravel()) / expected.sum())
+
+    # statistics weighted by the area of the pixels in a cell
+    arr = np.array([[[1., 2., 3., 3.]]])
+    rio = Raster(arr, (1,), 26910, affine.Affine(1., 0., 0., 0., -1., 1.),
+                 -999.)
+    mg = fgrid.StructuredGrid(delc=np.array([1.]), delr=np.array([1.5, 2.]),
+                              xoff=0.5)
+    expected = {"mean": [(0.5 * 1. + 2.) / 1.5, 3.], "median": [2., 3.],
+                "min": [1., 3.], "max": [2., 3.], "mode": [2., 3.]}
+    for method, values in expected.items():
+        data = rio.resample_to_modelgrid(mg, 1, method=method)
+        assert np.allclose(data, [values]), method
+    arr[0, 0, 3] = 1.
+    rio = Raster(arr, (1,), 26910, affine.Affine(1., 0., 0., 0., -1., 1.),
+                 -999.)
+    data = rio.resample_to_modelgrid(mg, 1, method="median")
+    assert np.allclose(data, [[2., 2.]])
+    data = rio.resample_to_modelgrid(mg, 1, method="mode")
+    assert np.allclose(data, [[2., 1.]])
+
+
+def test_raster_window():
+    from flopy.utils import Raster
+    import os
+    import flopy as fp
+
+    ws = os.path.join("..", "examples", "data", "options")
+    fname = os.path.join(ws, "dem", "dem.img")
+
+    try:
+        rio = Raster.load(fname)
+    except:
+        return
+
+    ml = fp.modflow.Modflow.load("sagehen.nam", version="mfnwt",
+                                 model_ws=os.path.join(ws, 'sagehen'))
+    mg = ml.modelgrid
+    mg.set_coord_info(214110, 4366620)
+
+    # only the raster cells that cover a part of the grid are read
+    x0, x1, y0, y1 = mg.extent
+    extent = (x0 + 2000., x0 + 4000., y0 + 2000., y0 + 5000.)
+    rwin = Raster.load(fname, extent=extent)
+    arr = rwin.get_array(1, masked=False)
+    xmin, xmax, ymin, ymax = rwin.bounds
+    assert xmin <= extent[0] and xmax >= extent[1]
+    assert ymin <= extent[2] and ymax >= extent[3]
+    assert arr.size < rio.get_array(1).size
+    # raster cells with centers inside the bounds of the window
+    row0, row1, col0, col1 = rio._get_window(rwin.bounds, margin=-0.5)
+    assert np.array_equal(
+        arr, rio.get_array(1, masked=False)[row0:row1, col0:col1])
+
+    # a window with the extent of the model grid gives the same statistics
+    rwin = Raster.load(fname, extent=mg)
+    for method in ("mean", "max"):
+        assert np.allclose(rwin.resample_to_modelgrid(mg, 1, method),
+                           rio.resample_to_modelgrid(mg, 1, method))
+
+    # processing in small tiles gives the same results
+    shape = [(x0 + 1000, y0 + 1000), (x0 + 3000, y1 - 900),
+             (x1 - 1200, y0 + 2500.3)]
+    data = rio.sample_polygon(shape, band=1)
+    rio.TILESIZE = 5000
+    assert np.array_equal(rio.sample_polygon(shape, band=1), data)
+    wts = rio.get_grid_weights(mg)
+    mg.set_coord_info(214110, 4366620)
+    assert (rio.get_grid_weights(mg) != wts).nnz == 0
+
+    # interpolation to a grid that is smaller than the raster only uses a
+    # window of the raster and gives the results of the whole raster
+    try:
+        from scipy.interpolate import griddata, RegularGridInterpolator
+    except ImportError:
+        return
+    x0, x1, y0, y1 = rio.bounds
+    sg = fgrid.StructuredGrid(delc=np.full(30, 100.), delr=np.full(30, 100.),
+                              xoff=x0 + 2200., yoff=y0 + 1500., angrot=17.)
+    xc, yc = sg.xcellcenters, sg.ycellcenters
+    arr = rio.get_array(1, masked=False).astype(float)
+    for v in rio.nodatavals:
+        arr[arr == v] = np.nan
+    x, y = rio.xcenters[0], rio.ycenters[:, 0]
+    points = np.column_stack((yc.ravel(), xc.ravel()))
+    expected = RegularGridInterpolator((y[::-1], x), arr[::-1])(points)
+    data = rio.resample_to_grid(xc, yc, 1, method="linear")
+    assert np.allclose(data.ravel(), expected)
+    expected = griddata((rio.xcenters.ravel(), rio.ycenters.ravel()),
+                        arr.ravel(), (xc.ravel(), yc.ravel()),
+                        method="nearest")
+    data = rio.resample_to_grid(xc, yc, 1, method="nearest")
+    assert np.array_equal(data.ravel(), expected)
+
+
+def test_raster_polygon_mask():
+    from flopy.utils import Raster
+    try:
+        import affine
+        from shapely.geometry import MultiPolygon, Point
+    except ImportError:
+        return
+
+    nrow, ncol = 60, 80
+    arr = np.arange(nrow * ncol, dtype=float).reshape(1, nrow, ncol)
+    rio = Raster(arr, (1,), 26910, affine.Affine(1., 0., 0., 0., -1., nrow),
+                 -999.)
+
+    # polygon with a hole and a second polygon, as a multipolygon
+    outer = [(3.3, 4.1), (50.7, 8.2), (41.2, 55.9), (6.1, 50.3)]
+    hole = [(15.1, 15.3), (30.7, 17.2), (20.4, 35.8)]
+    other = [(60.2, 10.6), (77.9, 12.1), (70.3, 40.4)]
+    mpoly = MultiPolygon([(outer, [hole]), (other, [])])
+
+    mask = rio._intersection(mpoly, False)
+    expected = np.array([[mpoly.contains(Point(x, y)) for x in
+                          rio.xcenters[0]] for y in rio.ycenters[:, 0]])
+    assert mask.shape == (nrow, ncol)
+    assert mask.sum() > 0
+    assert np.array_equal(mask, expected)
+    assert np.array_equal(rio._intersection(mpoly, True), ~expected)
+
+    # GeoJSON-like dict and a single polygon with a hole
+    geojson = {"geometry": {"type": "Polygon",
+                            "coordinates": [outer, hole]}}
+    mask = rio._intersection(geojson, False)
+    poly = mpoly.geoms[0]
+    expected = np.array([[poly.contains(Point(x, y)) for x in
+                          rio.xcenters[0]] for y in rio.ycenters[:, 0]])
+    assert np.array_equal(mask, expected)
+    data = rio.sample_polygon(poly, band=1)
+    assert np.array_equal(np.sort(data), arr[0][expected])
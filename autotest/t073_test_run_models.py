@@ -0,0 +1,401 @@
+# Test running batches of models with flopy.run_models(), running models
+# with asyncio and collecting run telemetry using a fake model executable
+# written in python
+
+import asyncio
+import os
+import sys
+import shutil
+import numpy as np
+import flopy
+
+run_models_ws = os.path.join(".", "temp", "t073")
+fake_exe = os.path.join(run_models_ws, "fakemf.py")
+
+# MODFLOW-2005 style listing of a time step
+fake_listing = """
+    {outer:6d} CALLS TO PCG ROUTINE FOR TIME STEP {kstp:3d} IN STRESS PERIOD {kper:4d}
+    {inner:6d} TOTAL ITERATIONS
+
+ MAXIMUM HEAD CHANGE FOR EACH ITERATION (1 INDICATES THE FIRST INNER ITERATION):
+
+    HEAD CHANGE    HEAD CHANGE
+   LAYER,ROW,COL  LAYER,ROW,COL
+ ------------------------------
+  1   1.000      0 {change:10.4G}
+   (  1,  2,  3)  (  1,  2,  3)
+
+ MAXIMUM RESIDUAL FOR EACH ITERATION (1 INDICATES THE FIRST INNER ITERATION):
+
+    RESIDUAL       RESIDUAL
+   LAYER,ROW,COL  LAYER,ROW,COL
+ ------------------------------
+  1   100.0      0   10.00
+   (  1,  2,  3)  (  1,  2,  3)
+
+ OUTPUT CONTROL FOR STRESS PERIOD {kper:4d}   TIME STEP {kstp:4d}
+
+  VOLUMETRIC BUDGET FOR ENTIRE MODEL AT END OF TIME STEP {kstp:4d}, STRESS PERIOD {kper:3d}
+ PERCENT DISCREPANCY =   0.00     PERCENT DISCREPANCY = {discrepancy:8.2f}
+"""
+
+fake_source = "#!" + sys.executable + """
+import os
+import sys
+import time
+nam = sys.argv[1]
+sleep = 0.
+with open(nam) as f:
+    for line in f:
+        t = line.split()
+        if t and t[0] == 'SLEEP':
+            sleep = float(t[1])
+lst = open(os.path.splitext(nam)[0] + '.lst', 'w')
+for kper in range(2):
+    for kstp in range(3):
+        print(' Solving:  Stress period: {:5d}    Time step: {:5d}'.format(
+            kper + 1, kstp + 1))
+        print(' {} total iterations'.format(kstp + 4))
+        sys.stdout.flush()
+        time.sleep(sleep / 6.)
+        lst.write(listing.format(kper=kper + 1, kstp=kstp + 1,
+                                 outer=kstp + 2, inner=kstp + 4,
+                                 change=10. ** -(kstp + 3),
+                                 discrepancy=0.01 * kper))
+        lst.flush()
+lst.write('Normal termination of simulation\\n')
+lst.close()
+print('running ' + nam)
+print('Normal termination of simulation')
+"""
+fake_source = fake_source.replace(
+    "lst = open", "listing = " + repr(fake_listing) + "\nlst = open"
+)
+
+
+def setup_workspaces(sleep=(0, 0, 0)):
+    if os.path.isdir(run_models_ws):
+        shutil.rmtree(run_models_ws)
+    os.makedirs(run_models_ws)
+    with open(fake_exe, "w") as f:
+        f.write(fake_source)
+    os.chmod(fake_exe, 0o755)
+    workspaces = []
+    for i, s in enumerate(sleep):
+        ws = os.path.join(run_models_ws, "model{}".format(i))
+        os.makedirs(ws)
+        with open(os.path.join(ws, "model.nam"), "w") as f:
+            f.write("LIST 2 model.lst\nSLEEP {}\n".format(s))
+        workspaces.append(ws)
+    return workspaces
+
+
+def test_run_models():
+    if sys.platform == "win32":
+        return
+    workspaces = setup_workspaces()
+    for processes in (None, 2):
+        results = flopy.run_models(
+            workspaces,
+            exe_name=os.path.abspath(fake_exe),
+            namefile="model.nam",
+            processes=processes,
+            ntail=5,
+        )
+        assert [r.index for r in results] == [0, 1, 2]
+        for r, ws in zip(results, workspaces):
+            assert r.success and r.returncode == 0 and not r.timed_out
+            assert r.model_ws == ws
+            assert r.stdout[-1] == "Normal termination of simulation"
+            assert len(r.listing) == 5
+            assert os.path.isfile(os.path.join(ws, "model.lst"))
+    return
+
+
+def test_run_models_timeout():
+    if sys.platform == "win32":
+        return
+    workspaces = setup_workspaces(sleep=(0, 30))
+    results = flopy.run_models(
+        workspaces,
+        exe_name=os.path.abspath(fake_exe),
+        namefile="model.nam",
+        processes=2,
+        timeout=2,
+    )
+    assert results[0].success and not results[0].timed_out
+    assert results[1].timed_out and not results[1].success
+    assert results[1].runtime < 30
+    assert results[1].listing == []
+    return
+
+
+def test_kill_process():
+    # a process that has finished when the timer fires has not timed out
+    import subprocess
+    import threading
+    from flopy.mbase import _kill_process
+
+    if sys.platform == "win32":
+        return
+    argv = [sys.executable, "-c", "import time; time.sleep(30)"]
+    proc = subprocess.Popen(argv, start_new_session=True)
+    killed = threading.Event()
+    _kill_process(proc, killed)
+    assert proc.wait() != 0
+    assert killed.is_set()
+
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    killed = threading.Event()
+    _kill_process(proc, killed)
+    assert proc.returncode == 0
+    assert not killed.is_set()
+    return
+
+
+def test_run_models_staging():
+    if sys.platform == "win32":
+        return
+    workspaces = setup_workspaces()
+    shared = os.path.join(run_models_ws, "shared.dat")
+    with open(shared, "w") as f:
+        f.write("shared input\n")
+    run_dir = os.path.join(run_models_ws, "runs")
+    for link in (False, True):
+        results = flopy.run_models(
+            workspaces,
+            exe_name=os.path.abspath(fake_exe),
+            namefile="model.nam",
+            processes=2,
+            run_dir=run_dir,
+            shared_files=[shared],
+            link=link,
+        )
+        for r in results:
+            assert r.success
+            assert r.model_ws == os.path.join(
+                run_dir, "run_{}".format(r.index)
+            )
+            assert os.path.isfile(os.path.join(r.model_ws, "model.lst"))
+            staged = os.path.join(r.model_ws, "shared.dat")
+            assert os.path.samefile(staged, shared) == link
+    # the model workspaces are not changed
+    for ws in workspaces:
+        assert not os.path.isfile(os.path.join(ws, "model.lst"))
+
+    # output of an earlier run in the workspace is not linked to the runs
+    shutil.rmtree(run_dir)
+    ws = workspaces[0]
+    flopy.run_models(
+        [ws], exe_name=os.path.abspath(fake_exe), namefile="model.nam"
+    )
+    base_lst = os.path.join(ws, "model.lst")
+    mtime = os.path.getmtime(base_lst)
+    results = flopy.run_models(
+        [ws] * 3,
+        exe_name=os.path.abspath(fake_exe),
+        namefile="model.nam",
+        processes=3,
+        run_dir=run_dir,
+        link=True,
+    )
+    for r in results:
+        assert r.success
+        assert not os.path.samefile(
+            os.path.join(r.model_ws, "model.lst"), base_lst
+        )
+    assert os.path.getmtime(base_lst) == mtime
+
+    # input files of model objects are linked, output files are copied
+    m = flopy.modflow.Modflow(
+        "model",
+        exe_name=os.path.abspath(fake_exe),
+        model_ws=os.path.join(run_models_ws, "mf2005"),
+    )
+    flopy.modflow.ModflowDis(m)
+    flopy.modflow.ModflowBas(m)
+    m.write_input()
+    base_lst = os.path.join(m.model_ws, "model.lst")
+    with open(base_lst, "w") as f:
+        f.write("base listing\n")
+    results = flopy.run_models(
+        [m] * 2, processes=2, run_dir=run_dir, link=True
+    )
+    for r in results:
+        assert r.success
+        for fname in ("model.nam", "model.dis", "model.bas"):
+            assert os.path.samefile(
+                os.path.join(r.model_ws, fname),
+                os.path.join(m.model_ws, fname),
+            )
+        assert not os.path.samefile(
+            os.path.join(r.model_ws, "model.lst"), base_lst
+        )
+    with open(base_lst) as f:
+        assert f.read() == "base listing\n"
+
+    # the runs cannot be staged into the workspace
+    try:
+        flopy.run_models(
+            [ws],
+            exe_name=os.path.abspath(fake_exe),
+            namefile="model.nam",
+            run_dir=os.path.join(ws, "runs"),
+        )
+        assert False, "run_models should fail on a run_dir in model_ws"
+    except ValueError as e:
+        assert "model workspace" in str(e)
+    assert not os.path.isdir(os.path.join(ws, "runs"))
+
+    # missing executable
+    try:
+        flopy.run_models(workspaces, exe_name="not_an_executable")
+        assert False, "run_models should fail on a missing executable"
+    except Exception as e:
+        assert "does not exist" in str(e)
+    return
+
+
+def test_run_model_async():
+    if sys.platform == "win32":
+        return
+    workspaces = setup_workspaces(sleep=(0.5, 0.5, 0.5))
+    exe = os.path.abspath(fake_exe)
+
+    async def run(ws):
+        events = []
+        async with flopy.mbase.run_model_events(exe, "model.nam", ws) as it:
+            async for event in it:
+                events.append(event)
+        return events
+
+    async def run_all():
+        return await asyncio.gather(*[run(ws) for ws in workspaces])
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        runs = loop.run_until_complete(run_all())
+        for events in runs:
+            timesteps = [
+                (e.kper, e.kstp) for e in events if e.kind == "timestep"
+            ]
+            assert timesteps == [
+                (kper, kstp) for kper in range(2) for kstp in range(3)
+            ]
+            iterations = [
+                e.iterations for e in events if e.kind == "iterations"
+            ]
+            assert iterations == [4, 5, 6] * 2
+            assert events[-1].kind == "finished"
+            assert events[-1].success and events[-1].returncode == 0
+            assert events[-2].line == "Normal termination of simulation"
+
+        # stop a run after the first time step
+        async def stop(ws):
+            events = flopy.mbase.run_model_events(exe, "model.nam", ws)
+            async with events as it:
+                async for event in it:
+                    if event.kind == "timestep":
+                        break
+            return it._proc.returncode
+
+        returncode = loop.run_until_complete(stop(workspaces[0]))
+        assert returncode is not None and returncode != 0
+
+        # coroutine version of run_model with a callback
+        kinds = []
+        success, buff = loop.run_until_complete(
+            flopy.run_model_async(
+                exe,
+                "model.nam",
+                workspaces[1],
+                report=True,
+                callback=lambda e: kinds.append(e.kind),
+            )
+        )
+        assert success
+        assert buff[-1] == "Normal termination of simulation"
+        assert len(kinds) == len(buff) + 1 and kinds[-1] == "finished"
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+    return
+
+
+def test_run_telemetry():
+    if sys.platform == "win32":
+        return
+    workspaces = setup_workspaces(sleep=(1.2,))
+    ws = workspaces[0]
+    records = []
+    telemetry = flopy.utils.RunTelemetry(
+        ws, "model.nam", callback=records.append
+    )
+    assert telemetry.listing_files == [os.path.join(ws, "model.lst")]
+    success, buff = flopy.run_model(
+        os.path.abspath(fake_exe),
+        "model.nam",
+        ws,
+        silent=True,
+        callback=telemetry,
+    )
+    assert success and telemetry.success
+
+    summary = telemetry.get_summary()
+    assert len(summary) == 6
+    assert [(r.kper, r.kstp) for r in records] == [
+        (kper, kstp) for kper in range(2) for kstp in range(3)
+    ]
+    assert np.all(summary.kper == np.repeat([0, 1], 3))
+    assert np.all(summary.kstp == np.tile([0, 1, 2], 2))
+    assert np.all(summary.outer == np.tile([2, 3, 4], 2))
+    assert np.all(summary.inner == np.tile([4, 5, 6], 2))
+    assert np.allclose(summary.max_change, np.tile([1e-3, 1e-4, 1e-5], 2))
+    assert np.allclose(summary.discrepancy, np.repeat([0.0, 0.01], 3))
+    assert np.all(summary.walltime > 0.15)
+    assert np.all(summary.walltime < 1.0)
+    # the listing has been parsed while the model was running
+    for record in records[:-1]:
+        assert record.outer > 0
+
+    # summarize the listing file of a finished run
+    summary2 = flopy.utils.RunTelemetry(ws, "model.nam").get_summary()
+    assert np.all(np.isnan(summary2.walltime))
+    for name in ("kper", "kstp", "outer", "inner", "max_change"):
+        assert np.allclose(summary2[name], summary[name])
+    return
+
+
+def test_run_telemetry_listings():
+    # maximum head change tables of MODFLOW-2005 PCG with alternating lines
+    # of values and cells, and of MODFLOW-96 PCG2 with values and cells on
+    # the same line
+    fpth = os.path.join("..", "examples", "data", "mp6", "EXAMPLE.LST")
+    summary = flopy.utils.RunTelemetry(listing_files=[fpth]).get_summary()
+    assert len(summary) == 12
+    assert not np.any(np.isnan(summary.max_change))
+    assert summary.outer[0] == 5 and summary.inner[0] == 72
+    assert np.isclose(summary.max_change[0], 0.7684e-04)
+    assert np.isclose(summary.max_change[1], 0.6210e-04)
+    assert np.isclose(summary.max_change[-1], -0.6365e-04)
+    assert np.isclose(summary.discrepancy[0], 0.0)
+
+    fpth = os.path.join(
+        "..", "examples", "data", "mt3d_test", "mf96mt3d", "P10", "p10.lst"
+    )
+    summary = flopy.utils.RunTelemetry(listing_files=[fpth]).get_summary()
+    assert len(summary) == 1
+    assert np.isclose(summary.max_change[0], 0.1210e-05)
+    return
+
+
+if __name__ == "__main__":
+    test_run_models()
+    test_run_models_timeout()
+    test_kill_process()
+    test_run_models_staging()
+    test_run_model_async()
+    test_run_telemetry()
+    test_run_telemetry_listings()
@@ -0,0 +1,171 @@
+# Test creating the workspaces of ensemble members with
+# flopy.create_ensemble() for MODFLOW-2005 and MODFLOW 6 models
+
+import os
+import shutil
+import numpy as np
+import flopy
+
+ensemble_ws = os.path.join(".", "temp", "t074")
+
+
+def get_hk(index):
+    return 1.0 + 0.5 * index
+
+
+def test_ensemble_mf2005():
+    ws = os.path.join(ensemble_ws, "mf2005")
+    if os.path.isdir(ws):
+        shutil.rmtree(ws)
+    base_ws = os.path.join(ws, "base")
+    m = flopy.modflow.Modflow("model", model_ws=base_ws, external_path="ref")
+    flopy.modflow.ModflowDis(
+        m, nlay=2, nrow=10, ncol=10, top=10.0, botm=[0.0, -10.0]
+    )
+    flopy.modflow.ModflowBas(m, strt=10.0)
+    flopy.modflow.ModflowLpf(m, hk=1.0)
+    flopy.modflow.ModflowPcg(m)
+    flopy.modflow.ModflowOc(m)
+    m.write_input()
+    base_files = sorted(os.listdir(os.path.join(base_ws, "ref")))
+    # output of a run of the base model is not staged
+    with open(os.path.join(base_ws, "model.list"), "w") as f:
+        f.write("base listing\n")
+
+    def update(model, index):
+        model.lpf.hk = get_hk(index) * np.ones((2, 10, 10))
+
+    members = [os.path.join(ws, "member{}".format(i)) for i in range(3)]
+    for link in ("hard", "copy"):
+        result = flopy.create_ensemble(
+            m, members, update, packages=["LPF"], link=link
+        )
+        assert result == members
+        assert m.model_ws == base_ws
+
+        for index, member in enumerate(members):
+            assert not os.path.exists(os.path.join(member, "model.list"))
+            assert sorted(os.listdir(os.path.join(member, "ref"))) == (
+                base_files
+            )
+            fpth = os.path.join(member, "model.dis")
+            linked = os.path.samefile(fpth, os.path.join(base_ws, "model.dis"))
+            assert linked == (link == "hard")
+            assert not os.path.samefile(
+                os.path.join(member, "model.lpf"),
+                os.path.join(base_ws, "model.lpf"),
+            )
+            m2 = flopy.modflow.Modflow.load(
+                "model.nam", model_ws=member, check=False
+            )
+            assert np.allclose(m2.lpf.hk.array, get_hk(index))
+            assert np.allclose(m2.dis.botm.array[1], -10.0)
+
+    # the base model has not been changed by the linked members
+    m2 = flopy.modflow.Modflow.load("model.nam", model_ws=base_ws, check=False)
+    assert np.allclose(m2.lpf.hk.array, 1.0)
+
+    try:
+        flopy.create_ensemble(m, [base_ws])
+        assert False, "create_ensemble should not write to the base model"
+    except ValueError:
+        pass
+    return
+
+
+def test_ensemble_mf6():
+    ws = os.path.join(ensemble_ws, "mf6")
+    if os.path.isdir(ws):
+        shutil.rmtree(ws)
+    base_ws = os.path.join(ws, "base")
+    sim = flopy.mf6.MFSimulation(sim_ws=base_ws, verbosity_level=0)
+    flopy.mf6.ModflowTdis(sim)
+    flopy.mf6.ModflowIms(sim)
+    gwf = flopy.mf6.ModflowGwf(sim, modelname="model")
+    flopy.mf6.ModflowGwfdis(gwf, nlay=1, nrow=10, ncol=10)
+    flopy.mf6.ModflowGwfic(gwf, strt=1.0)
+    flopy.mf6.ModflowGwfnpf(gwf, k=1.0)
+    flopy.mf6.ModflowGwfchd(
+        gwf, stress_period_data=[[(0, 0, 0), 1.0], [(0, 9, 9), 0.0]]
+    )
+    flopy.mf6.ModflowGwfoc(
+        gwf, head_filerecord="model.hds", saverecord=[("HEAD", "ALL")],
+    )
+    sim.write_simulation()
+
+    def update(sim, index):
+        sim.get_model("model").npf.k = get_hk(index)
+
+    members = [os.path.join(ws, "member{}".format(i)) for i in range(3)]
+    for link in ("hard", "symbolic"):
+        flopy.create_ensemble(
+            sim, members, update, packages=["npf"], link=link
+        )
+        sim_ws = sim.simulation_data.mfpath.get_sim_path()
+        assert os.path.abspath(sim_ws) == os.path.abspath(base_ws)
+        for index, member in enumerate(members):
+            assert sorted(os.listdir(member)) == sorted(os.listdir(base_ws))
+            fpth = os.path.join(member, "model.dis")
+            assert os.path.samefile(fpth, os.path.join(base_ws, "model.dis"))
+            assert os.path.islink(fpth) == (link == "symbolic")
+            assert not os.path.samefile(
+                os.path.join(member, "model.npf"),
+                os.path.join(base_ws, "model.npf"),
+            )
+            sim2 = flopy.mf6.MFSimulation.load(
+                sim_ws=member, verbosity_level=0
+            )
+            k = sim2.get_model("model").npf.k.array
+            assert np.allclose(k, get_hk(index))
+
+    sim2 = flopy.mf6.MFSimulation.load(sim_ws=base_ws, verbosity_level=0)
+    assert np.allclose(sim2.get_model("model").npf.k.array, 1.0)
+    return
+
+
+def test_ensemble_mf6_external():
+    ws = os.path.join(ensemble_ws, "mf6_external")
+    if os.path.isdir(ws):
+        shutil.rmtree(ws)
+    base_ws = os.path.join(ws, "base")
+    sim = flopy.mf6.MFSimulation(sim_ws=base_ws, verbosity_level=0)
+    flopy.mf6.ModflowTdis(sim)
+    flopy.mf6.ModflowIms(sim)
+    gwf = flopy.mf6.ModflowGwf(sim, modelname="model")
+    flopy.mf6.ModflowGwfdis(gwf, nlay=1, nrow=10, ncol=10, botm=-10.0)
+    flopy.mf6.ModflowGwfic(gwf, strt=1.0)
+    flopy.mf6.ModflowGwfnpf(gwf, k=1.0)
+    sim.set_all_data_external()
+    sim.write_simulation()
+    base_k = os.path.join(base_ws, "model.npf_k.txt")
+    with open(base_k) as f:
+        base_k_text = f.read()
+
+    # the external arrays of the base model are read by update
+    sim = flopy.mf6.MFSimulation.load(sim_ws=base_ws, verbosity_level=0)
+
+    def update(sim, index):
+        gwf = sim.get_model("model")
+        thickness = gwf.dis.top.array - gwf.dis.botm.array[0]
+        gwf.npf.k = gwf.npf.k.array * 0.0 + thickness * get_hk(index)
+
+    members = [os.path.join(ws, "member{}".format(i)) for i in range(3)]
+    flopy.create_ensemble(sim, members, update, packages=["npf"])
+    for index, member in enumerate(members):
+        for fname in ("model.dis", "model.dis_botm.txt"):
+            assert os.path.samefile(
+                os.path.join(member, fname), os.path.join(base_ws, fname)
+            )
+        sim2 = flopy.mf6.MFSimulation.load(sim_ws=member, verbosity_level=0)
+        k = sim2.get_model("model").npf.k.array
+        assert np.allclose(k, 11.0 * get_hk(index))
+
+    with open(base_k) as f:
+        assert f.read() == base_k_text
+    return
+
+
+if __name__ == "__main__":
+    test_ensemble_mf2005()
+    test_ensemble_mf6()
+    test_ensemble_mf6_external()
@@ -946,6 +946,92 @@ def test_replace_ims_package():
         raise AssertionError()
 
 
+def test_output_reader_cache():
+    import shutil
+    import time
+    from flopy.mf6.utils.binaryfile_utils import MFOutputArray
+
+    test_ex_name = 'test003_gwftri_disv'
+    pth = os.path.join('..', 'examples', 'data', 'mf6', test_ex_name)
+    run_folder = os.path.join(cpth, 'output_cache')
+    if os.path.isdir(run_folder):
+        shutil.rmtree(run_folder)
+    shutil.copytree(pth, run_folder)
+
+    sim = MFSimulation.load(sim_ws=run_folder,
+                            verbosity_level=VerbosityLevel.quiet)
+    mfdata = sim.simulation_data.mfdata
+    cache = mfdata._output_cache
+    key = ('gwf_1', 'HDS', 'HEAD')
+    head = mfdata[key]
+    assert isinstance(head, MFOutputArray)
+    assert len(cache) == 2
+    reader = cache.get_reader(os.path.join(run_folder, 'tri_model.hds'),
+                              'HDS')
+
+    hds = bf.HeadFile(os.path.join(run_folder, 'tri_model.hds'))
+    valid = hds.get_alldata()
+    hds.close()
+    assert head.shape == valid.shape
+    assert np.array_equal(head[0], valid[0])
+    assert np.array_equal(head[-1:, 0], valid[-1:, 0])
+    assert np.array_equal(head, valid)
+    assert np.max(np.abs(valid - head)) == 0.
+    assert head.max() == valid.max()
+
+    # readers are reused until the output file changes
+    fjf = mfdata[('gwf_1', 'CBC', 'FLOW-JA-FACE')]
+    assert fjf.shape[0] == 1
+    assert mfdata[key]._get_reader() is reader
+    time.sleep(0.01)
+    os.utime(reader.filename)
+    assert mfdata[key]._get_reader() is not reader
+    assert reader.file.closed
+
+    # assigned values are kept in the proxy
+    head = mfdata[key]
+    head[head > 1e29] = np.nan
+    head[0, 0, 0, 0] = 1.
+    assert head[0, 0, 0, 0] == 1.
+    assert np.asarray(head)[0, 0, 0, 0] == 1.
+    assert isinstance(np.asarray(head), np.ndarray)
+    assert np.all(np.isnan(head[valid > 1e29]))
+    active = valid < 1e29
+    active[0, 0, 0, 0] = False
+    assert np.array_equal(head[active], valid[active])
+
+    # the records are read again when the output file is rewritten
+    fname = os.path.join(run_folder, 'tri_model.hds')
+    dt = np.dtype([('kstp', '<i4'), ('kper', '<i4'), ('pertim', '<f8'),
+                   ('totim', '<f8'), ('text', 'S16'), ('ncol', '<i4'),
+                   ('nrow', '<i4'), ('ilay', '<i4'), ('data', '<f8', 200)])
+    recs = np.fromfile(fname, dtype=dt)
+    recs2 = recs.copy()
+    recs2['kper'] += 1
+    recs2['totim'] += 1.
+    recs2['data'] += 1.
+    np.concatenate((recs, recs2)).tofile(fname)
+    assert len(head) == 2
+    assert head.shape == (2,) + valid.shape[1:]
+    assert np.array_equal(head[0], valid[0])
+    assert np.array_equal(head[1], valid[0] + 1.)
+    assert np.array_equal(np.asarray(head)[1], valid[0] + 1.)
+
+    sim.simulation_data.mfdata._output_cache.clear()
+    assert len(cache) == 0
+
+    # the readers are closed before a run
+    mfdata[key][0]
+    assert len(cache) > 0
+    sim.exe_name = 'not_an_executable'
+    try:
+        sim.run_simulation()
+    except Exception:
+        pass
+    assert len(cache) == 0
+    return
+
+
 if __name__ == '__main__':
     test001a_tharmonic()
     test001e_uzf_3lay()
@@ -959,3 +1045,4 @@ if __name__ == '__main__':
     test045_lake2tr()
     test_cbc_precision()
     test_replace_ims_package()
+    test_output_reader_cache()
@@ -35,4 +35,10 @@ from . import pest
 from . import mf6
 from . import discretization
 
-from .mbase import run_model, which
+from .mbase import (
+    create_ensemble,
+    run_model,
+    run_model_async,
+    run_models,
+    which,
+)
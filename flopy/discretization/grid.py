@@ -2,6 +2,7 @@ import numpy as np
 import copy, os
 import warnings
 from ..utils import geometry
+from .spatialindex import GridSpatialIndex
 
 
 class CachedData(object):
@@ -173,6 +174,7 @@ class Grid(object):
         self._angrot = angrot
         self._cache_dict = {}
         self._copy_cache = True
+        self._spatial_index = None
 
     ###################################
     # access to basic grid properties
@@ -395,6 +397,101 @@ class Grid(object):
 
         return x, y
 
+    def get_spatial_index(self, filename=None):
+        """
+        Get the spatial index of the grid cells. The index is in local
+        (model) coordinates, it is built on first use and kept by the grid,
+        so that changes of the coordinate information do not require a
+        rebuild.
+
+        Parameters
+        ----------
+        filename : str
+            optional path of a .npz file to persist the index. If the file
+            exists and holds an index of a grid of the same type and cell
+            geometry, the index is loaded from the file, otherwise the index
+            is built and saved to the file.
+
+        Returns
+        -------
+        GridSpatialIndex
+
+        """
+        if self._spatial_index is not None:
+            # the index is rebuilt if the grid geometry has been replaced
+            geometry, index = self._spatial_index
+            if all(
+                a is b
+                for a, b in zip(geometry, self._get_spatial_index_geometry())
+            ):
+                return index
+            self._spatial_index = None
+
+        geometry = self._get_spatial_index_geometry()
+        xrings, yrings = self._get_local_vertex_rings()
+        index = None
+        if filename is not None and os.path.isfile(filename):
+            index = GridSpatialIndex.load(filename)
+            if (
+                index.grid_type != str(self.grid_type)
+                or index.ncell != self._get_spatial_index_ncell()
+                or index.fingerprint
+                != GridSpatialIndex.get_fingerprint(xrings, yrings)
+            ):
+                index = None
+        if index is None:
+            index = GridSpatialIndex.from_rings(
+                xrings, yrings, grid_type=self.grid_type
+            )
+            if filename is not None:
+                index.save(filename)
+        self._spatial_index = (geometry, index)
+        return index
+
+    def _get_spatial_index_ncell(self):
+        raise NotImplementedError(
+            "must define _get_spatial_index_ncell in child class"
+        )
+
+    def _get_spatial_index_geometry(self):
+        """
+        Get the objects that define the cell geometry of the grid, the
+        spatial index of the grid is rebuilt if any of them is replaced
+        """
+        raise NotImplementedError(
+            "must define _get_spatial_index_geometry in child class"
+        )
+
+    def _get_local_vertex_rings(self):
+        """
+        Get the x and y vertices of each cell in local coordinates
+        """
+        raise NotImplementedError(
+            "must define _get_local_vertex_rings in child class"
+        )
+
+    def _intersect_spatial_index(self, x, y, local=False, forgive=False):
+        """
+        Get the cell ids of points with the spatial index of the grid, for
+        the intersect methods of the child classes
+        """
+        scalar = np.isscalar(x) and np.isscalar(y)
+        if not local:
+            x, y = self.get_local_coords(x, y)
+        nodes = self.get_spatial_index().query_points(x, y)
+        outside = nodes < 0
+        if np.any(outside):
+            if not forgive:
+                raise Exception(
+                    "x, y point given is outside of the model area"
+                )
+            nodes = np.where(outside, np.nan, nodes)
+        if scalar:
+            if outside[0]:
+                return np.nan
+            return int(nodes[0])
+        return nodes
+
     def intersect(self, x, y, local=False, forgive=False):
         if not local:
             return self.get_local_coords(x, y)
@@ -0,0 +1,401 @@
+import os
+import hashlib
+import numpy as np
+
+
+class GridSpatialIndex(object):
+    """
+    Spatial index of the cells of a model grid in local (model) coordinates.
+
+    The index holds the vertex rings of all cells in padded arrays and
+    assigns the cells to a regular grid of bins using their bounding boxes.
+    It is built once per grid by Grid.get_spatial_index() and is shared by
+    the methods that need to locate points or shapes on the grid.
+
+    Parameters
+    ----------
+    xv : numpy.ndarray
+        (ncell, nvmax) array with the x-coordinates of the closed vertex
+        ring of each cell, rings with less than nvmax vertices are padded
+        with their first vertex
+    yv : numpy.ndarray
+        (ncell, nvmax) array with the y-coordinates of the closed vertex
+        ring of each cell
+    nvert : numpy.ndarray
+        number of vertices of the closed ring of each cell
+    grid_type : str
+        grid type of the grid the index belongs to
+
+    Attributes
+    ----------
+    bounds : numpy.ndarray
+        (ncell, 4) array with the xmin, ymin, xmax, ymax of each cell
+    fingerprint : str
+        hash of the vertex rings, identifies the grid geometry of the index
+
+    """
+
+    def __init__(self, xv, yv, nvert, grid_type=None):
+        self.xv = np.asarray(xv, dtype=float)
+        self.yv = np.asarray(yv, dtype=float)
+        self.nvert = np.asarray(nvert, dtype=int)
+        self.grid_type = grid_type
+        self.fingerprint = self._get_fingerprint(self.xv, self.yv, self.nvert)
+        self.bounds = np.column_stack(
+            (
+                self.xv.min(axis=1),
+                self.yv.min(axis=1),
+                self.xv.max(axis=1),
+                self.yv.max(axis=1),
+            )
+        )
+        self._build_bins()
+
+    @property
+    def ncell(self):
+        return self.xv.shape[0]
+
+    @property
+    def extent(self):
+        """
+        Extent of the indexed cells (xmin, xmax, ymin, ymax) in local
+        coordinates
+        """
+        return (
+            self.bounds[:, 0].min(),
+            self.bounds[:, 2].max(),
+            self.bounds[:, 1].min(),
+            self.bounds[:, 3].max(),
+        )
+
+    @classmethod
+    def from_rings(cls, xrings, yrings, grid_type=None):
+        """
+        Create a spatial index from the vertex rings of the cells.
+
+        Parameters
+        ----------
+        xrings : list or numpy.ndarray
+            list with the x-coordinates of the vertices of each cell, or a
+            (ncell, nvert) array of open rings if all cells have the same
+            number of vertices
+        yrings : list or numpy.ndarray
+            y-coordinates of the vertices of each cell
+        grid_type : str
+            grid type of the grid the index belongs to
+
+        Returns
+        -------
+        GridSpatialIndex
+
+        """
+        xv, yv, nvert = cls._pad_rings(xrings, yrings)
+        return cls(xv, yv, nvert, grid_type=grid_type)
+
+    @classmethod
+    def get_fingerprint(cls, xrings, yrings):
+        """
+        Get the fingerprint of the vertex rings of the cells, that is
+        compared with the fingerprint of an index to check that the index
+        belongs to the grid geometry.
+
+        Parameters
+        ----------
+        xrings : list or numpy.ndarray
+            x-coordinates of the vertices of each cell, see from_rings()
+        yrings : list or numpy.ndarray
+            y-coordinates of the vertices of each cell
+
+        Returns
+        -------
+        str
+
+        """
+        return cls._get_fingerprint(*cls._pad_rings(xrings, yrings))
+
+    @staticmethod
+    def _get_fingerprint(xv, yv, nvert):
+        sha = hashlib.sha1()
+        for a, dtype in (
+            (nvert, np.int64),
+            (xv, np.float64),
+            (yv, np.float64),
+        ):
+            sha.update(np.ascontiguousarray(a, dtype=dtype).tobytes())
+        return sha.hexdigest()
+
+    @staticmethod
+    def _pad_rings(xrings, yrings):
+        """
+        Get the closed vertex rings of the cells as padded arrays
+        """
+        if isinstance(xrings, np.ndarray) and xrings.ndim == 2:
+            # cells with the same number of vertices
+            xv = np.column_stack((xrings, xrings[:, 0]))
+            yv = np.column_stack((yrings, yrings[:, 0]))
+            nvert = np.full(xv.shape[0], xv.shape[1], dtype=int)
+            return xv, yv, nvert
+
+        ncell = len(xrings)
+        nvert = np.zeros(ncell, dtype=int)
+        for icell in range(ncell):
+            xr, yr = xrings[icell], yrings[icell]
+            n = len(xr)
+            # close rings if the first and last vertex differ
+            if xr[0] != xr[-1] or yr[0] != yr[-1]:
+                n += 1
+            nvert[icell] = n
+        nvmax = nvert.max() if ncell > 0 else 0
+        xv = np.empty((ncell, nvmax), dtype=float)
+        yv = np.empty((ncell, nvmax), dtype=float)
+        for icell in range(ncell):
+            xr, yr = xrings[icell], yrings[icell]
+            n = len(xr)
+            xv[icell, :n] = xr
+            yv[icell, :n] = yr
+            # close the ring and pad with the first vertex
+            xv[icell, n:] = xr[0]
+            yv[icell, n:] = yr[0]
+        return xv, yv, nvert
+
+    def _build_bins(self):
+        """
+        Assign the cells to the bins overlapped by their bounding boxes,
+        the cells in each bin are sorted by cell id
+        """
+        ncell = self.ncell
+        xmin, ymin, xmax, ymax = self.bounds.T
+        x0, y0 = xmin.min(), ymin.min()
+        nb = max(int(np.ceil(np.sqrt(ncell))), 1)
+        dx = max(xmax.max() - x0, np.finfo(float).tiny) / nb
+        dy = max(ymax.max() - y0, np.finfo(float).tiny) / nb
+        ix0, iy0 = self._get_bin(xmin, ymin, x0, y0, dx, dy, nb)
+        ix1, iy1 = self._get_bin(xmax, ymax, x0, y0, dx, dy, nb)
+        nbx = ix1 - ix0 + 1
+        count = nbx * (iy1 - iy0 + 1)
+        icell = np.repeat(np.arange(ncell), count)
+        local = np.arange(count.sum()) - np.repeat(
+            np.cumsum(count) - count, count
+        )
+        ibin = (iy0[icell] + local // nbx[icell]) * nb + (
+            ix0[icell] + local % nbx[icell]
+        )
+        order = np.lexsort((icell, ibin))
+        self._bins = (x0, y0, dx, dy, nb)
+        self._binstart = np.searchsorted(ibin[order], np.arange(nb * nb + 1))
+        self._bincells = icell[order]
+
+    @staticmethod
+    def _get_bin(x, y, x0, y0, dx, dy, nb):
+        ix = np.clip(((x - x0) / dx).astype(int), 0, nb - 1)
+        iy = np.clip(((y - y0) / dy).astype(int), 0, nb - 1)
+        return ix, iy
+
+    def _get_candidates(self, ibin, ipt):
+        """
+        Get the (point, cell) pairs of the cells in the bins of a set of
+        points, sorted by point and cell id
+        """
+        binstart = self._binstart
+        count = binstart[ibin + 1] - binstart[ibin]
+        ipair = np.repeat(ipt, count)
+        local = np.arange(count.sum()) - np.repeat(
+            np.cumsum(count) - count, count
+        )
+        icell = self._bincells[np.repeat(binstart[ibin], count) + local]
+        return ipair, icell
+
+    def contains(self, icell, x, y):
+        """
+        Vectorized point in polygon test for pairs of cells and points.
+        Points on the edge of a cell are inside the cell.
+
+        Parameters
+        ----------
+        icell : numpy.ndarray
+            cell ids
+        x : numpy.ndarray
+            x-coordinates of the points in local coordinates
+        y : numpy.ndarray
+            y-coordinates of the points in local coordinates
+
+        Returns
+        -------
+        numpy.ndarray
+            boolean array, True if the point is in the cell
+
+        """
+        xv, yv = self.xv, self.yv
+        inside = np.zeros(icell.shape[0], dtype=bool)
+        onedge = np.zeros(icell.shape[0], dtype=bool)
+        # crossing number test, with a separate test for points on edges
+        for iv in range(xv.shape[1] - 1):
+            xa, ya = xv[icell, iv], yv[icell, iv]
+            xb, yb = xv[icell, iv + 1], yv[icell, iv + 1]
+            cross = (xb - xa) * (y - ya) - (yb - ya) * (x - xa)
+            tol = 1e-12 * (np.abs(xb - xa) + np.abs(yb - ya)) ** 2
+            onedge |= (
+                (np.abs(cross) <= tol)
+                & (x >= np.minimum(xa, xb))
+                & (x <= np.maximum(xa, xb))
+                & (y >= np.minimum(ya, yb))
+                & (y <= np.maximum(ya, yb))
+            )
+            crosses = (ya > y) != (yb > y)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                xcross = xa + (y - ya) * (xb - xa) / (yb - ya)
+            inside ^= crosses & (x < xcross)
+        return inside | onedge
+
+    def query_points(self, x, y, chunksize=100000):
+        """
+        Find the cells that contain an array of points. Points on the
+        boundary between cells are assigned to the cell with the lowest
+        cell id.
+
+        Parameters
+        ----------
+        x : array_like
+            x-coordinates of the points in local coordinates
+        y : array_like
+            y-coordinates of the points in local coordinates
+        chunksize : int
+            number of points tested at once, limits the memory use
+
+        Returns
+        -------
+        numpy.ndarray
+            cell id of each point, -1 for points outside of the grid
+
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.shape != y.shape:
+            raise ValueError("x and y must have the same number of points")
+        x0, y0, dx, dy, nb = self._bins
+
+        nodes = np.full(x.shape[0], -1, dtype=int)
+        for i0 in range(0, x.shape[0], chunksize):
+            px = x[i0 : i0 + chunksize]
+            py = y[i0 : i0 + chunksize]
+            bx = np.floor((px - x0) / dx)
+            by = np.floor((py - y0) / dy)
+            # points on the upper extent are in the last bin
+            bx[bx == nb] = nb - 1
+            by[by == nb] = nb - 1
+            inbin = (bx >= 0) & (bx < nb) & (by >= 0) & (by < nb)
+            ipt = np.nonzero(inbin)[0]
+            ibin = (by[ipt] * nb + bx[ipt]).astype(int)
+
+            ipair, icell = self._get_candidates(ibin, ipt)
+            hit = self.contains(icell, px[ipair], py[ipair])
+
+            # lowest cell id of each point
+            ihit = np.nonzero(hit)[0]
+            pts, ifirst = np.unique(ipair[ihit], return_index=True)
+            nodes[i0 + pts] = icell[ihit[ifirst]]
+        return nodes
+
+    def query_bbox(self, xmin, ymin, xmax, ymax):
+        """
+        Find the cells with a bounding box that overlaps a bounding box.
+
+        Parameters
+        ----------
+        xmin, ymin, xmax, ymax : float
+            bounding box in local coordinates
+
+        Returns
+        -------
+        numpy.ndarray
+            sorted cell ids of the cells that overlap the bounding box
+
+        """
+        x0, y0, dx, dy, nb = self._bins
+        ix0, iy0 = self._get_bin(
+            np.atleast_1d(xmin), np.atleast_1d(ymin), x0, y0, dx, dy, nb
+        )
+        ix1, iy1 = self._get_bin(
+            np.atleast_1d(xmax), np.atleast_1d(ymax), x0, y0, dx, dy, nb
+        )
+        ix, iy = np.meshgrid(
+            np.arange(ix0[0], ix1[0] + 1), np.arange(iy0[0], iy1[0] + 1)
+        )
+        ibin = (iy * nb + ix).ravel()
+        _, icell = self._get_candidates(ibin, np.zeros(ibin.shape, int))
+        icell = np.unique(icell)
+        b = self.bounds[icell]
+        overlap = (
+            (b[:, 0] <= xmax)
+            & (b[:, 2] >= xmin)
+            & (b[:, 1] <= ymax)
+            & (b[:, 3] >= ymin)
+        )
+        return icell[overlap]
+
+    def save(self, filename):
+        """
+        Save the spatial index to a numpy .npz file.
+
+        Parameters
+        ----------
+        filename : str
+            path of the file
+
+        """
+        x0, y0, dx, dy, nb = self._bins
+        with open(filename, "wb") as f:
+            np.savez(
+                f,
+                xv=self.xv,
+                yv=self.yv,
+                nvert=self.nvert,
+                grid_type=np.array(str(self.grid_type)),
+                fingerprint=np.array(self.fingerprint),
+                bins=np.array([x0, y0, dx, dy, nb], dtype=float),
+                binstart=self._binstart,
+                bincells=self._bincells,
+            )
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Load a spatial index that was saved with GridSpatialIndex.save().
+
+        Parameters
+        ----------
+        filename : str
+            path of the file
+
+        Returns
+        -------
+        GridSpatialIndex
+
+        """
+        if not os.path.isfile(filename):
+            raise FileNotFoundError(
+                "spatial index file {} not found".format(filename)
+            )
+        with np.load(filename) as d:
+            index = cls.__new__(cls)
+            index.xv = d["xv"]
+            index.yv = d["yv"]
+            index.nvert = d["nvert"]
+            index.grid_type = str(d["grid_type"])
+            # files saved without a fingerprint never match a grid
+            index.fingerprint = None
+            if "fingerprint" in d:
+                index.fingerprint = str(d["fingerprint"])
+            index.bounds = np.column_stack(
+                (
+                    index.xv.min(axis=1),
+                    index.yv.min(axis=1),
+                    index.xv.max(axis=1),
+                    index.yv.max(axis=1),
+                )
+            )
+            x0, y0, dx, dy, nb = d["bins"]
+            index._bins = (x0, y0, dx, dy, int(nb))
+            index._binstart = d["binstart"]
+            index._bincells = d["bincells"]
+        return index
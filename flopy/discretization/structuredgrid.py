@@ -755,6 +755,26 @@ class StructuredGrid(Grid):
             row = col = np.nan
         return row, col
 
+    def _get_spatial_index_ncell(self):
+        return self.__nrow * self.__ncol
+
+    def _get_spatial_index_geometry(self):
+        return (self.__delr, self.__delc)
+
+    def _get_local_vertex_rings(self):
+        """
+        Get the x and y vertices of the cells in local coordinates as
+        (nrow * ncol, 4) arrays
+        """
+        self._copy_cache = False
+        xe, ye = self.xyedges
+        self._copy_cache = True
+        x0, y0 = [a.ravel() for a in np.meshgrid(xe[:-1], ye[:-1])]
+        x1, y1 = [a.ravel() for a in np.meshgrid(xe[1:], ye[1:])]
+        xrings = np.column_stack((x0, x1, x1, x0))
+        yrings = np.column_stack((y0, y0, y1, y1))
+        return xrings, yrings
+
     def _cell_vert_list(self, i, j):
         """Get vertices for a single cell or sequence of i, j locations."""
         self._copy_cache = False
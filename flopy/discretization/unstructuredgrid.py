@@ -211,8 +211,33 @@ class UnstructuredGrid(Grid):
             return self._cache_dict[cache_index].data_nocopy
 
     def intersect(self, x, y, local=False, forgive=False):
-        x, y = super(UnstructuredGrid, self).intersect(x, y, local, forgive)
-        raise Exception("Not implemented yet")
+        """
+        Get the cell number of a point with coordinates x and y
+
+        The cell number is the index of the cell in iverts, which is the
+        node number for grids that are not layered. When the point is in
+        more than one cell, for example in cells of different layers, or on
+        the edge of two cells, the lowest cell number is returned.
+
+        Parameters
+        ----------
+        x : float or array_like
+            The x-coordinate of the requested point(s)
+        y : float or array_like
+            The y-coordinate of the requested point(s)
+        local: bool (optional)
+            If True, x and y are in local coordinates (defaults to False)
+        forgive: bool (optional)
+            Forgive x,y arguments that fall outside the model grid and
+            return NaNs instead (defaults to False - will throw exception)
+
+        Returns
+        -------
+        cell : int or numpy.ndarray
+            The cell number(s)
+
+        """
+        return self._intersect_spatial_index(x, y, local, forgive)
 
     def get_cell_vertices(self, cellid):
         """
@@ -226,6 +251,24 @@ class UnstructuredGrid(Grid):
         self._copy_cache = True
         return cell_vert
 
+    def _get_spatial_index_ncell(self):
+        return len(self._iverts)
+
+    def _get_spatial_index_geometry(self):
+        return (self._vertices, self._iverts)
+
+    def _get_local_vertex_rings(self):
+        """
+        Get the x and y vertices of each cell in local coordinates
+        """
+        vertexdict = {ix: list(v[-2:]) for ix, v in enumerate(self._vertices)}
+        xrings = []
+        yrings = []
+        for iverts in self._iverts:
+            xrings.append([vertexdict[ix][0] for ix in iverts])
+            yrings.append([vertexdict[ix][1] for ix in iverts])
+        return xrings, yrings
+
     def _build_grid_geometry_info(self):
         cache_index_cc = "cellcenters"
         cache_index_vert = "xyzgrid"
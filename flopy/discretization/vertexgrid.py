@@ -1,12 +1,6 @@
 import numpy as np
 
-try:
-    from matplotlib.path import Path
-except ImportError:
-    Path = None
-
 from .grid import Grid, CachedData
-from ..utils.geometry import is_clockwise
 
 
 class VertexGrid(Grid):
@@ -203,10 +197,10 @@ class VertexGrid(Grid):
 
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
+        x : float or array_like
+            The x-coordinate of the requested point(s)
+        y : float or array_like
+            The y-coordinate of the requested point(s)
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
@@ -215,43 +209,11 @@ class VertexGrid(Grid):
 
         Returns
         -------
-        icell2d : int
-            The CELL2D number
+        icell2d : int or numpy.ndarray
+            The CELL2D number(s)
 
         """
-        if Path is None:
-            s = (
-                "Could not import matplotlib.  Must install matplotlib "
-                + " in order to use VertexGrid.intersect() method"
-            )
-            raise ImportError(s)
-
-        if local:
-            # transform x and y to real-world coordinates
-            x, y = super(VertexGrid, self).get_coords(x, y)
-        xv, yv, zv = self.xyzvertices
-        for icell2d in range(self.ncpl):
-            xa = np.array(xv[icell2d])
-            ya = np.array(yv[icell2d])
-            # x and y at least have to be within the bounding box of the cell
-            if (
-                np.any(x <= xa)
-                and np.any(x >= xa)
-                and np.any(y <= ya)
-                and np.any(y >= ya)
-            ):
-                path = Path(np.stack((xa, ya)).transpose())
-                # use a small radius, so that the edge of the cell is included
-                if is_clockwise(xa, ya):
-                    radius = -1e-9
-                else:
-                    radius = 1e-9
-                if path.contains_point((x, y), radius=radius):
-                    return icell2d
-        if forgive:
-            icell2d = np.nan
-            return icell2d
-        raise Exception("x, y point given is outside of the model area")
+        return self._intersect_spatial_index(x, y, local, forgive)
 
     def get_cell_vertices(self, cellid):
         """
@@ -284,6 +246,30 @@ class VertexGrid(Grid):
         mm = PlotMapView(modelgrid=self)
         return mm.plot_grid(**kwargs)
 
+    def _get_spatial_index_ncell(self):
+        return self.ncpl
+
+    def _get_spatial_index_geometry(self):
+        return (self._vertices, self._cell2d)
+
+    def _get_local_vertex_rings(self):
+        """
+        Get the x and y vertices of each cell in local coordinates
+        """
+        if self._cell2d is None:
+            raise Exception(
+                "a spatial index can only be built for grids with cell2d"
+            )
+        vertexdict = {v[0]: [v[1], v[2]] for v in self._vertices}
+        xrings = []
+        yrings = []
+        for cell2d in self._cell2d:
+            cell2d = tuple(cell2d)
+            iverts = [int(i) for i in cell2d[4:] if i is not None]
+            xrings.append([vertexdict[ix][0] for ix in iverts])
+            yrings.append([vertexdict[ix][1] for ix in iverts])
+        return xrings, yrings
+
     def _build_grid_geometry_info(self):
         cache_index_cc = "cellcenters"
         cache_index_vert = "xyzgrid"
@@ -1,8 +1,11 @@
 from __future__ import print_function
+import itertools
 import json
 import os
 import numpy as np
 from ..utils import (
+    MfList,
+    Transient2d,
     HeadFile,
     CellBudgetFile,
     UcnFile,
@@ -49,24 +52,19 @@ def ensemble_helper(
     if inputs_filename is not None:
         f_in = models[0].export(inputs_filename, **kwargs)
         vdict = {}
-        vdicts = [models[0].export(vdict, **kwargs)]
+        stats = {}
+        _update_ensemble_stats(stats, models[0].export(vdict, **kwargs))
         i = 1
         for m in models[1:]:
             suffix = m.name.split(".")[0].split("_")[-1]
             vdict = {}
             m.export(vdict, **kwargs)
-            vdicts.append(vdict)
+            _update_ensemble_stats(stats, vdict)
             if add_reals:
                 f_in.append(vdict, suffix=suffix)
             i += 1
-        mean, stdev = {}, {}
+        mean, stdev = _get_ensemble_mean_stdev(stats)
         for vname in vdict.keys():
-            alist = []
-            for vd in vdicts:
-                alist.append(vd[vname])
-            alist = np.array(alist)
-            mean[vname] = alist.mean(axis=0)
-            stdev[vname] = alist.std(axis=0)
             mean[vname][vdict[vname] == netcdf.FILLVALUE] = netcdf.FILLVALUE
             stdev[vname][vdict[vname] == netcdf.FILLVALUE] = netcdf.FILLVALUE
             mean[vname][np.isnan(vdict[vname])] = netcdf.FILLVALUE
@@ -91,33 +89,24 @@ def ensemble_helper(
             **kwargs
         )
         vdict = {}
-        vdicts = [
-            output_helper(
-                vdict,
-                models[0],
-                models[0].load_results(as_dict=True),
-                **kwargs
-            )
-        ]
+        stats = {}
+        output_helper(
+            vdict, models[0], models[0].load_results(as_dict=True), **kwargs
+        )
+        _update_ensemble_stats(stats, vdict)
         i = 1
         for m in models[1:]:
             suffix = m.name.split(".")[0].split("_")[-1]
             oudic = m.load_results(as_dict=True)
             vdict = {}
             output_helper(vdict, m, oudic, **kwargs)
-            vdicts.append(vdict)
+            _update_ensemble_stats(stats, vdict)
             if add_reals:
                 f_out.append(vdict, suffix=suffix)
             i += 1
 
-        mean, stdev = {}, {}
+        mean, stdev = _get_ensemble_mean_stdev(stats)
         for vname in vdict.keys():
-            alist = []
-            for vd in vdicts:
-                alist.append(vd[vname])
-            alist = np.array(alist)
-            mean[vname] = alist.mean(axis=0)
-            stdev[vname] = alist.std(axis=0)
             mean[vname][np.isnan(vdict[vname])] = netcdf.FILLVALUE
             stdev[vname][np.isnan(vdict[vname])] = netcdf.FILLVALUE
             mean[vname][vdict[vname] == netcdf.FILLVALUE] = netcdf.FILLVALUE
@@ -138,6 +127,295 @@ def ensemble_helper(
     return f_in, f_out
 
 
+def _update_ensemble_stats(stats, vdict):
+    """
+    Update the running (Welford) mean and sum of squared deviations of
+    ensemble members with the arrays of one member, so that ensemble
+    statistics can be calculated without keeping every member in memory.
+
+    Parameters
+    ----------
+    stats : dict
+        {variable name: [count, mean, m2]}, updated in place
+    vdict : dict
+        {variable name: array} of one ensemble member
+
+    """
+    for vname, array in vdict.items():
+        array = np.asarray(array, dtype=np.float64)
+        if vname not in stats:
+            stats[vname] = [1, array.copy(), np.zeros_like(array)]
+            continue
+        entry = stats[vname]
+        entry[0] += 1
+        delta = array - entry[1]
+        entry[1] += delta / entry[0]
+        entry[2] += delta * (array - entry[1])
+
+
+def _get_ensemble_mean_stdev(stats):
+    """
+    Get the ensemble mean and (population) standard deviation from the
+    running statistics of _update_ensemble_stats()
+
+    Returns
+    -------
+    mean, stdev : dict, dict
+
+    """
+    mean, stdev = {}, {}
+    for vname, (count, m, m2) in stats.items():
+        mean[vname] = m
+        stdev[vname] = np.sqrt(m2 / count)
+    return mean, stdev
+
+
+def _ensemble_member_vdict(args):
+    """
+    Export one ensemble member to a dictionary of arrays.  Used by
+    ensemble_export() and defined at module level so that it can be
+    dispatched to worker processes.
+
+    Parameters
+    ----------
+    args : tuple
+        (index, member, load_member, output, kwargs)
+
+    Returns
+    -------
+    tuple of (index, vdict)
+
+    """
+    index, member, load_member, output, kwargs = args
+    m = member
+    if load_member is not None:
+        m = load_member(member)
+    vdict = {}
+    if output:
+        output_helper(vdict, m, m.load_results(as_dict=True), **kwargs)
+    else:
+        m.export(vdict, **kwargs)
+    return index, vdict
+
+
+def ensemble_export(
+    f,
+    members,
+    load_member=None,
+    output=False,
+    realizations=None,
+    add_mean_stdev=True,
+    processes=None,
+    **kwargs
+):
+    """
+    Export an ensemble of model instances to a single netcdf file that
+    stores every member along a 'realization' dimension.  Members are
+    exported one at a time and written to their realization slice as they
+    are produced, so memory use does not grow with the size of the
+    ensemble.  Assumes all members have the same discretization and
+    reference information.
+
+    Parameters
+    ----------
+    f : str
+        netcdf file name
+    members : sequence
+        model instances, or the arguments that are passed to load_member
+        to create the model instance of each member
+    load_member : callable
+        function that returns the model instance of a member from an entry
+        in members (optional).  load_member must be picklable (a module
+        level function) if processes is greater than 1.
+    output : bool
+        export the model output (model.load_results()) instead of the
+        model input (default is False)
+    realizations : sequence of int
+        realization numbers of the members (default is 0 to
+        len(members) - 1)
+    add_mean_stdev : bool
+        add the ensemble mean and standard deviation of each variable with
+        "_mean" and "_stdev" suffixes (default is True)
+    processes : int
+        number of worker processes used to load and export members.  The
+        members are written to disjoint realization slices by the calling
+        process as they complete, since netcdf files do not support
+        concurrent writers. (default is None, members are processed
+        sequentially)
+    **kwargs : keyword arguments
+        passed to model.export() or output_helper()
+
+    Returns
+    -------
+    f : NetCdf instance
+
+    """
+    members = list(members)
+    if realizations is None:
+        realizations = list(range(len(members)))
+    if len(realizations) != len(members):
+        raise ValueError(
+            "ensemble_export: {0} realizations for {1} members".format(
+                len(realizations), len(members)
+            )
+        )
+    logger = kwargs.get("logger", None)
+
+    # the first member initializes the netcdf file
+    m0 = members[0]
+    if load_member is not None:
+        m0 = load_member(m0)
+    time_values = None
+    if output:
+        oudic = m0.load_results(as_dict=True)
+        zonebud = None
+        for key, value in oudic.items():
+            if isinstance(value, ZBNetOutput):
+                zonebud = oudic.pop(key)
+                break
+        time_values = _get_output_times(
+            oudic, zonebud, stride=kwargs.get("stride", 1), logger=logger
+        )
+    nc_kwargs = {}
+    if "modelgrid" in kwargs:
+        nc_kwargs["modelgrid"] = kwargs["modelgrid"]
+    f = NetCdf(f, m0, time_values=time_values, logger=logger, **nc_kwargs)
+    f.nc.createDimension("realization", None)
+    rvar = f.create_variable(
+        "realization",
+        {"long_name": "realization", "standard_name": "realization"},
+        precision_str="i4",
+        dimensions=("realization",),
+    )
+
+    # the first member is already loaded and is exported by this process
+    args = [
+        (ireal, member, load_member, output, kwargs)
+        for ireal, member in enumerate(members)
+    ]
+    args[0] = (0, m0, None, output, kwargs)
+    if processes is not None and processes > 1:
+        import multiprocessing as mp
+
+        pool = mp.Pool(processes)
+        vdicts = itertools.chain(
+            (_ensemble_member_vdict(arg) for arg in args[:1]),
+            pool.imap_unordered(_ensemble_member_vdict, args[1:]),
+        )
+    else:
+        pool = None
+        vdicts = (_ensemble_member_vdict(arg) for arg in args)
+
+    variables, stats = {}, {}
+    try:
+        for ireal, vdict in vdicts:
+            f.log("writing realization {0}".format(realizations[ireal]))
+            rvar[ireal] = realizations[ireal]
+            for vname, array in vdict.items():
+                array = np.array(array, dtype=np.float64)
+                array[array == netcdf.FILLVALUE] = np.NaN
+                if vname not in variables:
+                    variables[vname] = _create_ensemble_nc_variable(
+                        f, vname, array
+                    )
+                var, attribs = variables[vname]
+                if var is None:
+                    continue
+                if not np.all(np.isnan(array)):
+                    _update_min_max(
+                        attribs, np.nanmin(array), np.nanmax(array)
+                    )
+                if add_mean_stdev:
+                    _update_ensemble_stats(stats, {vname: array})
+                array[np.isnan(array)] = f.fillvalue
+                var[(ireal,) + tuple(slice(0, n) for n in array.shape)] = array
+            f.log("writing realization {0}".format(realizations[ireal]))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    for vname, (var, attribs) in variables.items():
+        if var is not None and "min" in attribs:
+            var.setncattr("min", attribs["min"])
+            var.setncattr("max", attribs["max"])
+
+    if add_mean_stdev:
+        mean, stdev = _get_ensemble_mean_stdev(stats)
+        for suffix, sdict in (("_mean", mean), ("_stdev", stdev)):
+            for vname, array in sdict.items():
+                var = f.nc.variables[f.normalize_name(vname)]
+                attribs = f.var_attr_dict[f.normalize_name(vname)].copy()
+                attribs["long_name"] += " " + suffix[1:]
+                attribs["coordinates"] = attribs["coordinates"].replace(
+                    "realization ", ""
+                )
+                attribs.pop("min", None)
+                attribs.pop("max", None)
+                if not np.all(np.isnan(array)):
+                    attribs["min"] = np.nanmin(array)
+                    attribs["max"] = np.nanmax(array)
+                svar = f.create_variable(
+                    vname + suffix,
+                    attribs,
+                    precision_str="f4",
+                    dimensions=var.dimensions[1:],
+                )
+                array[np.isnan(array)] = f.fillvalue
+                svar[tuple(slice(0, n) for n in array.shape)] = array
+
+    f.add_global_attributes({"namefile": ""})
+    return f
+
+
+def _create_ensemble_nc_variable(f, var_name, array):
+    """
+    Create a netcdf variable with a leading realization dimension for an
+    array exported to a dictionary.  The remaining dimensions are inferred
+    from the number of array dimensions.
+
+    Returns
+    -------
+    tuple of (netcdf variable, attribute dictionary).  The variable is None
+    if the array dimensions are not supported.
+
+    """
+    attribs = {}
+    dimensions = {
+        2: f.dimension_names[1:],
+        3: f.dimension_names,
+        4: ("time",) + f.dimension_names,
+    }.get(array.ndim)
+    if dimensions is None:
+        f.logger.warn(
+            "skipping {0}: unsupported array shape {1}".format(
+                var_name, array.shape
+            )
+        )
+        return None, attribs
+    if var_name in NC_LONG_NAMES:
+        attribs["long_name"] = NC_LONG_NAMES[var_name]
+    else:
+        attribs["long_name"] = var_name
+    coords = ["realization"]
+    if "time" in dimensions:
+        coords.append("time")
+    if "layer" in dimensions:
+        coords.append("layer")
+    attribs["coordinates"] = " ".join(coords + ["latitude", "longitude"])
+    if var_name in NC_UNITS_FORMAT:
+        attribs["units"] = NC_UNITS_FORMAT[var_name].format(
+            f.grid_units, f.time_units
+        )
+    var = f.create_variable(
+        var_name,
+        attribs,
+        precision_str="f4",
+        dimensions=("realization",) + tuple(dimensions),
+    )
+    return var, attribs
+
+
 def _add_output_nc_variable(
     f,
     times,
@@ -299,59 +577,27 @@ def _add_output_nc_zonebudget_variable(f, array, var_name, flux, logger=None):
     var[:] = array
 
 
-def output_helper(f, ml, oudic, **kwargs):
+def _get_output_times(oudic, zonebud=None, f=None, stride=1, logger=None):
     """
-    Export model outputs using the model spatial reference info.
+    Get the output times that are common to all output file instances
+    in oudic
 
     Parameters
     ----------
-    f : str
-        filename for output - must have .shp or .nc extension
-    ml : flopy.mbase.ModelInterface derived type
     oudic : dict
         output_filename,flopy datafile/cellbudgetfile instance
-    **kwargs : keyword arguments
-        modelgrid : flopy.discretizaiton.Grid
-            user supplied model grid instance that will be used for export
-            in lieu of the models model grid instance
-        mflay : int
-            zero based model layer which can be used in shapefile exporting
-        kper : int
-            zero based stress period which can be used for shapefile exporting
+    zonebud : ZBNetOutput instance
+        zonebudget output (optional)
+    f : NetCdf instance or other export target (optional)
+    stride : int
+        output time stride
+    logger : Logger instance (optional)
 
     Returns
     -------
-        None
-    Note:
-    ----
-        casts down double precision to single precision for netCDF files
+    times : list of output times
 
     """
-    assert isinstance(ml, (BaseModel, ModelInterface))
-    assert len(oudic.keys()) > 0
-    logger = kwargs.pop("logger", None)
-    stride = kwargs.pop("stride", 1)
-    forgive = kwargs.pop("forgive", False)
-    kwargs.pop("suffix", None)
-    mask_vals = []
-    mflay = kwargs.pop("mflay", None)
-    kper = kwargs.pop("kper", None)
-    if "masked_vals" in kwargs:
-        mask_vals = kwargs.pop("masked_vals")
-    if len(kwargs) > 0 and logger is not None:
-        str_args = ",".join(kwargs)
-        logger.warn("unused kwargs: " + str_args)
-
-    zonebud = None
-    zbkey = None
-    for key, value in oudic.items():
-        if isinstance(value, ZBNetOutput):
-            zbkey = key
-            break
-
-    if zbkey is not None:
-        zonebud = oudic.pop(zbkey)
-
     # ISSUE - need to round the totims in each output file instance so
     # that they will line up
     for key in oudic.keys():
@@ -407,6 +653,63 @@ def output_helper(f, ml, oudic, **kwargs):
                 + "{0}".format(skipped_times)
             )
     times = [t for t in common_times[::stride]]
+    return times
+
+
+def output_helper(f, ml, oudic, **kwargs):
+    """
+    Export model outputs using the model spatial reference info.
+
+    Parameters
+    ----------
+    f : str
+        filename for output - must have .shp or .nc extension
+    ml : flopy.mbase.ModelInterface derived type
+    oudic : dict
+        output_filename,flopy datafile/cellbudgetfile instance
+    **kwargs : keyword arguments
+        modelgrid : flopy.discretizaiton.Grid
+            user supplied model grid instance that will be used for export
+            in lieu of the models model grid instance
+        mflay : int
+            zero based model layer which can be used in shapefile exporting
+        kper : int
+            zero based stress period which can be used for shapefile exporting
+
+    Returns
+    -------
+        None
+    Note:
+    ----
+        casts down double precision to single precision for netCDF files
+
+    """
+    assert isinstance(ml, (BaseModel, ModelInterface))
+    assert len(oudic.keys()) > 0
+    logger = kwargs.pop("logger", None)
+    stride = kwargs.pop("stride", 1)
+    forgive = kwargs.pop("forgive", False)
+    kwargs.pop("suffix", None)
+    mask_vals = []
+    mflay = kwargs.pop("mflay", None)
+    kper = kwargs.pop("kper", None)
+    if "masked_vals" in kwargs:
+        mask_vals = kwargs.pop("masked_vals")
+    if len(kwargs) > 0 and logger is not None:
+        str_args = ",".join(kwargs)
+        logger.warn("unused kwargs: " + str_args)
+
+    zonebud = None
+    zbkey = None
+    for key, value in oudic.items():
+        if isinstance(value, ZBNetOutput):
+            zbkey = key
+            break
+
+    if zbkey is not None:
+        zonebud = oudic.pop(zbkey)
+
+    times = _get_output_times(oudic, zonebud, f, stride, logger)
     if isinstance(f, str) and f.lower().endswith(".nc"):
         f = NetCdf(
             f, ml, time_values=times, logger=logger, forgive=forgive, **kwargs
@@ -836,6 +1139,116 @@ def generic_array_export(
     return f
 
 
+def _transient_kper_itr(data, nper, get_arrays):
+    """
+    Generator that yields the stress period data of a transient data object
+    one stress period at a time.  Stress periods that reuse the data of the
+    previous stress period (MfList and Transient2d entries that are not
+    redefined) are detected and the previously processed data is yielded
+    instead of being recomputed.
+
+    Parameters
+    ----------
+    data : MfList, Transient2d or other transient data instance
+    nper : int
+        number of stress periods
+    get_arrays : callable
+        function that returns the data for a zero-based stress period
+
+    Returns
+    -------
+    generator of (kper, data, repeat) tuples, where repeat is True if the
+    data for kper is the same object yielded for the previous stress period
+
+    """
+    last_source, arrays = None, None
+    for kper in range(nper):
+        source = None
+        if isinstance(data, (MfList, Transient2d)):
+            source = data[kper]
+        if source is not None and source is last_source:
+            yield kper, arrays, True
+            continue
+        arrays = get_arrays(kper)
+        last_source = source
+        yield kper, arrays, False
+
+
+def _create_transient_nc_variable(f, var_name, precision_str, units=None):
+    """
+    Create a (time, layer, y, x) netcdf variable for transient data that is
+    written one stress period at a time.  The min and max attributes are set
+    by _set_transient_nc_min_max() once all stress periods are written.
+
+    Returns
+    -------
+    tuple of (netcdf variable, attribute dictionary)
+
+    """
+    if var_name in NC_UNITS_FORMAT:
+        units = NC_UNITS_FORMAT[var_name].format(f.grid_units, f.time_units)
+    if var_name in NC_LONG_NAMES:
+        attribs = {"long_name": NC_LONG_NAMES[var_name]}
+    else:
+        attribs = {"long_name": var_name}
+    attribs["coordinates"] = "time layer latitude longitude"
+    if units is not None:
+        attribs["units"] = units
+    try:
+        dim_tuple = ("time",) + f.dimension_names
+        var = f.create_variable(
+            var_name,
+            attribs,
+            precision_str=precision_str,
+            dimensions=dim_tuple,
+        )
+    except Exception as e:
+        estr = "error creating variable {0}:\n{1}".format(var_name, str(e))
+        f.logger.warn(estr)
+        raise Exception(estr)
+    return var, attribs
+
+
+def _write_transient_nc_slice(f, var, var_name, index, array):
+    """
+    Write the array for a single stress period to a netcdf variable.  Arrays
+    that only contain fill values are not written since the variable is
+    initialized with the fill value.
+    """
+    if np.all(array == f.fillvalue):
+        return
+    try:
+        var[index] = array
+    except Exception as e:
+        estr = "error setting array to variable {0}:\n{1}".format(
+            var_name, str(e)
+        )
+        f.logger.warn(estr)
+        raise Exception(estr)
+
+
+def _update_min_max(attribs, mn, mx):
+    """
+    Update the running min and max attributes of a transient variable
+    """
+    attribs["min"] = mn if "min" not in attribs else min(attribs["min"], mn)
+    attribs["max"] = mx if "max" not in attribs else max(attribs["max"], mx)
+
+
+def _set_transient_nc_min_max(f, var, var_name, attribs):
+    """
+    Set the min and max attributes of a netcdf variable written with
+    _write_transient_nc_slice()
+    """
+    mn = attribs.get("min", np.nan)
+    mx = attribs.get("max", np.nan)
+    if np.isnan(mn) or np.isnan(mx):
+        raise Exception("error processing {0}: all NaNs".format(var_name))
+    attribs["min"], attribs["max"] = mn, mx
+    var.setncattr("min", mn)
+    var.setncattr("max", mx)
+
+
 def mflist_export(f, mfl, **kwargs):
     """
     export helper for MfList instances
@@ -918,63 +1331,45 @@ def mflist_export(f, mfl, **kwargs):
 
     elif isinstance(f, NetCdf) or isinstance(f, dict):
         base_name = mfl.package.name[0].lower()
-        # f.log("getting 4D masked arrays for {0}".format(base_name))
-        # m4d = mfl.masked_4D_arrays
-        # f.log("getting 4D masked arrays for {0}".format(base_name))
+        nper = mfl.model.modeltime.nper
 
-        # for name, array in m4d.items():
-        for name, array in mfl.masked_4D_arrays_itr():
-            var_name = base_name + "_" + name
-            if isinstance(f, dict):
-                f[var_name] = array
+        # stress period arrays are built once per unique stress period and
+        # written to the netcdf variables one stress period at a time
+        variables = {}
+        for kper, arrays, repeat in _transient_kper_itr(
+            mfl, nper, lambda kper: mfl.to_array(kper=kper, mask=True)
+        ):
+            if arrays is None:
                 continue
-            f.log("processing {0} attribute".format(name))
-
-            units = None
-            if var_name in NC_UNITS_FORMAT:
-                units = NC_UNITS_FORMAT[var_name].format(
-                    f.grid_units, f.time_units
-                )
-            precision_str = NC_PRECISION_TYPE[mfl.dtype[name].type]
-            if var_name in NC_LONG_NAMES:
-                attribs = {"long_name": NC_LONG_NAMES[var_name]}
-            else:
-                attribs = {"long_name": var_name}
-            attribs["coordinates"] = "time layer latitude longitude"
-            attribs["min"] = np.nanmin(array)
-            attribs["max"] = np.nanmax(array)
-            if np.isnan(attribs["min"]) or np.isnan(attribs["max"]):
-                raise Exception(
-                    "error processing {0}: all NaNs".format(var_name)
-                )
+            for name, array in arrays.items():
+                var_name = base_name + "_" + name
+                if isinstance(f, dict):
+                    if var_name not in f:
+                        f[var_name] = np.zeros((nper,) + array.shape)
+                    f[var_name][kper] = array
+                    continue
 
-            if units is not None:
-                attribs["units"] = units
-            try:
-                dim_tuple = ("time",) + f.dimension_names
-                var = f.create_variable(
-                    var_name,
-                    attribs,
-                    precision_str=precision_str,
-                    dimensions=dim_tuple,
-                )
-            except Exception as e:
-                estr = "error creating variable {0}:\n{1}".format(
-                    var_name, str(e)
-                )
-                f.logger.warn(estr)
-                raise Exception(estr)
+                if var_name not in variables:
+                    f.log("processing {0} attribute".format(name))
+                    variables[var_name] = _create_transient_nc_variable(
+                        f, var_name, NC_PRECISION_TYPE[mfl.dtype[name].type]
+                    )
+                    f.log("processing {0} attribute".format(name))
+                var, attribs = variables[var_name]
+
+                if not repeat:
+                    array = np.array(array, dtype=float)
+                    if not np.all(np.isnan(array)):
+                        _update_min_max(
+                            attribs, np.nanmin(array), np.nanmax(array)
+                        )
+                    array[np.isnan(array)] = f.fillvalue
+                    arrays[name] = array
+                _write_transient_nc_slice(f, var, var_name, kper, array)
 
-            array[np.isnan(array)] = f.fillvalue
-            try:
-                var[:] = array
-            except Exception as e:
-                estr = "error setting array to variable {0}:\n{1}".format(
-                    var_name, str(e)
-                )
-                f.logger.warn(estr)
-                raise Exception(estr)
-            f.log("processing {0} attribute".format(name))
+        if isinstance(f, NetCdf):
+            for var_name, (var, attribs) in variables.items():
+                _set_transient_nc_min_max(f, var, var_name, attribs)
 
         return f
     else:
@@ -1036,74 +1431,71 @@ def transient2d_export(f, t2d, fmt=None, **kwargs):
             ibnd = np.abs(modelgrid.idomain).sum(axis=0)
             mask = ibnd == 0
 
-        # f.log("getting 4D array for {0}".format(t2d.name_base))
-        array = t2d.array
-        # f.log("getting 4D array for {0}".format(t2d.name_base))
-        with np.errstate(invalid="ignore"):
-            if array.dtype not in [int, np.int, np.int32, np.int64]:
-                if mask is not None:
-                    array[:, 0, mask] = np.NaN
-                array[array <= min_valid] = np.NaN
-                array[array >= max_valid] = np.NaN
-                mx, mn = np.nanmax(array), np.nanmin(array)
-            else:
-                mx, mn = np.nanmax(array), np.nanmin(array)
-                array[array <= min_valid] = netcdf.FILLVALUE
-                array[array >= max_valid] = netcdf.FILLVALUE
-                # if t2d.model.bas6 is not None:
-                #    array[:, 0, t2d.model.bas6.ibound.array[0] == 0] = \
-                #        f.fillvalue
-                # elif t2d.model.btn is not None:
-                #    array[:, 0, t2d.model.btn.icbund.array[0] == 0] = \
-                #        f.fillvalue
+        nper = t2d.model.modeltime.nper
+        if isinstance(t2d, Transient2d):
 
-        var_name = t2d.name.replace("_", "")
-        if isinstance(f, dict):
-            array[array == netcdf.FILLVALUE] = np.NaN
-            f[var_name] = array
-            return f
+            def get_array(kper):
+                return np.array(t2d[kper].array, dtype=t2d.dtype)
 
-        array[np.isnan(array)] = f.fillvalue
-        units = "unitless"
+        else:
+            # other transient 2d data types only provide the full array
+            m4d = t2d.array
 
-        if var_name in NC_UNITS_FORMAT:
-            units = NC_UNITS_FORMAT[var_name].format(
-                f.grid_units, f.time_units
+            def get_array(kper):
+                return np.array(m4d[kper, 0])
+
+        var_name = t2d.name.replace("_", "")
+        var, attribs = None, {}
+        if isinstance(f, NetCdf):
+            try:
+                precision_str = NC_PRECISION_TYPE[t2d.dtype]
+            except:
+                precision_str = NC_PRECISION_TYPE[t2d.dtype.type]
+            var, attribs = _create_transient_nc_variable(
+                f, var_name, precision_str, units="unitless"
             )
-        try:
-            precision_str = NC_PRECISION_TYPE[t2d.dtype]
-        except:
-            precision_str = NC_PRECISION_TYPE[t2d.dtype.type]
-        if var_name in NC_LONG_NAMES:
-            attribs = {"long_name": NC_LONG_NAMES[var_name]}
         else:
-            attribs = {"long_name": var_name}
-        attribs["coordinates"] = "time layer latitude longitude"
-        attribs["units"] = units
-        attribs["min"] = mn
-        attribs["max"] = mx
-        if np.isnan(attribs["min"]) or np.isnan(attribs["max"]):
-            raise Exception("error processing {0}: all NaNs".format(var_name))
-        try:
-            dim_tuple = ("time",) + f.dimension_names
-            var = f.create_variable(
-                var_name,
-                attribs,
-                precision_str=precision_str,
-                dimensions=dim_tuple,
-            )
-        except Exception as e:
-            estr = "error creating variable {0}:\n{1}".format(var_name, str(e))
-            f.logger.warn(estr)
-            raise Exception(estr)
-        try:
-            var[:, 0] = array
-        except Exception as e:
-            estr = "error setting array to variable {0}:\n{1}".format(
-                var_name, str(e)
-            )
-            f.logger.warn(estr)
-            raise Exception(estr)
+            f[var_name] = None
+
+        # each unique stress period is processed once, stress periods that
+        # reuse a previous array are written from the processed array
+        for kper, array, repeat in _transient_kper_itr(t2d, nper, get_array):
+            if not repeat:
+                with np.errstate(invalid="ignore"):
+                    if array.dtype not in [int, np.int, np.int32, np.int64]:
+                        if mask is not None:
+                            array[mask] = np.NaN
+                        array[array <= min_valid] = np.NaN
+                        array[array >= max_valid] = np.NaN
+                        valid = not np.all(np.isnan(array))
+                        if valid:
+                            mx, mn = np.nanmax(array), np.nanmin(array)
+                    else:
+                        valid = True
+                        mx, mn = np.nanmax(array), np.nanmin(array)
+                        array[array <= min_valid] = netcdf.FILLVALUE
+                        array[array >= max_valid] = netcdf.FILLVALUE
+                if valid:
+                    _update_min_max(attribs, mn, mx)
+
+                if isinstance(f, dict):
+                    if f[var_name] is None:
+                        f[var_name] = np.zeros(
+                            (nper, 1) + array.shape, dtype=array.dtype
+                        )
+                    if array.dtype.kind == "f":
+                        array[array == netcdf.FILLVALUE] = np.NaN
+                else:
+                    if array.dtype.kind == "f":
+                        array[np.isnan(array)] = f.fillvalue
+
+            if isinstance(f, dict):
+                f[var_name][kper, 0] = array
+            else:
+                _write_transient_nc_slice(f, var, var_name, (kper, 0), array)
+
+        if isinstance(f, NetCdf):
+            _set_transient_nc_min_max(f, var, var_name, attribs)
         return f
 
     elif fmt == "vtk":
@@ -7,13 +7,17 @@ mbase module
 
 from __future__ import print_function
 import abc
+import asyncio
+import re
 import sys
 import os
 import shutil
 import threading
+import time
 import warnings
 import queue as Queue
 
+from collections import OrderedDict, deque
 from datetime import datetime
 from shutil import which
 from subprocess import Popen, PIPE, STDOUT
@@ -1200,7 +1204,9 @@ class BaseModel(ModelInterface):
 
         return None
 
-    def change_model_ws(self, new_pth=None, reset_external=False):
+    def change_model_ws(
+        self, new_pth=None, reset_external=False, silent=False
+    ):
         """
         Change the model work space.
 
@@ -1210,6 +1216,9 @@ class BaseModel(ModelInterface):
             Location of new model workspace.  If this path does not exist,
             it will be created. (default is None, which will be assigned to
             the present working directory).
+        silent : bool
+            Do not report the change of the model workspace (default is
+            False).
 
         Returns
         -------
@@ -1225,7 +1234,8 @@ class BaseModel(ModelInterface):
                 line = "\ncreating model workspace...\n" + "   {}".format(
                     new_pth
                 )
-                print(line)
+                if not silent:
+                    print(line)
                 os.makedirs(new_pth)
             except:
                 line = "\n{} not valid, workspace-folder ".format(new_pth)
@@ -1239,7 +1249,8 @@ class BaseModel(ModelInterface):
         old_pth = self._model_ws
         self._model_ws = new_pth
         line = "\nchanging model workspace...\n   {}\n".format(new_pth)
-        sys.stdout.write(line)
+        if not silent:
+            sys.stdout.write(line)
         # reset the paths for each package
         for pp in self.packagelist:
             pp.fn_path = os.path.join(self.model_ws, pp.file_name[0])
@@ -1354,6 +1365,7 @@ class BaseModel(ModelInterface):
         pause=False,
         report=False,
         normal_msg="normal termination",
+        callback=None,
     ):
         """
         This method will run the model using subprocess.Popen.
@@ -1370,6 +1382,10 @@ class BaseModel(ModelInterface):
         normal_msg : str
             Normal termination message used to determine if the
             run terminated normally. (default is 'normal termination')
+        callback : function
+            function called with the RunEvent of each line of stdout and
+            of the end of the run, for example a
+            flopy.utils.RunTelemetry object (default is None)
 
         Returns
         -------
@@ -1387,6 +1403,50 @@ class BaseModel(ModelInterface):
             pause=pause,
             report=report,
             normal_msg=normal_msg,
+            callback=callback,
+        )
+
+    async def run_model_async(
+        self,
+        silent=True,
+        report=False,
+        normal_msg="normal termination",
+        callback=None,
+    ):
+        """
+        Coroutine that runs the model using asyncio subprocesses, so that
+        many models can be run concurrently from one event loop.
+
+        Parameters
+        ----------
+        silent : boolean
+            Echo run information to screen (default is True).
+        report : boolean, optional
+            Save stdout lines to a list (buff) which is returned
+            by the method . (default is False).
+        normal_msg : str
+            Normal termination message used to determine if the
+            run terminated normally. (default is 'normal termination')
+        callback : function
+            function called with the RunEvent of each line of stdout and
+            of the end of the run (default is None)
+
+        Returns
+        -------
+        (success, buff)
+        success : boolean
+        buff : list of lines of stdout
+
+        """
+
+        return await run_model_async(
+            self.exe_name,
+            self.namefile,
+            model_ws=self.model_ws,
+            silent=silent,
+            report=report,
+            normal_msg=normal_msg,
+            callback=callback,
         )
 
     def load_results(self):
@@ -1644,6 +1704,26 @@ class BaseModel(ModelInterface):
         return
 
 
+def _get_exe_path(exe_name):
+    """
+    Get the path of a model executable, raises an exception if the
+    executable does not exist
+    """
+    exe = which(exe_name)
+    if exe is None:
+        import platform
+
+        if platform.system() in "Windows":
+            if not exe_name.lower().endswith(".exe"):
+                exe = which(exe_name + ".exe")
+    if exe is None:
+        s = "The program {} does not exist or is not executable.".format(
+            exe_name
+        )
+        raise Exception(s)
+    return exe
+
+
 def run_model(
     exe_name,
     namefile,
@@ -1654,6 +1734,7 @@ def run_model(
     normal_msg="normal termination",
     use_async=False,
     cargs=None,
+    callback=None,
 ):
     """
     This function will run the model using subprocess.Popen.  It
@@ -1690,6 +1771,10 @@ def run_model(
     cargs : str or list of strings
         additional command line arguments to pass to the executable.
         Default is None
+    callback : function
+        function called with the RunEvent of each line of stdout and of
+        the end of the run, for example a flopy.utils.RunTelemetry object.
+        Default is None
     Returns
     -------
     (success, buff)
@@ -1699,6 +1784,7 @@ def run_model(
     """
     success = False
     buff = []
+    t0 = time.time()
 
     # convert normal_msg to a list of lower case str for comparison
     if isinstance(normal_msg, str):
@@ -1707,25 +1793,13 @@ def run_model(
         normal_msg[idx] = s.lower()
 
     # Check to make sure that program and namefile exist
-    exe = which(exe_name)
-    if exe is None:
-        import platform
-
-        if platform.system() in "Windows":
-            if not exe_name.lower().endswith(".exe"):
-                exe = which(exe_name + ".exe")
-    if exe is None:
-        s = "The program {} does not exist or is not executable.".format(
-            exe_name
+    exe = _get_exe_path(exe_name)
+    if not silent:
+        s = (
+            "FloPy is using the following "
+            + " executable to run the model: {}".format(exe)
         )
-        raise Exception(s)
-    else:
-        if not silent:
-            s = (
-                "FloPy is using the following "
-                + " executable to run the model: {}".format(exe)
-            )
-            print(s)
+        print(s)
 
     if namefile is not None:
         if not os.path.isfile(os.path.join(model_ws, namefile)):
@@ -1771,8 +1845,12 @@ def run_model(
                     print(line)
                 if report:
                     buff.append(line)
+                if callback is not None:
+                    callback(_parse_stdout_line(line, time.time() - t0))
             else:
                 break
+        if callback is not None:
+            callback(_get_finished_event(success, proc.wait(), t0))
         return success, buff
 
     # some tricks for the async stdout reading
@@ -1792,6 +1870,12 @@ def run_model(
         else:
             if line == "":
                 break
+            if callback is not None:
+                callback(
+                    _parse_stdout_line(
+                        line.decode().rstrip("\r\n"), time.time() - t0
+                    )
+                )
             line = line.decode().lower().strip()
             if line != "":
                 now = datetime.now()
@@ -1820,6 +1904,972 @@ def run_model(
                 success = True
                 break
 
+    if callback is not None:
+        callback(_get_finished_event(success, proc.returncode, t0))
+
     if pause:
         input("Press Enter to continue...")
     return success, buff
+
+
+class RunResult(object):
+    """
+    Result of a model run started by run_models()
+
+    Attributes
+    ----------
+    index : int
+        position of the run in the list of models passed to run_models()
+    model_ws : str
+        workspace the model was run in
+    success : bool
+        True if the run terminated normally
+    returncode : int or None
+        exit code of the executable, None if it was not started
+    timed_out : bool
+        True if the run was stopped after the timeout
+    runtime : float
+        wall clock run time in seconds
+    stdout : list
+        last lines of the stdout of the run
+    listing : list
+        last lines of the listing file of the run
+    error : str or None
+        error message if the run could not be staged or started
+
+    """
+
+    def __init__(self, index, model_ws):
+        self.index = index
+        self.model_ws = model_ws
+        self.success = False
+        self.returncode = None
+        self.timed_out = False
+        self.runtime = 0.0
+        self.stdout = []
+        self.listing = []
+        self.error = None
+
+    def __repr__(self):
+        if self.error is not None:
+            status = "error: {}".format(self.error)
+        elif self.timed_out:
+            status = "timed out"
+        elif self.success:
+            status = "normal termination"
+        else:
+            status = "failed with exit code {}".format(self.returncode)
+        return "RunResult({}, {}, {:.2f} s, {})".format(
+            self.index, self.model_ws, self.runtime, status
+        )
+
+
+def _get_run_args(model, exe_name, namefile):
+    """
+    Get the executable, namefile and workspace of a model object,
+    simulation object or model workspace
+    """
+    if hasattr(model, "simulation_data"):
+        # MFSimulation
+        return (
+            model.exe_name,
+            None,
+            model.simulation_data.mfpath.get_sim_path(),
+        )
+    elif isinstance(model, BaseModel):
+        return model.exe_name, model.namefile, model.model_ws
+    elif isinstance(model, str):
+        if exe_name is None:
+            raise ValueError(
+                "exe_name is required to run model workspace {}".format(model)
+            )
+        return exe_name, namefile, model
+    raise TypeError(
+        "run_models: cannot run {}, models must be model objects, "
+        "simulations or model workspaces".format(type(model).__name__)
+    )
+
+
+def _get_listing_file(model_ws, namefile):
+    """
+    Get the path of the listing file of a model from the LIST entry of the
+    namefile, or mfsim.lst for a MODFLOW 6 simulation without namefile
+    """
+    if namefile is None:
+        return os.path.join(model_ws, "mfsim.lst")
+    fpth = os.path.join(model_ws, namefile)
+    if os.path.isfile(fpth):
+        with open(fpth) as f:
+            for line in f:
+                t = line.split()
+                if len(t) > 2 and t[0].upper() == "LIST":
+                    return os.path.join(model_ws, t[2])
+    return None
+
+
+def _stage_files(src, dst, link=False, link_files=None):
+    """
+    Copy or link a file or a directory tree, link is True or 'hard' to
+    hardlink and 'symbolic' to symlink the files. Only the files in
+    link_files (absolute paths) are linked if it is not None. Files that
+    cannot be linked (for example across file systems) are copied
+    """
+    if os.path.isdir(src):
+        if not os.path.isdir(dst):
+            os.makedirs(dst)
+        for name in os.listdir(src):
+            _stage_files(
+                os.path.join(src, name),
+                os.path.join(dst, name),
+                link=link,
+                link_files=link_files,
+            )
+        return
+    if os.path.lexists(dst):
+        os.remove(dst)
+    if link_files is not None and os.path.abspath(src) not in link_files:
+        link = False
+    if link == "symbolic":
+        try:
+            # relative links remain valid if the workspaces are moved
+            target = os.path.relpath(
+                os.path.abspath(src), os.path.dirname(os.path.abspath(dst))
+            )
+            os.symlink(target, dst)
+            return
+        except (OSError, ValueError, AttributeError):
+            pass
+    elif link is True or link == "hard":
+        try:
+            os.link(src, dst)
+            return
+        except (OSError, AttributeError):
+            pass
+    shutil.copy2(src, dst)
+
+
+def _is_subdir(pth, parent):
+    """
+    Check if a path is a directory parent or is in directory parent
+    """
+    pth = os.path.realpath(pth)
+    parent = os.path.realpath(parent)
+    return pth == parent or pth.startswith(os.path.join(parent, ""))
+
+
+def _read_tail(fpth, nlines):
+    """
+    Read the last lines of a text file
+    """
+    if fpth is None or not os.path.isfile(fpth) or nlines < 1:
+        return []
+    with open(fpth, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        nbytes = 4096
+        while True:
+            f.seek(max(size - nbytes, 0))
+            lines = f.read().splitlines()
+            if len(lines) > nlines or nbytes >= size:
+                break
+            nbytes *= 4
+    return [line.decode(errors="replace") for line in lines[-nlines:]]
+
+
+def _kill_process(proc, killed=None):
+    """
+    Kill a model process and the processes it started, the killed event
+    is set if the process had not finished yet
+    """
+    if proc.poll() is not None:
+        return
+    if killed is not None:
+        killed.set()
+    try:
+        if sys.platform != "win32":
+            import signal
+
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except OSError:
+        pass
+
+
+def _run_models_job(job):
+    """
+    Stage and run a single model for run_models()
+    """
+    (
+        index,
+        exe,
+        namefile,
+        model_ws,
+        stage_ws,
+        shared_files,
+        link,
+        input_files,
+        cargs,
+        timeout,
+        normal_msg,
+        ntail,
+    ) = job
+    result = RunResult(index, model_ws if stage_ws is None else stage_ws)
+    t0 = time.time()
+    try:
+        if stage_ws is not None:
+            # output files of earlier runs are copied, linking them would
+            # let the runs write to the workspace and to each other
+            _stage_files(model_ws, stage_ws, link=link, link_files=input_files)
+            for fpth in shared_files:
+                _stage_files(
+                    fpth,
+                    os.path.join(stage_ws, os.path.basename(fpth)),
+                    link=link,
+                )
+        argv = [exe]
+        if namefile is not None:
+            argv.append(namefile)
+        argv += cargs
+
+        kwargs = {}
+        if sys.platform != "win32":
+            # run the model in its own process group so that a timeout
+            # also stops the processes started by the executable
+            kwargs["start_new_session"] = True
+        proc = Popen(
+            argv, stdout=PIPE, stderr=STDOUT, cwd=result.model_ws, **kwargs
+        )
+    except Exception as e:
+        result.error = str(e)
+        result.runtime = time.time() - t0
+        return result
+
+    timer = None
+    killed = threading.Event()
+    if timeout is not None:
+        timer = threading.Timer(timeout, _kill_process, args=(proc, killed))
+        timer.daemon = True
+        timer.start()
+    stdout = deque(maxlen=max(ntail, 0))
+    for line in iter(proc.stdout.readline, b""):
+        line = line.decode(errors="replace").rstrip("\r\n")
+        if not result.success:
+            lower = line.lower()
+            result.success = any(msg in lower for msg in normal_msg)
+        stdout.append(line)
+    proc.stdout.close()
+    result.returncode = proc.wait()
+    result.runtime = time.time() - t0
+    if timer is not None:
+        timer.cancel()
+        # a run that finished by itself as the timer fired has not timed out
+        result.timed_out = killed.is_set() and result.returncode != 0
+        if result.timed_out:
+            result.success = False
+
+    result.stdout = list(stdout)
+    result.listing = _read_tail(
+        _get_listing_file(result.model_ws, namefile), ntail
+    )
+    return result
+
+
+def run_models(
+    models,
+    exe_name=None,
+    namefile=None,
+    processes=None,
+    timeout=None,
+    run_dir=None,
+    shared_files=None,
+    link=False,
+    normal_msg="normal termination",
+    cargs=None,
+    ntail=20,
+    silent=True,
+):
+    """
+    Run a batch of models, for example the realizations of a Monte Carlo
+    or PEST-style analysis, with a bounded number of concurrent runs.
+
+    The model input files must have been written before calling this
+    function. Runs that fail, time out or cannot be started do not stop
+    the batch; their status is reported in the returned results.
+
+    Parameters
+    ----------
+    models : list
+        model objects (flopy.mbase.BaseModel), MODFLOW 6 simulations
+        (flopy.mf6.MFSimulation) or paths of model workspaces
+    exe_name : str
+        executable used to run model workspaces, model objects and
+        simulations use their own exe_name (default is None)
+    namefile : str
+        namefile of the model workspaces, None for MODFLOW 6 simulations
+        (default is None)
+    processes : int
+        maximum number of models that run at the same time (default is
+        None, models run one at a time)
+    timeout : float
+        maximum run time in seconds, runs that take longer are stopped and
+        reported as timed out (default is None, no timeout)
+    run_dir : str
+        directory for the run directories. If given, the workspace of each
+        model is staged to a run directory run_dir/run_<index> and the
+        model is run there, leaving the model workspaces unchanged
+        (default is None, models are run in their workspaces)
+    shared_files : list
+        paths of input files that are shared by all runs, staged to each
+        run directory when run_dir is given (default is None)
+    link : bool
+        hardlink staged input files instead of copying them, files that
+        cannot be hardlinked are copied. The input files of model objects
+        and simulations and the shared_files are linked, all other files
+        in the workspace (including output files of earlier runs and all
+        files of model workspaces given as paths) are copied. Only use
+        link when the executable does not modify its input files in
+        place. (default is False)
+    normal_msg : str or list
+        Normal termination message used to determine if the
+        run terminated normally. More than one message can be provided using
+        a list. (Default is 'normal termination')
+    cargs : str or list of strings
+        additional command line arguments to pass to the executable.
+        Default is None
+    ntail : int
+        number of lines of stdout and of the listing file kept in the
+        results (default is 20)
+    silent : bool
+        if False, print the status of each run when it finishes (default
+        is True)
+
+    Returns
+    -------
+    list of RunResult
+        result of each run in the order of models
+
+    Examples
+    --------
+
+    >>> import flopy
+    >>> ws = ['realization{}'.format(i) for i in range(100)]
+    >>> results = flopy.run_models(ws, exe_name='mf6', processes=4,
+    ...                            timeout=600)
+    >>> failed = [r.index for r in results if not r.success]
+
+    """
+    if isinstance(normal_msg, str):
+        normal_msg = [normal_msg]
+    normal_msg = [s.lower() for s in normal_msg]
+    if cargs is None:
+        cargs = []
+    elif isinstance(cargs, str):
+        cargs = [cargs]
+    if shared_files is None:
+        shared_files = []
+    elif isinstance(shared_files, str):
+        shared_files = [shared_files]
+    if shared_files and run_dir is None:
+        raise ValueError("run_models: shared_files requires a run_dir")
+
+    models = list(models)
+    width = len(str(max(len(models) - 1, 0)))
+    exes = {}
+    jobs = []
+    for index, model in enumerate(models):
+        exe, nam, model_ws = _get_run_args(model, exe_name, namefile)
+        # check that each executable exists once
+        if exe not in exes:
+            exes[exe] = _get_exe_path(exe)
+        stage_ws = None
+        input_files = None
+        if run_dir is not None:
+            if _is_subdir(run_dir, model_ws):
+                raise ValueError(
+                    "run_models: run_dir {} is in model workspace "
+                    "{}".format(run_dir, model_ws)
+                )
+            stage_ws = os.path.join(
+                run_dir, "run_{:0{}d}".format(index, width)
+            )
+            input_files = set()
+            if not isinstance(model, str):
+                input_files.update(
+                    os.path.abspath(os.path.join(model_ws, f))
+                    for f in _get_input_files(model)
+                )
+        jobs.append(
+            (
+                index,
+                exes[exe],
+                nam,
+                model_ws,
+                stage_ws,
+                shared_files,
+                link,
+                input_files,
+                cargs,
+                timeout,
+                normal_msg,
+                ntail,
+            )
+        )
+
+    if processes is None or processes < 2 or len(jobs) < 2:
+        pool = None
+        results = map(_run_models_job, jobs)
+    else:
+        from multiprocessing.pool import ThreadPool
+
+        # the models run in their own processes, threads only wait for them
+        pool = ThreadPool(processes)
+        results = pool.imap_unordered(_run_models_job, jobs)
+
+    runs = [None] * len(jobs)
+    try:
+        for result in results:
+            runs[result.index] = result
+            if not silent:
+                print(
+                    "run {} of {}: {}".format(
+                        sum(r is not None for r in runs), len(runs), result
+                    )
+                )
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return runs
+
+
+# progress reported on the stdout of MODFLOW executables, for example
+# "Solving:  Stress period:     1    Time step:     1"
+_stdout_timestep_re = re.compile(
+    r"stress\s+period[:\s]+(\d+)[,\s]+time\s+step[:\s]+(\d+)", re.I
+)
+_stdout_iterations_re = re.compile(
+    r"(\d+)\s+(?:total\s+|outer\s+)*iterations|(\d+)\s+calls\s+to", re.I
+)
+
+
+class RunEvent(object):
+    """
+    Progress event of a model run streamed by run_model_events()
+
+    Attributes
+    ----------
+    kind : str
+        'line' for a line of stdout, 'timestep' for a line that reports
+        the time step being solved, 'iterations' for a line that reports
+        the number of solver iterations and 'finished' for the last event
+        of the run
+    line : str
+        line of stdout, None for the finished event
+    elapsed : float
+        seconds since the start of the run
+    kper : int
+        zero-based stress period of a timestep event
+    kstp : int
+        zero-based time step of a timestep event
+    iterations : int
+        solver iterations of an iterations event
+    success : bool
+        True if the run terminated normally, set on the finished event
+    returncode : int
+        exit code of the executable, set on the finished event
+
+    """
+
+    def __init__(self, kind, line, elapsed):
+        self.kind = kind
+        self.line = line
+        self.elapsed = elapsed
+        self.kper = None
+        self.kstp = None
+        self.iterations = None
+        self.success = None
+        self.returncode = None
+
+    def __repr__(self):
+        if self.kind == "timestep":
+            info = "kper={}, kstp={}".format(self.kper, self.kstp)
+        elif self.kind == "iterations":
+            info = "iterations={}".format(self.iterations)
+        elif self.kind == "finished":
+            info = "success={}, returncode={}".format(
+                self.success, self.returncode
+            )
+        else:
+            info = repr(self.line)
+        return "RunEvent({}, {:.2f} s, {})".format(
+            self.kind, self.elapsed, info
+        )
+
+
+def _parse_stdout_line(line, elapsed):
+    """
+    Create the progress event of a line of model stdout
+    """
+    match = _stdout_timestep_re.search(line)
+    if match is not None:
+        event = RunEvent("timestep", line, elapsed)
+        event.kper = int(match.group(1)) - 1
+        event.kstp = int(match.group(2)) - 1
+        return event
+    match = _stdout_iterations_re.search(line)
+    if match is not None:
+        event = RunEvent("iterations", line, elapsed)
+        event.iterations = int(match.group(1) or match.group(2))
+        return event
+    return RunEvent("line", line, elapsed)
+
+
+def _get_finished_event(success, returncode, t0):
+    """
+    Create the last event of a model run started at time t0
+    """
+    event = RunEvent("finished", None, time.time() - t0)
+    event.success = success
+    event.returncode = returncode
+    return event
+
+
+class _RunModelEvents(object):
+    """
+    Asynchronous iterator over the progress events of a model run, see
+    run_model_events()
+    """
+
+    def __init__(self, argv, model_ws, normal_msg):
+        self._argv = argv
+        self._model_ws = model_ws
+        self._normal_msg = normal_msg
+        self._proc = None
+        self._t0 = None
+        self._success = False
+        self._finished = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._finished:
+            raise StopAsyncIteration
+        loop = asyncio.get_event_loop()
+        if self._proc is None:
+            self._t0 = loop.time()
+            self._proc = await asyncio.create_subprocess_exec(
+                *self._argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=self._model_ws,
+                limit=2 ** 20
+            )
+        try:
+            line = await self._proc.stdout.readline()
+            if line:
+                line = line.decode(errors="replace").rstrip("\r\n")
+                if not self._success:
+                    lower = line.lower()
+                    self._success = any(
+                        msg in lower for msg in self._normal_msg
+                    )
+                return _parse_stdout_line(line, loop.time() - self._t0)
+            returncode = await self._proc.wait()
+        except BaseException:
+            # stop the model if the iteration is cancelled
+            await self.aclose()
+            raise
+
+        self._finished = True
+        event = RunEvent("finished", None, loop.time() - self._t0)
+        event.success = self._success
+        event.returncode = returncode
+        return event
+
+    async def aclose(self):
+        """
+        Kill the model process if the run has not finished
+        """
+        self._finished = True
+        if self._proc is not None and self._proc.returncode is None:
+            try:
+                self._proc.kill()
+            except ProcessLookupError:
+                pass
+            await self._proc.wait()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+
+def run_model_events(
+    exe_name,
+    namefile,
+    model_ws="./",
+    normal_msg="normal termination",
+    cargs=None,
+):
+    """
+    Get an asynchronous iterator that runs a model with
+    asyncio.create_subprocess_exec and yields a progress event for each
+    line of the model stdout. Many runs can be supervised concurrently
+    from a single event loop without a thread per run.
+
+    The model is started on the first iteration. The last event has the
+    kind 'finished' and holds the success and the exit code of the run.
+    Use the iterator as an asynchronous context manager to kill the model
+    process when the iteration is stopped before the run has finished.
+
+    Parameters
+    ----------
+    exe_name : str
+        Executable name (with path, if necessary) to run.
+    namefile : str
+        Namefile of model to run. The namefile must be the
+        filename of the namefile without the path. Namefile can be None
+        to allow programs that do not require a control file (name file)
+        to be passed as a command line argument.
+    model_ws : str
+        Path to the location of the namefile. (default is the
+        current working directory - './')
+    normal_msg : str or list
+        Normal termination message used to determine if the
+        run terminated normally. More than one message can be provided using
+        a list. (Default is 'normal termination')
+    cargs : str or list of strings
+        additional command line arguments to pass to the executable.
+        Default is None
+
+    Returns
+    -------
+    asynchronous iterator of RunEvent
+
+    Examples
+    --------
+
+    >>> import asyncio
+    >>> from flopy.mbase import run_model_events
+    >>> async def run(ws):
+    ...     async with run_model_events('mf6', None, ws) as events:
+    ...         async for event in events:
+    ...             if event.kind == 'timestep':
+    ...                 print(ws, event.kper, event.kstp)
+    ...     return event.success
+    >>> loop = asyncio.get_event_loop()
+    >>> success = loop.run_until_complete(
+    ...     asyncio.gather(run('run0'), run('run1')))
+
+    """
+    if isinstance(normal_msg, str):
+        normal_msg = [normal_msg]
+    normal_msg = [s.lower() for s in normal_msg]
+
+    exe = _get_exe_path(exe_name)
+    if namefile is not None:
+        if not os.path.isfile(os.path.join(model_ws, namefile)):
+            s = "The namefile for this model " + "does not exists: {}".format(
+                namefile
+            )
+            raise Exception(s)
+
+    argv = [exe]
+    if namefile is not None:
+        argv.append(namefile)
+    if cargs is not None:
+        if isinstance(cargs, str):
+            cargs = [cargs]
+        argv += list(cargs)
+    return _RunModelEvents(argv, model_ws, normal_msg)
+
+
+async def run_model_async(
+    exe_name,
+    namefile,
+    model_ws="./",
+    silent=True,
+    report=False,
+    normal_msg="normal termination",
+    cargs=None,
+    callback=None,
+):
+    """
+    Coroutine version of run_model() built on asyncio subprocesses, the
+    progress of the run is passed to an optional callback. See
+    run_model_events() to iterate over the progress events directly.
+
+    Parameters
+    ----------
+    exe_name : str
+        Executable name (with path, if necessary) to run.
+    namefile : str
+        Namefile of model to run. The namefile must be the
+        filename of the namefile without the path. Namefile can be None
+        to allow programs that do not require a control file (name file)
+        to be passed as a command line argument.
+    model_ws : str
+        Path to the location of the namefile. (default is the
+        current working directory - './')
+    silent : boolean
+        Echo run information to screen (default is True).
+    report : boolean, optional
+        Save stdout lines to a list (buff) which is returned
+        by the method . (default is False).
+    normal_msg : str or list
+        Normal termination message used to determine if the
+        run terminated normally. More than one message can be provided using
+        a list. (Default is 'normal termination')
+    cargs : str or list of strings
+        additional command line arguments to pass to the executable.
+        Default is None
+    callback : function
+        function called with each RunEvent of the run (default is None)
+
+    Returns
+    -------
+    (success, buff)
+    success : boolean
+    buff : list of lines of stdout
+
+    """
+    buff = []
+    success = False
+    events = run_model_events(
+        exe_name, namefile, model_ws, normal_msg=normal_msg, cargs=cargs
+    )
+    async with events:
+        async for event in events:
+            if callback is not None:
+                callback(event)
+            if event.kind == "finished":
+                success = event.success
+                continue
+            if not silent:
+                print(event.line)
+            if report:
+                buff.append(event.line)
+    return success, buff
+
+
+def _get_input_files(model):
+    """
+    Get the paths of the input files of a model or MODFLOW 6 simulation,
+    relative to the model workspace
+    """
+    if hasattr(model, "simulation_data"):
+        # MFSimulation
+        mfpath = model.simulation_data.mfpath
+        model_ws = mfpath.get_sim_path()
+        packages = [model.name_file, model._tdis_file]
+        for files in (
+            model._ims_files,
+            model._exchange_files,
+            model._ghost_node_files,
+            model._mover_files,
+            model._other_files,
+        ):
+            packages += list(files.values())
+        for name in model.model_names:
+            mf6_model = model.get_model(name)
+            packages += [mf6_model.name_file] + list(mf6_model.packagelist)
+        fpths = [
+            os.path.relpath(pp.get_file_path(), model_ws)
+            for pp in packages
+            if pp is not None
+        ]
+        fpths += [
+            str(fpth)
+            for fpth in mfpath.existing_file_dict
+            if not os.path.isabs(str(fpth))
+        ]
+    else:
+        fpths = [model.namefile]
+        for pp in model.packagelist:
+            fpths += [f for f in pp.file_name if f not in model.output_fnames]
+        fpths += [
+            f
+            for f, output in zip(model.external_fnames, model.external_output)
+            if not output and not os.path.isabs(f)
+        ]
+        # arrays written to the external path are not in the namefile
+        external_path = getattr(model, "external_path", None)
+        if external_path is not None and not os.path.isabs(external_path):
+            pth = os.path.join(model.model_ws, external_path)
+            for root, dirs, files in os.walk(pth):
+                fpths += [
+                    os.path.relpath(os.path.join(root, f), model.model_ws)
+                    for f in sorted(files)
+                ]
+    # unique paths in the order of the packages
+    return list(OrderedDict.fromkeys(os.path.normpath(f) for f in fpths))
+
+
+def _get_ensemble_packages(model, packages):
+    """
+    Get the packages of a MODFLOW 6 simulation from package objects or
+    package names and types
+    """
+    pps = []
+    for pp in packages:
+        if not isinstance(pp, str):
+            pps.append(pp)
+            continue
+        found = []
+        containers = [model] + [model.get_model(n) for n in model.model_names]
+        for container in containers:
+            pkg = container.get_package(pp)
+            if isinstance(pkg, list):
+                found += pkg
+            elif pkg is not None:
+                found.append(pkg)
+        if not found:
+            raise ValueError(
+                "create_ensemble: package {} not found".format(pp)
+            )
+        pps += found
+    return pps
+
+
+def create_ensemble(
+    model, workspaces, update=None, packages=None, link="hard"
+):
+    """
+    Create the workspaces of the members of an ensemble, for example for a
+    Monte Carlo analysis, from a base model without loading and writing
+    the complete model for each member.
+
+    For each member update is called to change the parameters of the
+    member, with the model in the workspace of the base model so that
+    update can read the data of the base model, including external files.
+    The model workspace is then changed to the workspace of the member
+    and only the packages that vary between the members are written, the
+    other input files of the base model are linked or copied from the
+    workspace of the base model. Output files of the base model are not
+    staged.
+
+    Parameters
+    ----------
+    model : flopy.mbase.BaseModel or flopy.mf6.MFSimulation
+        base model, the input files of the base model must have been
+        written to the model workspace
+    workspaces : list of str
+        workspaces of the ensemble members, created if they do not exist
+    update : function
+        function update(model, index) that sets the parameters of the
+        member with the index in the model before the member is written.
+        update can change package data but not add or remove packages.
+        (default is None)
+    packages : list
+        names of the packages that vary between the members, for example
+        ['LPF', 'RCH'] for a MODFLOW-2005 model or ['npf'] for a MODFLOW 6
+        simulation. MODFLOW 6 packages can also be given as package
+        objects. (default is None, all files are linked or copied from the
+        workspace of the base model)
+    link : str
+        'hard' to hardlink, 'symbolic' to symlink or 'copy' to copy the
+        input files that do not vary. Files that cannot be linked are
+        copied. Linked files share their contents with the base model
+        and should not be modified in the member workspaces.
+        (default is 'hard')
+
+    Returns
+    -------
+    list of str
+        workspaces of the ensemble members, for example to pass to
+        run_models()
+
+    Notes
+    -----
+    The model is returned to the workspace of the base model after the
+    members have been created and keeps the parameters of the last
+    member.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> import flopy
+    >>> m = flopy.modflow.Modflow.load('model.nam', model_ws='base')
+    >>> hk = m.lpf.hk.array
+    >>> def update(m, i):
+    ...     m.lpf.hk = hk * np.random.lognormal(sigma=0.5, size=hk.shape)
+    >>> ws = ['member{}'.format(i) for i in range(1000)]
+    >>> ws = flopy.create_ensemble(m, ws, update, packages=['LPF'])
+    >>> results = flopy.run_models(ws, exe_name='mf2005',
+    ...                            namefile='model.nam', processes=8)
+
+    """
+    if link not in ("hard", "symbolic", "copy"):
+        raise ValueError(
+            "create_ensemble: link must be 'hard', 'symbolic' or 'copy', "
+            "not {}".format(link)
+        )
+    if packages is None:
+        packages = []
+    elif isinstance(packages, str):
+        packages = [packages]
+
+    mf6 = hasattr(model, "simulation_data")
+    if mf6:
+        base_ws = model.simulation_data.mfpath.get_sim_path()
+    else:
+        base_ws = model.model_ws
+    input_files = _get_input_files(model)
+    missing = [
+        f for f in input_files if not os.path.isfile(os.path.join(base_ws, f))
+    ]
+    if missing:
+        raise Exception(
+            "create_ensemble: the input files of the base model have not "
+            "been written to {}: {}".format(base_ws, ", ".join(missing))
+        )
+
+    workspaces = list(workspaces)
+    try:
+        for index, ws in enumerate(workspaces):
+            if os.path.abspath(ws) == os.path.abspath(base_ws):
+                raise ValueError(
+                    "create_ensemble: the workspace of member {} is the "
+                    "workspace of the base model".format(index)
+                )
+            # remove the input files of an existing member workspace so
+            # that the linked files of the base model are not overwritten
+            for f in input_files:
+                fpth = os.path.join(ws, f)
+                if os.path.lexists(fpth):
+                    os.remove(fpth)
+
+            if update is not None:
+                update(model, index)
+
+            if mf6:
+                if not os.path.isdir(ws):
+                    os.makedirs(ws)
+                model.set_sim_path(ws)
+                for pp in _get_ensemble_packages(model, packages):
+                    pp.write()
+                model.set_sim_path(base_ws)
+            else:
+                model.change_model_ws(ws, silent=True)
+                if packages:
+                    model.write_input(SelPackList=packages)
+                model.change_model_ws(base_ws, silent=True)
+
+            # files that have not been written for the member
+            for f in input_files:
+                fpth = os.path.join(ws, f)
+                if not os.path.lexists(fpth):
+                    dirname = os.path.dirname(fpth)
+                    if not os.path.isdir(dirname):
+                        os.makedirs(dirname)
+                    _stage_files(os.path.join(base_ws, f), fpth, link=link)
+    finally:
+        if mf6:
+            model.set_sim_path(base_ws)
+        else:
+            model.change_model_ws(base_ws, silent=True)
+    return workspaces
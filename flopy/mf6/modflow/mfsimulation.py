@@ -8,7 +8,7 @@ import sys
 import inspect
 import collections
 import os.path
-from ...mbase import run_model
+from ...mbase import run_model, run_model_async
 from ..mfbase import (
     PackageContainer,
     MFFileMgmt,
@@ -64,6 +64,7 @@ class SimulationDict(collections.OrderedDict):
     def __init__(self, path=None):
         collections.OrderedDict.__init__(self)
         self._path = path
+        self._output_cache = binaryfile_utils.MFOutputCache()
 
     def __getitem__(self, key):
         """Define the __getitem__ magic method.
@@ -73,7 +74,10 @@ class SimulationDict(collections.OrderedDict):
         key (string): Part or all of a dictionary key
 
         Returns:
-            MFData or numpy.ndarray
+            MFData, numpy.ndarray or MFOutputArray. Heads, drawdown,
+            concentrations and full 3D budget terms of binary output files
+            are returned as MFOutputArray proxies, use np.asarray() to get
+            a numpy.ndarray.
 
         """
         if key == "_path" or not hasattr(self, "_path"):
@@ -1401,6 +1405,7 @@ class MFSimulation(PackageContainer):
         normal_msg="normal termination",
         use_async=False,
         cargs=None,
+        callback=None,
     ):
         """Run the simulation.
 
@@ -1423,6 +1428,10 @@ class MFSimulation(PackageContainer):
             cargs : (str or list of strings)
                 additional command line arguments to pass to the executable.
                 default is None
+            callback : (function)
+                function called with the flopy.mbase.RunEvent of each line
+                of stdout and of the end of the run, for example a
+                flopy.utils.RunTelemetry object. default is None
 
         Returns
         --------
@@ -1439,6 +1448,9 @@ class MFSimulation(PackageContainer):
                 silent = False
             else:
                 silent = True
+        # close the cached output file readers so that the output files
+        # can be replaced by the run
+        self.simulation_data.mfdata._output_cache.clear()
         return run_model(
             self.exe_name,
             None,
@@ -1449,6 +1461,66 @@ class MFSimulation(PackageContainer):
             normal_msg=normal_msg,
             use_async=use_async,
             cargs=cargs,
+            callback=callback,
+        )
+
+    async def run_simulation_async(
+        self,
+        silent=None,
+        report=False,
+        normal_msg="normal termination",
+        cargs=None,
+        callback=None,
+    ):
+        """Coroutine that runs the simulation using asyncio subprocesses,
+        so that many simulations can be run concurrently from one event
+        loop.
+
+        Parameters
+        ----------
+            silent (bool):
+                run in silent mode
+            report (bool):
+                save stdout lines to a list (buff)
+            normal_msg (str or list):
+                Normal termination message used to determine if the run
+                terminated normally. More than one message can be provided
+                using a list. (default is 'normal termination')
+            cargs : (str or list of strings)
+                additional command line arguments to pass to the executable.
+                default is None
+            callback : (function)
+                function called with the flopy.mbase.RunEvent of each line
+                of stdout and of the end of the run, for example a
+                flopy.utils.RunTelemetry object. default is None
+
+        Returns
+        --------
+            (success, buff)
+                success : boolean
+                buff : list of lines of stdout
+
+        """
+        if silent is None:
+            if (
+                self.simulation_data.verbosity_level.value
+                >= VerbosityLevel.normal.value
+            ):
+                silent = False
+            else:
+                silent = True
+        # close the cached output file readers so that the output files
+        # can be replaced by the run
+        self.simulation_data.mfdata._output_cache.clear()
+        return await run_model_async(
+            self.exe_name,
+            None,
+            self.simulation_data.mfpath.get_sim_path(),
+            silent=silent,
+            report=report,
+            normal_msg=normal_msg,
+            cargs=cargs,
+            callback=callback,
         )
 
     def delete_output_files(self):
@@ -1457,6 +1529,8 @@ class MFSimulation(PackageContainer):
         output_file_keys = output_req.getkeys(
             self.simulation_data.mfdata, self.simulation_data.mfpath, False
         )
+        # close the cached readers of the output files
+        self.simulation_data.mfdata._output_cache.clear()
         for path in output_file_keys.binarypathdict.values():
             if os.path.isfile(path):
                 os.remove(path)
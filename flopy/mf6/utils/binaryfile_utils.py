@@ -1,8 +1,255 @@
 import os
+import collections
 import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
 from ...utils import binaryfile as bf
 
 
+class MFOutputCache:
+    """
+    Cache of the open binary output file readers of a simulation. Readers
+    are reused until the output file is modified and the least recently
+    used readers are closed when more than maxsize readers are open.
+
+    Parameters
+    ----------
+    maxsize : int
+        maximum number of open readers (default is 8)
+
+    Examples
+    --------
+    >>> cache = MFOutputCache()
+    >>> cbc = cache.get_reader('model.cbc', 'CBC')
+    """
+
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self._readers = collections.OrderedDict()
+
+    def __getstate__(self):
+        # open file handles are not copied
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state):
+        self.maxsize = state["maxsize"]
+        self._readers = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._readers)
+
+    def get_reader(self, path, bintype):
+        """
+        Get a reader for a binary output file.
+
+        Parameters
+        ----------
+        path : str
+            path of the binary output file
+        bintype : str
+            type of output file, 'CBC', 'HDS', 'DDN' or 'UCN'
+
+        Returns
+        -------
+        reader : CellBudgetFile, HeadFile or UcnFile
+
+        """
+        return self._get_stamped_reader(path, bintype)[1]
+
+    def _get_stamped_reader(self, path, bintype):
+        """
+        Get a reader and the stamp of the output file it has been opened
+        for, the stamp changes when the file is modified
+        """
+        key = (os.path.abspath(path), bintype)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime, stat.st_size, stat.st_ino)
+        cached = self._readers.pop(key, None)
+        if cached is not None:
+            if cached[0] == stamp:
+                self._readers[key] = cached
+                return cached
+            # the file has been modified
+            cached[1].close()
+
+        reader = _open_binary_file(path, bintype)
+        self._readers[key] = (stamp, reader)
+        while len(self._readers) > self.maxsize:
+            _, (_, reader_old) = self._readers.popitem(last=False)
+            reader_old.close()
+        return stamp, reader
+
+    def clear(self):
+        """
+        Close all of the readers in the cache.
+        """
+        for _, reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+
+
+class MFOutputArray(NDArrayOperatorsMixin):
+    """
+    Array proxy for the records of a binary output file. Indexing the
+    first dimension only reads the records that are selected, the whole
+    array is read when the proxy is used as a numpy array or when values
+    are assigned to it. The records are read again and assigned values
+    are discarded when the output file is rewritten.
+
+    The proxy is not a numpy.ndarray subclass, use np.asarray() to get
+    the array of all records as a numpy.ndarray.
+
+    Parameters
+    ----------
+    cache : MFOutputCache
+        cache of the binary output file readers
+    path : str
+        path of the binary output file
+    bintype : str
+        type of output file, 'CBC', 'HDS', 'DDN' or 'UCN'
+    text : str
+        budget record name, only used for 'CBC' files
+    full3D : bool
+        get full 3D budget arrays, only used for 'CBC' files
+    shape : tuple
+        shape of a single record, None to use the shape in the file
+
+    """
+
+    def __init__(
+        self, cache, path, bintype, text=None, full3D=True, shape=None
+    ):
+        self._cache = cache
+        self._path = path
+        self._bintype = bintype
+        self._text = text
+        self._full3D = full3D
+        self._recshape = shape
+        self._data = None
+        self._first = None
+        self._records = None
+        self._stamp = None
+        self._get_reader()
+
+    def _get_reader(self):
+        stamp, reader = self._cache._get_stamped_reader(
+            self._path, self._bintype
+        )
+        if stamp != self._stamp:
+            # the output file has been rewritten, the records and the
+            # values read from the previous file are discarded
+            self._stamp = stamp
+            self._data = None
+            self._first = None
+            if self._bintype == "CBC":
+                self._records = list(reader.get_indices(text=self._text))
+            else:
+                self._records = reader.get_times()
+        return reader
+
+    def _read(self, irec):
+        reader = self._get_reader()
+        if self._bintype == "CBC":
+            data = np.array(
+                reader.get_record(self._records[irec], full3D=self._full3D)
+            )
+        else:
+            data = np.array(reader.get_data(totim=self._records[irec]))
+            data[data == -9999] = np.nan
+        if self._recshape is not None:
+            data.shape = self._recshape
+        return data
+
+    def _get_first(self):
+        if self._first is None:
+            self._first = self._read(0)
+        return self._first
+
+    @property
+    def shape(self):
+        self._get_reader()
+        if not self._records:
+            return (0,)
+        return (len(self._records),) + self._get_first().shape
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def dtype(self):
+        self._get_reader()
+        if not self._records:
+            return np.dtype(float)
+        return self._get_first().dtype
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def __len__(self):
+        self._get_reader()
+        return len(self._records)
+
+    def __iter__(self):
+        for irec in range(len(self)):
+            yield self[irec]
+
+    def __repr__(self):
+        return "MFOutputArray({}, {}, shape={})".format(
+            self._path, self._text or self._bintype, self.shape
+        )
+
+    def __array__(self, dtype=None):
+        self._get_reader()
+        if self._data is None:
+            self._data = np.array(
+                [self._read(irec) for irec in range(len(self._records))]
+            )
+        if dtype is not None:
+            return self._data.astype(dtype, copy=False)
+        return self._data
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = tuple(
+            np.asarray(x) if isinstance(x, MFOutputArray) else x
+            for x in inputs
+        )
+        if "out" in kwargs:
+            kwargs["out"] = tuple(
+                np.asarray(x) if isinstance(x, MFOutputArray) else x
+                for x in kwargs["out"]
+            )
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __getattr__(self, name):
+        # ndarray attributes and methods of the whole array
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.__array__(), name)
+
+    def __setitem__(self, index, value):
+        # assigned values are kept in the array of all records
+        self.__array__()[index] = value
+
+    def __getitem__(self, index):
+        self._get_reader()
+        if self._data is not None:
+            return self._data[index]
+        if not isinstance(index, tuple):
+            index = (index,)
+        if len(index) == 0 or index[0] is None or index[0] is Ellipsis:
+            return self.__array__()[index]
+
+        irecs = np.arange(len(self._records))[index[0]]
+        if np.ndim(irecs) == 0:
+            return self._read(int(irecs))[index[1:]]
+        if irecs.size == 0:
+            data = np.empty((0,) + self.shape[1:], dtype=self.dtype)
+        else:
+            data = np.array([self._read(irec) for irec in irecs])
+        return data[(slice(None),) + index[1:]]
+
+
 class MFOutput:
     """
     Wrapper class for Binary Arrays. This class enables directly getting slices
@@ -77,6 +324,10 @@ class MFOutputRequester:
         self.path = path
         self.mfdict = mfdict
         self.dataDict = {}
+        # open readers are shared by the requests of a simulation
+        self.cache = getattr(mfdict, "_output_cache", None)
+        if self.cache is None:
+            self.cache = MFOutputCache()
         # get the binary file locations, create a dictionary key to look them
         # up from, store in self.dataDict
         self._getbinaryfilepaths()
@@ -105,16 +356,11 @@ class MFOutputRequester:
         path = self.dataDict[key]
         bintype = key[1]
 
-        bindata = self._get_binary_file_object(path, bintype, key)
-
         if bintype == "CBC":
-            try:
-                return np.array(bindata.get_data(text=key[-1], full3D=True))
-            except ValueError:
-                # imeth == 6
-                return np.array(bindata.get_data(text=key[-1], full3D=False))
+            return self._get_budget_array(path, key)
         else:
-            return np.array(bindata.get_alldata())
+            self._get_binary_file_object(path, bintype, key)
+            return MFOutputArray(self.cache, path, bintype)
 
     def _querybinarydata_vertices(self, mfdict, key):
         # Basic definition to get output data from binary output files for
@@ -122,92 +368,64 @@ class MFOutputRequester:
         path = self.dataDict[key]
         bintype = key[1]
 
-        bindata = self._get_binary_file_object(path, bintype, key)
-
         if bintype == "CBC":
             if key[-1] == "FLOW-JA-FACE":
-                data = np.array(bindata.get_data(text=key[-1]))
                 # uncomment line to remove extra dimensions from data
                 # data data.shape = (len(times), -1)
-                return data
-
+                self._get_binary_file_object(path, bintype, key)
+                return MFOutputArray(
+                    self.cache, path, bintype, text=key[-1], full3D=False
+                )
             else:
-                try:
-                    data = np.array(
-                        bindata.get_data(text=key[-1], full3D=True)
-                    )
-                except ValueError:
-                    # imeth == 6
-                    data = np.array(
-                        bindata.get_data(text=key[-1], full3D=False)
-                    )
+                data = self._get_budget_array(path, key)
         else:
-            data = np.array(bindata.get_alldata())
+            self._get_binary_file_object(path, bintype, key)
+            data = MFOutputArray(self.cache, path, bintype)
 
         # uncomment line to remove extra dimensions from data
         # data = _reshape_binary_data(data, 'V')
         return data
 
     def _querybinarydata_unstructured(self, key):
-        # get unstructured binary data in numpy array format.
+        # get unstructured binary data in numpy array format, with
+        # un-needed dimensions removed
         path = self.dataDict[key]
         bintype = key[1]
 
-        bindata = self._get_binary_file_object(path, bintype, key)
-
         if bintype == "CBC":
-            try:
-                data = np.array(bindata.get_data(text=key[-1], full3D=True))
-            except ValueError:
-                data = np.array(bindata.get_data(text=key[-1], full3D=False))
+            return self._get_budget_array(path, key, shape=(-1,))
         else:
-            data = bindata.get_alldata()
-
-        # remove un-needed dimensions
-        data = _reshape_binary_data(data, "U")
+            self._get_binary_file_object(path, bintype, key)
+            return MFOutputArray(self.cache, path, bintype, shape=(-1,))
 
-        if key[-1] == "FLOW-JA-FACE":
+    def _get_budget_array(self, path, key, shape=None):
+        # get a budget term as full 3D arrays, or as a numpy array of the
+        # list data for imeth == 6
+        bindata = self._get_binary_file_object(path, "CBC", key)
+        try:
+            data = MFOutputArray(
+                self.cache, path, "CBC", text=key[-1], shape=shape
+            )
+            # read the first record to check the budget format
+            data.dtype
             return data
-
-        else:
+        except ValueError:
+            # imeth == 6
+            data = np.array(bindata.get_data(text=key[-1], full3D=False))
+            if shape is not None:
+                data = _reshape_binary_data(data, "U")
             return data
 
     def _get_binary_file_object(self, path, bintype, key):
         # simple method that trys to open the binary file object using Flopy
-        if bintype == "CBC":
-            try:
-                return bf.CellBudgetFile(path, precision="double")
-            except AssertionError:
-                raise AssertionError(
-                    "{} does not " "exist".format(self.dataDict[key])
-                )
-
-        elif bintype == "HDS":
-            try:
-                return bf.HeadFile(path, precision="double")
-            except AssertionError:
-                raise AssertionError(
-                    "{} does not " "exist".format(self.dataDict[key])
-                )
-
-        elif bintype == "DDN":
-            try:
-                return bf.HeadFile(path, text="drawdown", precision="double")
-            except AssertionError:
-                raise AssertionError(
-                    "{} does not " "exist".format(self.dataDict[key])
-                )
-
-        elif bintype == "UCN":
-            try:
-                return bf.UcnFile(path, precision="single")
-            except AssertionError:
-                raise AssertionError(
-                    "{} does not " "exist".format(self.dataDict[key])
-                )
-
-        else:
+        if bintype not in ("CBC", "HDS", "DDN", "UCN"):
             raise AssertionError()
+        try:
+            return self.cache.get_reader(path, bintype)
+        except (AssertionError, OSError):
+            raise AssertionError(
+                "{} does not " "exist".format(self.dataDict[key])
+            )
 
     @staticmethod
     def _get_vertices(mfdict, key):
@@ -320,49 +538,24 @@ class MFOutputRequester:
         # a dictionary key to access that data
         for key in binarypathdict:
             path = binarypathdict[key]
-            if key[1] == "CBC":
-                try:
-                    readcbc = bf.CellBudgetFile(path, precision="double")
-                    for record in readcbc.get_unique_record_names():
-                        name = record.decode("utf-8").strip(" ")
-                        # store keys along with model name in ordered dict?
-                        self.dataDict[(key[0], key[1], name)] = path
-                    readcbc.close()
-
-                except:
-                    pass
+            if key[1] not in ("CBC", "HDS", "DDN", "UCN"):
+                continue
+            try:
+                reader = self.cache.get_reader(path, key[1])
+            except:
+                continue
 
+            if key[1] == "CBC":
+                for record in reader.get_unique_record_names():
+                    name = record.decode("utf-8").strip(" ")
+                    # store keys along with model name in ordered dict?
+                    self.dataDict[(key[0], key[1], name)] = path
             elif key[1] == "HDS":
-                try:
-                    readhead = bf.HeadFile(path, precision="double")
-                    self.dataDict[(key[0], key[1], "HEAD")] = path
-                    readhead.close()
-
-                except:
-                    pass
-
+                self.dataDict[(key[0], key[1], "HEAD")] = path
             elif key[1] == "DDN":
-                try:
-                    readddn = bf.HeadFile(
-                        path, text="drawdown", precision="double"
-                    )
-                    self.dataDict[(key[0], key[1], "DRAWDOWN")] = path
-                    readddn.close()
-
-                except:
-                    pass
-
+                self.dataDict[(key[0], key[1], "DRAWDOWN")] = path
             elif key[1] == "UCN":
-                try:
-                    readucn = bf.UcnFile(path, precision="single")
-                    self.dataDict[(key[0], key[1], "CONCENTRATION")] = path
-                    readucn.close()
-
-                except:
-                    pass
-
-            else:
-                pass
+                self.dataDict[(key[0], key[1], "CONCENTRATION")] = path
 
     @staticmethod
     def getkeys(mfdict, path, print_keys=True):
@@ -376,6 +569,20 @@ class MFOutputRequester:
         return x
 
 
+def _open_binary_file(path, bintype):
+    # open a reader for a binary output file
+    if bintype == "CBC":
+        return bf.CellBudgetFile(path, precision="double")
+    elif bintype == "HDS":
+        return bf.HeadFile(path, precision="double")
+    elif bintype == "DDN":
+        return bf.HeadFile(path, text="drawdown", precision="double")
+    elif bintype == "UCN":
+        return bf.UcnFile(path, precision="single")
+    else:
+        raise AssertionError()
+
+
 def _reshape_binary_data(data, dtype=None):
     # removes unnecessary dimensions from data returned by
     # flopy.utils.binaryfile
@@ -1,6 +1,11 @@
+import os
+import warnings
 import numpy as np
 import csv
 
+# parsed observation files, keyed by absolute file path
+_obs_cache = {}
+
 
 def try_float(data):
     try:
@@ -10,6 +15,51 @@ def try_float(data):
     return data
 
 
+def _read_obs_csv(fi):
+    """
+    Read a MODFLOW 6 observation csv file into a structured array. Files
+    are parsed once and the result is cached until the modification time
+    or size of the file changes.
+
+    Parameters
+    ----------
+    fi : str
+        path of the observation csv file
+
+    Returns
+    -------
+    data : numpy recarray
+        array with a float64 field for each column of the file
+
+    """
+    key = os.path.abspath(fi)
+    stat = os.stat(key)
+    cached = _obs_cache.get(key)
+    if cached is not None and cached[0] == (stat.st_mtime, stat.st_size):
+        return cached[1]
+
+    with open(fi) as f:
+        names = next(csv.reader([f.readline()]))
+        text = f.read().strip()
+    ncol = len(names)
+    nrow = text.count("\n") + 1 if text else 0
+    with warnings.catch_warnings():
+        # partially parsed text is handled below
+        warnings.simplefilter("ignore", DeprecationWarning)
+        values = np.fromstring(text.replace("\n", ","), dtype=float, sep=",")
+    if values.size != nrow * ncol:
+        # values that can not be parsed in bulk or blank lines
+        with open(fi) as f:
+            reader = csv.reader(f)
+            next(reader)
+            values = [[float(v) for v in line] for line in reader if line]
+        values = np.array(values, dtype=float).reshape(-1, ncol)
+    dtype = np.dtype([(name, np.float64) for name in names])
+    data = values.reshape(-1, ncol).view(dtype).ravel().view(np.recarray)
+    _obs_cache[key] = ((stat.st_mtime, stat.st_size), data)
+    return data
+
+
 class MFObservation:
     """
     Wrapper class to request the MFObservation object:
@@ -76,30 +126,37 @@ class Observations:
         self.Obsname = fi
 
     def _reader(self, fi):
-        # observation file reader is a standard csv reader that we try to
-        # convert each entry to floating point
-        with open(fi) as f:
-            reader = csv.reader(f)
-            data = [[try_float(point) for point in line] for line in reader]
-        return np.array(data)
+        # observation file as an array of strings with the header in the
+        # first row
+        data = _read_obs_csv(fi)
+        values = data.view(np.float64).reshape(-1, len(data.dtype.names))
+        return np.vstack((data.dtype.names, values.astype(str)))
 
     def _array_to_dict(self, data, key=None):
-        # convert np.array to dictionary of observation names and data
-        data = data.T
-        data = {
-            line[0]: [try_float(point) for point in line[1:]] for line in data
-        }
+        # convert observation data to dictionary of observation names and
+        # data
         if key is None:
-            return data
+            return {name: data[name].tolist() for name in data.dtype.names}
+        elif key not in data.dtype.names:
+            raise KeyError(key)
         else:
-            return data[key]
+            return data[key].tolist()
+
+    def _get_time_index(self, totim):
+        times = self.get_times()
+        try:
+            return times.index(totim)
+        except ValueError:
+            err = (
+                "Invalid totim value provided: obs.get_times() "
+                "returns a list of valid times for totim = <>"
+            )
+            raise ValueError(err)
 
     def list_records(self):
         # requester option to list all records (observation names) within an
         # observation file
-        data_str = self._reader(self.Obsname)
-        data = self._array_to_dict(data_str)
-        for key in data:
+        for key in _read_obs_csv(self.Obsname).dtype.names:
             print(key)
 
     def get_data(self, key=None, idx=None, totim=None):
@@ -118,65 +175,35 @@ class Observations:
         -------
         data: (list) observation file data in list
         """
-        data = self._reader(self.Obsname)
-
         # check if user supplied observation key, default is to return
         # all observations
         if key is None:
-            header = data[0]
+            data = self._reader(self.Obsname)
             if idx is not None:
                 data = data[idx, :]
             elif totim is not None:
-                try:
-                    times = self.get_times()
-                    idx = times.index(totim)
-                    data = data[idx, :]
-                except ValueError:
-                    err = (
-                        "Invalid totim value provided: obs.get_times() "
-                        "returns a list of valid times for totim = <>"
-                    )
-                    raise ValueError(err)
-            else:
-                pass
-
+                data = data[self._get_time_index(totim), :]
         else:
-            data = self._array_to_dict(data, key)
+            data = self._array_to_dict(_read_obs_csv(self.Obsname), key)
             if idx is not None:
                 data = data[idx]
             elif totim is not None:
-                try:
-                    times = self.get_times()
-                    idx = times.index(totim)
-                    data = data[idx]
-                except ValueError:
-                    err = (
-                        "Invalid totim value provided: obs.get_times() "
-                        "returns a list of valid times for totim = <>"
-                    )
-                    raise ValueError(err)
-            else:
-                pass
+                data = data[self._get_time_index(totim)]
         return data
 
     def get_times(self):
-        return self.get_data(key="time")
+        return _read_obs_csv(self.Obsname)["time"].tolist()
 
     def get_nrecords(self):
-        data_str = self._reader(self.Obsname)
-        return len(self._array_to_dict(data_str))
+        return len(_read_obs_csv(self.Obsname).dtype.names)
 
     def get_ntimes(self):
-        return len(self.get_times())
+        return _read_obs_csv(self.Obsname).shape[0]
 
     def get_nobs(self):
-        x = self.get_data().shape
-        prod = 1
-        for i in x:
-            prod *= i
         nrecords = self.get_nrecords()
         ntimes = self.get_ntimes()
-        nobs = prod - ntimes - nrecords
+        nobs = (ntimes + 1) * nrecords - ntimes - nrecords
         return nobs
 
     def get_dataframe(
@@ -213,81 +240,40 @@ class Observations:
             print("this feature requires pandas")
             return None
 
-        data_str = self._reader(self.Obsname)
-        data = self._array_to_dict(data_str)
-        time = data["time"]
+        data = _read_obs_csv(self.Obsname)
+        time = data["time"].tolist()
 
         if start_datetime is not None:
             time = self._get_datetime(time, start_datetime, timeunit)
         else:
             pass
 
-        # check to see if user supplied keys, if not get all observations,
-        # adjust for time if necessary.
+        # check to see if user supplied keys, if not get all observations
         if keys is None:
-            if idx is not None or totim is not None:
-                if totim is not None:
-                    try:
-                        times = self.get_times()
-                        idx = times.index(totim)
-                    except ValueError:
-                        err = (
-                            "Invalid totim value provided: obs.get_times() "
-                            "returns a list of valid times for totim = <>"
-                        )
-                        raise ValueError(err)
-
-                # use dictionary comprehension to create a set of pandas series
-                # that can be added to a pd.DataFrame
-                d = {
-                    key: pd.Series(data[key][idx], index=[time[idx]])
-                    for key in data
-                    if key != "time"
-                }
-            else:
-                d = {
-                    key: pd.Series(data[key], index=time)
-                    for key in data
-                    if key != "time"
-                }
-
+            columns = [key for key in data.dtype.names if key != "time"]
         else:
             keys = self._key_list(keys)
             for key in keys:
-                if key not in data:
+                if key not in data.dtype.names:
                     raise KeyError(
                         "Supplied data key: {} is not " "valid".format(key)
                     )
-                else:
-                    pass
-
-            if idx is not None or totim is not None:
-                if totim is not None:
-                    try:
-                        times = self.get_times()
-                        idx = times.index(totim)
-                    except ValueError:
-                        err = (
-                            "Invalid totim value provided: obs.get_times() "
-                            "returns a list of valid times for totim\
-                         = <>"
-                        )
-                        raise ValueError(err)
-
-                d = {
-                    key: pd.Series(data[key][idx], index=[time[idx]])
-                    for key in data
-                    if key != "time" and key in keys
-                }
-            else:
-                d = {
-                    key: pd.Series(data[key], index=time)
-                    for key in data
-                    if key != "time" and key in keys
-                }
+            columns = [
+                key
+                for key in data.dtype.names
+                if key != "time" and key in keys
+            ]
+
+        # adjust for time if necessary
+        if totim is not None:
+            idx = self._get_time_index(totim)
+        if idx is not None:
+            data = data[[idx]]
+            time = [time[idx]]
 
-        # create dataframe from pd.Series dictionary
-        df = pd.DataFrame(d)
+        values = data.view(np.float64).reshape(-1, len(data.dtype.names))
+        icol = [data.dtype.names.index(key) for key in columns]
+        df = pd.DataFrame(values[:, icol], index=time, columns=columns)
 
         return df
 
@@ -371,6 +357,11 @@ class Observations:
         -------
         xarray.DataArray: (NxN) dimensions are totim, header == keys*
         """
+        if key is None and idx is None and totim is None:
+            data = _read_obs_csv(self.Obsname)
+            ncol = len(data.dtype.names)
+            return data.view(np.float64).reshape(-1, ncol)[:, 1:].copy()
+
         data = self.get_data(key=key, idx=idx, totim=totim)
         # create x-array coordinates from time and header
         totim = data.T[0][1:].astype(np.float)
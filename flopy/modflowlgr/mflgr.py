@@ -409,7 +409,9 @@ class ModflowLgr(BaseModel):
         # close the lgr control file
         f.close()
 
-    def change_model_ws(self, new_pth=None, reset_external=False):
+    def change_model_ws(
+        self, new_pth=None, reset_external=False, silent=False
+    ):
 
         """
         Change the model work space.
@@ -420,6 +422,9 @@ class ModflowLgr(BaseModel):
             Location of new model workspace.  If this path does not exist,
             it will be created. (default is None, which will be assigned to
             the present working directory).
+        silent : bool
+            Do not report the change of the model workspace (default is
+            False).
 
         Returns
         -------
@@ -432,9 +437,12 @@ class ModflowLgr(BaseModel):
             new_pth = os.getcwd()
         if not os.path.exists(new_pth):
             try:
-                sys.stdout.write(
-                    "\ncreating model workspace...\n   {}\n".format(new_pth)
-                )
+                if not silent:
+                    sys.stdout.write(
+                        "\ncreating model workspace...\n   {}\n".format(
+                            new_pth
+                        )
+                    )
                 os.makedirs(new_pth)
             except:
                 line = "\n{} not valid, workspace-folder ".format(
@@ -446,7 +454,8 @@ class ModflowLgr(BaseModel):
         old_pth = self._model_ws
         self._model_ws = new_pth
         line = "\nchanging model workspace...\n   {}\n".format(new_pth)
-        sys.stdout.write(line)
+        if not silent:
+            sys.stdout.write(line)
 
         # reset model_ws for the parent
         lpth = os.path.abspath(old_pth)
@@ -457,7 +466,7 @@ class ModflowLgr(BaseModel):
         else:
             npth = os.path.join(new_pth, rpth)
         self.parent.change_model_ws(
-            new_pth=npth, reset_external=reset_external
+            new_pth=npth, reset_external=reset_external, silent=silent
         )
         # reset model_ws for the children
         for child in self.children_models:
@@ -468,7 +477,9 @@ class ModflowLgr(BaseModel):
                 npth = new_pth
             else:
                 npth = os.path.join(new_pth, rpth)
-            child.change_model_ws(new_pth=npth, reset_external=reset_external)
+            child.change_model_ws(
+                new_pth=npth, reset_external=reset_external, silent=silent
+            )
 
     @staticmethod
     def load(
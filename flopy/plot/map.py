@@ -1,5 +1,6 @@
 import numpy as np
 from ..discretization import StructuredGrid, UnstructuredGrid
+from ..discretization.grid import CachedData
 from ..utils import geometry
 
 try:
@@ -111,6 +112,170 @@ class PlotMapView(object):
         quadmesh : matplotlib.collections.QuadMesh or
             matplotlib.collections.PatchCollection
 
+        """
+        plotarray = self._get_plotarray(a, masked_values)
+
+        if "ax" in kwargs:
+            ax = kwargs.pop("ax")
+        else:
+            ax = self.ax
+
+        if self.mg.grid_type == "structured":
+            xgrid = np.array(self.mg.xvertices)
+            ygrid = np.array(self.mg.yvertices)
+            quadmesh = ax.pcolormesh(xgrid, ygrid, plotarray)
+
+        else:
+            # cell patches are built once per grid and reused
+            quadmesh = PatchCollection(self._get_cell_patches())
+            if self.mg.grid_type == "unstructured":
+                quadmesh.set_cmap(plt.get_cmap("Dark2"))
+                quadmesh.set_edgecolor("none")
+                plotarray = plotarray[: len(quadmesh.get_paths())]
+            quadmesh.set_array(plotarray)
+
+        # set max and min
+        if "vmin" in kwargs:
+            vmin = kwargs.pop("vmin")
+        else:
+            vmin = None
+
+        if "vmax" in kwargs:
+            vmax = kwargs.pop("vmax")
+        else:
+            vmax = None
+
+        quadmesh.set_clim(vmin=vmin, vmax=vmax)
+
+        # send rest of kwargs to quadmesh
+        quadmesh.set(**kwargs)
+
+        # add collection to axis
+        ax.add_collection(quadmesh)
+
+        # set limits
+        ax.set_xlim(self.extent[0], self.extent[1])
+        ax.set_ylim(self.extent[2], self.extent[3])
+        return quadmesh
+
+    def plot_array_frames(self, arrays, masked_values=None, **kwargs):
+        """
+        Generator that plots a sequence of arrays (for example the heads
+        of every time step) as frames.  The cell collection is created by
+        plot_array() for the first array and only the cell values
+        (set_array) of the collection are updated for subsequent arrays.
+
+        Parameters
+        ----------
+        arrays : iterable of numpy.ndarray
+            Arrays to plot, each array must have the same shape.
+        masked_values : iterable of floats, ints
+            Values to mask.
+        **kwargs : dictionary
+            keyword arguments passed to plot_array() for the first array
+
+        Returns
+        -------
+        generator of matplotlib.collections.QuadMesh or
+            matplotlib.collections.PatchCollection, yielded after each
+            array is plotted
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hds = flopy.utils.HeadFile('test.hds')
+        >>> pmv = flopy.plot.PlotMapView(modelgrid=modelgrid)
+        >>> arrays = (hds.get_data(totim=t) for t in hds.get_times())
+        >>> for i, pc in enumerate(pmv.plot_array_frames(arrays)):
+        ...     plt.savefig('head_{:04d}.png'.format(i))
+
+        """
+        quadmesh = None
+        for a in arrays:
+            if quadmesh is None:
+                quadmesh = self.plot_array(
+                    a, masked_values=masked_values, **kwargs
+                )
+            else:
+                plotarray = self._get_plotarray(a, masked_values)
+                if self.mg.grid_type == "structured":
+                    plotarray = plotarray.ravel()
+                elif self.mg.grid_type == "unstructured":
+                    plotarray = plotarray[: len(quadmesh.get_paths())]
+                quadmesh.set_array(plotarray)
+            yield quadmesh
+
+    def save_array_animation(
+        self,
+        arrays,
+        filename,
+        masked_values=None,
+        fps=5,
+        dpi=None,
+        writer=None,
+        **kwargs
+    ):
+        """
+        Write an animation of a sequence of arrays to a file using
+        a matplotlib.animation writer.  Frames are produced with
+        plot_array_frames(), so the cell geometry is only built once.
+
+        Parameters
+        ----------
+        arrays : iterable of numpy.ndarray
+            Arrays to plot, each array must have the same shape.
+        filename : str
+            animation file name (for example 'heads.gif' or 'heads.mp4')
+        masked_values : iterable of floats, ints
+            Values to mask.
+        fps : int
+            frames per second (default is 5)
+        dpi : float
+            resolution of the frames (default is None, figure dpi is used)
+        writer : matplotlib.animation.AbstractMovieWriter
+            movie writer instance (default is None, PillowWriter is used for
+            .gif files and FFMpegWriter for other file types)
+        **kwargs : dictionary
+            keyword arguments passed to plot_array() for the first array
+
+        Returns
+        -------
+        quadmesh : matplotlib.collections.QuadMesh or
+            matplotlib.collections.PatchCollection
+
+        """
+        from matplotlib import animation
+
+        if writer is None:
+            if filename.lower().endswith(".gif"):
+                writer = animation.PillowWriter(fps=fps)
+            else:
+                writer = animation.FFMpegWriter(fps=fps)
+
+        quadmesh = None
+        with writer.saving(self.ax.figure, filename, dpi):
+            for quadmesh in self.plot_array_frames(
+                arrays, masked_values=masked_values, **kwargs
+            ):
+                writer.grab_frame()
+        return quadmesh
+
+    def _get_plotarray(self, a, masked_values=None):
+        """
+        Get the masked array of the layer tied to this class (self.layer)
+        that is plotted by plot_array()
+
+        Parameters
+        ----------
+        a : numpy.ndarray
+            Array to plot.
+        masked_values : iterable of floats, ints
+            Values to mask.
+
+        Returns
+        -------
+        plotarray : numpy.ma.MaskedArray
+
         """
         if not isinstance(a, np.ndarray):
             a = np.array(a)
@@ -156,56 +321,38 @@ class PlotMapView(object):
 
         # add NaN values to mask
         plotarray = np.ma.masked_where(np.isnan(plotarray), plotarray)
+        return plotarray
 
-        if "ax" in kwargs:
-            ax = kwargs.pop("ax")
-        else:
-            ax = self.ax
-
-        if self.mg.grid_type in ("structured", "vertex"):
-            xgrid = np.array(self.mg.xvertices)
-            ygrid = np.array(self.mg.yvertices)
+    def _get_cell_patches(self):
+        """
+        Get the matplotlib Polygon patches of the cells of a vertex or
+        unstructured model grid.  The patches are built once and cached on
+        the model grid, the cache is updated when the grid coordinate
+        information changes.
 
-            if self.mg.grid_type == "structured":
-                quadmesh = ax.pcolormesh(xgrid, ygrid, plotarray)
+        Returns
+        -------
+        patches : list of matplotlib.patches.Polygon
 
-            else:
+        """
+        cache_index = "plot_cell_patches"
+        if (
+            cache_index not in self.mg._cache_dict
+            or self.mg._cache_dict[cache_index].out_of_date
+        ):
+            if self.mg.grid_type == "vertex":
+                xgrid = self.mg.xvertices
+                ygrid = self.mg.yvertices
                 patches = [
                     Polygon(list(zip(xgrid[i], ygrid[i])), closed=True)
-                    for i in range(xgrid.shape[0])
+                    for i in range(len(xgrid))
                 ]
-
-                quadmesh = PatchCollection(patches)
-                quadmesh.set_array(plotarray)
-
-        else:
-            quadmesh = plotutil.plot_cvfd(
-                self.mg._vertices, self.mg._iverts, a=plotarray, ax=ax
-            )
-
-        # set max and min
-        if "vmin" in kwargs:
-            vmin = kwargs.pop("vmin")
-        else:
-            vmin = None
-
-        if "vmax" in kwargs:
-            vmax = kwargs.pop("vmax")
-        else:
-            vmax = None
-
-        quadmesh.set_clim(vmin=vmin, vmax=vmax)
-
-        # send rest of kwargs to quadmesh
-        quadmesh.set(**kwargs)
-
-        # add collection to axis
-        ax.add_collection(quadmesh)
-
-        # set limits
-        ax.set_xlim(self.extent[0], self.extent[1])
-        ax.set_ylim(self.extent[2], self.extent[3])
-        return quadmesh
+            else:
+                patches = plotutil.cvfd_to_patches(
+                    self.mg._vertices, self.mg._iverts
+                )
+            self.mg._cache_dict[cache_index] = CachedData(patches)
+        return self.mg._cache_dict[cache_index].data_nocopy
 
     def contour_array(self, a, masked_values=None, **kwargs):
         """
@@ -1083,11 +1230,14 @@ class PlotMapView(object):
 
         Parameters
         ----------
-        pl : list of rec arrays or a single rec array
+        pl : PathlineFile, tuple, list of rec arrays or a single rec array
             rec array or list of rec arrays is data returned from
             modpathfile PathlineFile get_data() or get_alldata()
             methods. Data in rec array is 'x', 'y', 'z', 'time',
-            'k', and 'particleid'.
+            'k', and 'particleid'. A (points, offsets) tuple returned
+            from the PathlineFile get_segments() method or a PathlineFile
+            can also be passed, which avoids building a rec array for
+            each pathline.
         travel_time : float or str
             travel_time is a travel time selection for the displayed
             pathlines. If a float is passed then pathlines with times
@@ -1113,9 +1263,9 @@ class PlotMapView(object):
         else:
             from matplotlib.collections import LineCollection
 
-        # make sure pathlines is a list
-        if not isinstance(pl, list):
-            pl = [pl]
+        # get all of the pathline points and the offset to the first
+        # point of each pathline
+        pts, offsets = self._get_pathline_segments(pl)
 
         if "layer" in kwargs:
             kon = kwargs.pop("layer")
@@ -1159,76 +1309,51 @@ class PlotMapView(object):
         if "colors" not in kwargs:
             kwargs["colors"] = "0.5"
 
-        linecol = []
-        markers = []
-        for p in pl:
-            if travel_time is None:
-                tp = p.copy()
-            else:
-                if isinstance(travel_time, str):
-                    if "<=" in travel_time:
-                        time = float(travel_time.replace("<=", ""))
-                        idx = p["time"] <= time
-                    elif "<" in travel_time:
-                        time = float(travel_time.replace("<", ""))
-                        idx = p["time"] < time
-                    elif ">=" in travel_time:
-                        time = float(travel_time.replace(">=", ""))
-                        idx = p["time"] >= time
-                    elif "<" in travel_time:
-                        time = float(travel_time.replace(">", ""))
-                        idx = p["time"] > time
-                    else:
-                        try:
-                            time = float(travel_time)
-                            idx = p["time"] <= time
-                        except:
-                            errmsg = (
-                                "flopy.map.plot_pathline travel_time "
-                                + "variable cannot be parsed. "
-                                + "Acceptable logical variables are , "
-                                + "<=, <, >=, and >. "
-                                + "You passed {}".format(travel_time)
-                            )
-                            raise Exception(errmsg)
-                else:
-                    time = float(travel_time)
-                    idx = p["time"] <= time
-                tp = p[idx]
+        # pathline index of each point
+        nline = offsets.size - 1
+        iline = np.repeat(np.arange(nline), np.diff(offsets))
+
+        # remove points outside of the travel time selection
+        if travel_time is not None:
+            idx = self._get_travel_time_mask(pts["time"], travel_time)
+            pts, iline = pts[idx], iline[idx]
+            nseg = np.bincount(iline, minlength=nline)
+            offsets = np.append(0, np.cumsum(nseg))
+
+        # transform data!
+        x0r, y0r = geometry.transform(
+            pts["x"],
+            pts["y"],
+            self.mg.xoffset,
+            self.mg.yoffset,
+            self.mg.angrot_radians,
+        )
+        # build polyline array
+        arr = np.ma.asarray(np.column_stack((x0r, y0r)))
+        # select based on layer
+        if kon >= 0:
+            kk = np.repeat((pts["k"] != kon).reshape(-1, 1), 2, axis=1)
+            arr = np.ma.masked_where(kk, arr)
+        active = ~np.ma.getmaskarray(arr)[:, 0]
+
+        # keep pathlines if there is some unmasked segment
+        keep = np.bincount(iline[active], minlength=nline) > 0
+        linecol = [
+            line
+            for line, ikeep in zip(np.split(arr, offsets[1:-1]), keep)
+            if ikeep
+        ]
+        if marker is not None:
+            ipos = np.arange(len(pts)) - offsets[iline]
+            idx = active & (ipos % markerevery == 0)
+            markers = np.column_stack((x0r[idx], y0r[idx]))
 
-            # transform data!
-            x0r, y0r = geometry.transform(
-                tp["x"],
-                tp["y"],
-                self.mg.xoffset,
-                self.mg.yoffset,
-                self.mg.angrot_radians,
-            )
-            # build polyline array
-            arr = np.vstack((x0r, y0r)).T
-            # select based on layer
-            if kon >= 0:
-                kk = p["k"].copy().reshape(p.shape[0], 1)
-                kk = np.repeat(kk, 2, axis=1)
-                arr = np.ma.masked_where((kk != kon), arr)
-            else:
-                arr = np.ma.asarray(arr)
-            # append line to linecol if there is some unmasked segment
-            if not arr.mask.all():
-                linecol.append(arr)
-                if not arr.mask.all():
-                    linecol.append(arr)
-                    if marker is not None:
-                        for xy in arr[::markerevery]:
-                            if not xy.mask:
-                                markers.append(xy)
         # create line collection
         lc = None
         if len(linecol) > 0:
             lc = LineCollection(linecol, **kwargs)
             ax.add_collection(lc)
             if marker is not None:
-                markers = np.array(markers)
                 ax.plot(
                     markers[:, 0],
                     markers[:, 1],
@@ -1239,6 +1364,94 @@ class PlotMapView(object):
                 )
         return lc
 
+    @staticmethod
+    def _get_pathline_segments(pl):
+        """
+        Get a single record array of pathline points and the offsets to
+        the first point of each pathline.
+
+        Parameters
+        ----------
+        pl : PathlineFile, tuple, list of rec arrays, or a single rec array
+            pathline data passed to plot_pathline()
+
+        Returns
+        -------
+        pts : np.recarray
+            points of all pathlines
+        offsets : np.ndarray
+            points of pathline n are pts[offsets[n]:offsets[n + 1]]
+
+        """
+        if hasattr(pl, "get_segments"):
+            return pl.get_segments()
+        elif isinstance(pl, tuple) and len(pl) == 2:
+            return pl[0], np.asarray(pl[1], dtype=int)
+
+        # make sure pathlines is a list
+        if not isinstance(pl, list):
+            pl = [pl]
+
+        names = ["x", "y", "time", "k"]
+        if len(pl) > 0:
+            arrays = [np.concatenate([p[name] for p in pl]) for name in names]
+        else:
+            arrays = [np.array([]) for name in names]
+        pts = np.rec.fromarrays(arrays, names=names)
+        offsets = np.append(0, np.cumsum([len(p) for p in pl])).astype(int)
+        return pts, offsets
+
+    @staticmethod
+    def _get_travel_time_mask(time, travel_time):
+        """
+        Get a boolean array of the times that are in the travel time
+        selection passed to plot_pathline() or plot_timeseries().
+
+        Parameters
+        ----------
+        time : np.ndarray
+            pathline or timeseries times
+        travel_time : float or str
+            travel time selection. Valid logical constraints are <=,
+            <, >=, and >. A float selects times less than or equal to
+            the passed time.
+
+        Returns
+        -------
+        idx : np.ndarray of bool
+
+        """
+        if isinstance(travel_time, str):
+            if "<=" in travel_time:
+                t = float(travel_time.replace("<=", ""))
+                idx = time <= t
+            elif "<" in travel_time:
+                t = float(travel_time.replace("<", ""))
+                idx = time < t
+            elif ">=" in travel_time:
+                t = float(travel_time.replace(">=", ""))
+                idx = time >= t
+            elif ">" in travel_time:
+                t = float(travel_time.replace(">", ""))
+                idx = time > t
+            else:
+                try:
+                    t = float(travel_time)
+                    idx = time <= t
+                except:
+                    errmsg = (
+                        "flopy.map.plot_pathline travel_time "
+                        + "variable cannot be parsed. "
+                        + "Acceptable logical variables are , "
+                        + "<=, <, >=, and >. "
+                        + "You passed {}".format(travel_time)
+                    )
+                    raise Exception(errmsg)
+        else:
+            t = float(travel_time)
+            idx = time <= t
+        return idx
+
     def plot_timeseries(self, ts, travel_time=None, **kwargs):
         """
         Plot the MODPATH timeseries.
@@ -1303,38 +1516,8 @@ class PlotMapView(object):
         for t in ts:
             if travel_time is None:
                 tp = t.copy()
-
             else:
-                if isinstance(travel_time, str):
-                    if "<=" in travel_time:
-                        time = float(travel_time.replace("<=", ""))
-                        idx = t["time"] <= time
-                    elif "<" in travel_time:
-                        time = float(travel_time.replace("<", ""))
-                        idx = t["time"] < time
-                    elif ">=" in travel_time:
-                        time = float(travel_time.replace(">=", ""))
-                        idx = t["time"] >= time
-                    elif "<" in travel_time:
-                        time = float(travel_time.replace(">", ""))
-                        idx = t["time"] > time
-                    else:
-                        try:
-                            time = float(travel_time)
-                            idx = t["time"] <= time
-                        except:
-                            errmsg = (
-                                "flopy.map.plot_pathline travel_time "
-                                + "variable cannot be parsed. "
-                                + "Acceptable logical variables are , "
-                                + "<=, <, >=, and >. "
-                                + "You passed {}".format(travel_time)
-                            )
-                            raise Exception(errmsg)
-                else:
-                    time = float(travel_time)
-                    idx = t["time"] <= time
-                tp = ts[idx]
+                tp = t[self._get_travel_time_mask(t["time"], travel_time)]
 
             x0r, y0r = geometry.transform(
                 tp["x"],
@@ -1348,7 +1531,7 @@ class PlotMapView(object):
             arr = np.vstack((x0r, y0r)).T
             # select based on layer
             if kon >= 0:
-                kk = t["k"].copy().reshape(t.shape[0], 1)
+                kk = tp["k"].copy().reshape(tp.shape[0], 1)
                 kk = np.repeat(kk, 2, axis=1)
                 arr = np.ma.masked_where((kk != kon), arr)
 
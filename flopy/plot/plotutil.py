@@ -2255,9 +2255,35 @@ def cvfd_to_patch_collection(verts, iverts):
         )
         raise ImportError(err_msg)
     else:
-        from matplotlib.patches import Polygon
         from matplotlib.collections import PatchCollection
 
+    pc = PatchCollection(cvfd_to_patches(verts, iverts))
+    return pc
+
+
+def cvfd_to_patches(verts, iverts):
+    """
+    Create a list of matplotlib Polygon patches from control volume
+    vertices and incidence list
+
+    Parameters
+    ----------
+    verts : ndarray
+        2d array of x and y points.
+    iverts : list of lists
+        should be of len(ncells) with a list of vertex numbers for each cell
+
+    Returns
+    -------
+    ptchs : list of matplotlib.patches.Polygon
+
+    """
+    if plt is None:
+        err_msg = "matplotlib must be installed to use cvfd_to_patches()"
+        raise ImportError(err_msg)
+    else:
+        from matplotlib.patches import Polygon
+
     ptchs = []
     for ivertlist in iverts:
         points = []
@@ -2268,8 +2294,7 @@ def cvfd_to_patch_collection(verts, iverts):
             iv = ivertlist[0]
             points.append((verts[iv, 0], verts[iv, 1]))
         ptchs.append(Polygon(points))
-    pc = PatchCollection(ptchs)
-    return pc
+    return ptchs
 
 
 def plot_cvfd(
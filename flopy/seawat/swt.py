@@ -302,19 +302,21 @@ class Seawat(BaseModel):
         #    self.lst.file_name[i] = self.name + '.' + self.lst.extension[i]
         # return
 
-    def change_model_ws(self, new_pth=None, reset_external=False):
+    def change_model_ws(
+        self, new_pth=None, reset_external=False, silent=False
+    ):
         # if hasattr(self,"_mf"):
         if self._mf is not None:
             self._mf.change_model_ws(
-                new_pth=new_pth, reset_external=reset_external
+                new_pth=new_pth, reset_external=reset_external, silent=silent
             )
         # if hasattr(self,"_mt"):
         if self._mt is not None:
             self._mt.change_model_ws(
-                new_pth=new_pth, reset_external=reset_external
+                new_pth=new_pth, reset_external=reset_external, silent=silent
             )
         super(Seawat, self).change_model_ws(
-            new_pth=new_pth, reset_external=reset_external
+            new_pth=new_pth, reset_external=reset_external, silent=silent
         )
 
     def write_name_file(self):
@@ -71,3 +71,4 @@ from .mtlistfile import MtListBudget
 from .optionblock import OptionBlock
 from .rasters import Raster
 from .gridintersect import GridIntersect, ModflowGridIndices
+from .runtelemetry import RunTelemetry
@@ -6,6 +6,7 @@ except ImportError:
     plt = None
 
 from .geometry import transform
+from ..discretization.grid import CachedData
 
 try:
     from shapely.geometry import (
@@ -69,6 +70,32 @@ def parse_shapely_ix_result(collection, ix_result, shptyps=None):
     return collection
 
 
+class _GridShapeIndex(object):
+    """STR-tree of the grid cells cached on a model grid. The STR-tree is
+    not pickled (shapely drops the cell names), so it is built again after
+    the grid is copied or sent to another process."""
+
+    def __init__(self, strtree=None):
+        self.strtree = strtree
+
+    def __getstate__(self):
+        return {"strtree": None}
+
+
+# GridIntersect object of a process in the intersect_shapes() pool
+_pool_ix = None
+
+
+def _init_intersect_pool(mfgrid, method, rtree):
+    global _pool_ix
+    _pool_ix = GridIntersect(mfgrid, method=method, rtree=rtree)
+
+
+def _intersect_pool_chunk(args):
+    shapes, kwargs = args
+    return [_pool_ix._intersect_shape(shp, **kwargs) for shp in shapes]
+
+
 class GridIntersect:
     """Class for intersecting shapely shapes (Point, Linestring, Polygon, or
     their Multi variants) with MODFLOW grids. Contains optimized search
@@ -132,9 +159,9 @@ class GridIntersect:
             # set method to get gridshapes depending on grid type
             self._set_method_get_gridshapes()
 
-            # build STR-tree if specified
+            # get STR-tree if specified
             if self.rtree:
-                self.strtree = STRtree(self._get_gridshapes())
+                self.strtree = self._get_grid_strtree()
 
             # set interesection methods
             self.intersect_point = self._intersect_point_shapely
@@ -155,6 +182,27 @@ class GridIntersect:
                 )
             )
 
+    def _get_grid_strtree(self):
+        """internal method, get the STR-tree of the grid cells. The STR-tree
+        is cached on the grid and shared by all GridIntersect objects for the
+        grid, it is only built again if the grid geometry changes.
+
+        Returns
+        -------
+        STRtree
+            STR-tree of the grid cell polygons
+        """
+        cache_index = "gridintersect_strtree"
+        cache = self.mfgrid._cache_dict.get(cache_index)
+        if (
+            cache is None
+            or cache.out_of_date
+            or cache.data_nocopy.strtree is None
+        ):
+            index = _GridShapeIndex(STRtree(self._get_gridshapes()))
+            self.mfgrid._cache_dict[cache_index] = CachedData(index)
+        return self.mfgrid._cache_dict[cache_index].data_nocopy.strtree
+
     def _set_method_get_gridshapes(self):
         """internal method, set self._get_gridshapes to the certain method for
         obtaining gridcells."""
@@ -375,7 +423,7 @@ class GridIntersect:
         isectshp = []
         cellids = []
         vertices = []
-        parsed_points = []  # for keeping track of points
+        parsed_points = set()  # for keeping track of points
 
         # loop over cells returned by filtered spatial query
         for r in qfiltered:
@@ -394,7 +442,7 @@ class GridIntersect:
                 # avoid returning multiple cells for points on boundaries
                 if verts in parsed_points:
                     continue
-                parsed_points.append(verts)
+                parsed_points.add(verts)
                 cell_shps.append(c)  # collect only new points
                 cell_verts.append(verts)
             # if any new ix found
@@ -577,6 +625,175 @@ class GridIntersect:
         rec.cellids = cids
         return rec
 
+    def _intersect_shape(self, shp, **kwargs):
+        """internal method, intersect a shape with the intersection method
+        for its geometry type."""
+        if shp.geom_type in ("Point", "MultiPoint"):
+            return self.intersect_point(shp, **kwargs)
+        elif shp.geom_type in ("LineString", "MultiLineString"):
+            return self.intersect_linestring(shp, **kwargs)
+        elif shp.geom_type in ("Polygon", "MultiPolygon"):
+            return self.intersect_polygon(shp, **kwargs)
+        else:
+            raise ValueError(
+                "Geometry type '{}' not supported!".format(shp.geom_type)
+            )
+
+    def intersect_shapes(
+        self, shapes, processes=None, chunksize=None, **kwargs
+    ):
+        """Intersect a sequence of shapes with the grid and return the
+        results in a single record array.
+
+        Parameters
+        ----------
+        shapes : sequence of shapely.geometry
+            Points, LineStrings or Polygons (or their Multi variants). All
+            shapes must have the same basic geometry type.
+        processes : int, optional
+            number of processes used to intersect the shapes. Default is
+            None, which intersects the shapes in this process.
+        chunksize : int, optional
+            number of shapes sent to a process at a time. Default is None,
+            which splits the shapes into four chunks per process.
+        kwargs : keyword arguments
+            passed to intersect_point(), intersect_linestring() or
+            intersect_polygon()
+
+        Returns
+        -------
+        numpy.recarray
+            a record array with the index of the shape in shapes
+            ('shapeidx') and the fields returned by the intersection
+            method for each intersection
+        """
+        shapes = list(shapes)
+        types = set(shp.geom_type.replace("Multi", "") for shp in shapes)
+        if len(types) > 1:
+            raise ValueError(
+                "All shapes must have the same geometry type, "
+                "got {}".format(", ".join(sorted(types)))
+            )
+
+        if processes is None or processes < 2 or len(shapes) < 2:
+            results = [self._intersect_shape(shp, **kwargs) for shp in shapes]
+        else:
+            import multiprocessing as mp
+
+            if chunksize is None:
+                chunksize = int(np.ceil(len(shapes) / (4.0 * processes)))
+            chunks = [
+                (shapes[i0 : i0 + chunksize], kwargs)
+                for i0 in range(0, len(shapes), chunksize)
+            ]
+            # the STR-tree cached on the grid is reused by forked processes
+            pool = mp.Pool(
+                processes,
+                initializer=_init_intersect_pool,
+                initargs=(self.mfgrid, self.method, self.rtree),
+            )
+            try:
+                results = []
+                for r in pool.imap(_intersect_pool_chunk, chunks):
+                    results += r
+            finally:
+                pool.close()
+                pool.join()
+
+        # concatenate the results
+        if len(results) > 0:
+            names = results[0].dtype.names
+            formats = [results[0].dtype[name] for name in names]
+        else:
+            names, formats = [], []
+        nrec = [len(r) for r in results]
+        rec = np.recarray(
+            sum(nrec),
+            names=["shapeidx"] + list(names),
+            formats=[int] + formats,
+        )
+        rec.shapeidx = np.repeat(np.arange(len(results)), nrec)
+        for name in names:
+            for i0, r in zip(np.cumsum(nrec) - nrec, results):
+                rec[name][i0 : i0 + len(r)] = r[name]
+        return rec
+
+    def intersect_points(self, x, y):
+        """Find the grid cells that contain an array of points.
+
+        Points on the boundary between cells are assigned to the cell with
+        the lowest cell id.
+
+        Parameters
+        ----------
+        x : array_like
+            x-coordinates of the points
+        y : array_like
+            y-coordinates of the points
+
+        Returns
+        -------
+        cellids : numpy.ndarray or tuple of numpy.ndarray
+            for structured grids a tuple with arrays of the row and column
+            of each point, otherwise an array with the cell id of each
+            point. Points outside of the grid have a cell id (or row and
+            column) of -1.
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.shape != y.shape:
+            raise ValueError("x and y must have the same number of points")
+
+        if self.method == "structured":
+            return self._intersect_points_structured(x, y)
+
+        # the spatial index of the grid is in local coordinates, the cells
+        # of structured grids are in real-world coordinates
+        if self.mfgrid.grid_type == "structured":
+            x, y = self.mfgrid.get_local_coords(x, y)
+        nodes = self.mfgrid.get_spatial_index().query_points(x, y)
+        if self.mfgrid.grid_type == "structured":
+            i, j = np.divmod(nodes, self.mfgrid.ncol)
+            i[nodes < 0] = -1
+            j[nodes < 0] = -1
+            return i, j
+        return nodes
+
+    def _intersect_points_structured(self, x, y):
+        """internal method, find the row and column of an array of points
+        from the cell edges of a structured grid.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            row and column of each point, -1 for points outside the grid
+        """
+        # if grid is rotated or offset transform points to local coords
+        if (
+            self.mfgrid.angrot != 0.0
+            or self.mfgrid.xoffset != 0.0
+            or self.mfgrid.yoffset != 0.0
+        ):
+            x, y = transform(
+                x,
+                y,
+                self.mfgrid.xoffset,
+                self.mfgrid.yoffset,
+                self.mfgrid.angrot_radians,
+                inverse=True,
+            )
+        Xe, Ye = self.mfgrid.xyedges
+        # x edges increase and y edges decrease, points on a cell edge
+        # are in the cell with the lowest column or row
+        j = np.searchsorted(Xe, x, side="left") - 1
+        j[x == Xe[0]] = 0
+        i = np.searchsorted(-Ye, -y, side="left") - 1
+        i[y == Ye[0]] = 0
+        outside = (x < Xe[0]) | (x > Xe[-1]) | (y > Ye[0]) | (y < Ye[-1])
+        i[outside] = -1
+        j[outside] = -1
+        return i, j
+
     def _intersect_point_structured(self, shp):
         """intersection method for intersecting points with structured grids.
 
@@ -640,13 +857,20 @@ class GridIntersect:
         # remove duplicates
         tempnodes = []
         tempshapes = []
+        nodeidx = {}
         for node, ixs in zip(nodelist, ixshapes):
-            if node not in tempnodes:
+            if node not in nodeidx:
+                nodeidx[node] = len(tempnodes)
                 tempnodes.append(node)
                 tempshapes.append(ixs)
             else:
-                # TODO: not sure if this is correct
-                tempshapes[-1] = MultiPoint([tempshapes[-1], ixs])
+                # combine points in the same cell
+                idx = nodeidx[node]
+                if tempshapes[idx].geom_type == "MultiPoint":
+                    pts = list(tempshapes[idx].geoms) + [ixs]
+                else:
+                    pts = [tempshapes[idx], ixs]
+                tempshapes[idx] = MultiPoint(pts)
 
         ixshapes = tempshapes
         nodelist = tempnodes
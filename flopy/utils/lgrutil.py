@@ -231,15 +231,31 @@ class Lgr(object):
             idomain array for the child model
 
         """
+        kp, ip, jp = self._get_parent_index_arrays()
+        parent_idomain = self.idomain[
+            kp[:, None, None], ip[None, :, None], jp[None, None, :]
+        ]
         idomain = np.ones((self.nlay, self.nrow, self.ncol), dtype=np.int)
-        for kc in range(self.nlay):
-            for ic in range(self.nrow):
-                for jc in range(self.ncol):
-                    kp, ip, jp = self.get_parent_indices(kc, ic, jc)
-                    if self.idomain[kp, ip, jp] == 1:
-                        idomain[kc, ic, jc] = 0
+        idomain[parent_idomain == 1] = 0
         return idomain
 
+    def _get_parent_index_arrays(self):
+        """
+        Return arrays with the zero-based parent layer of each child layer,
+        the parent row of each child row and the parent column of each
+        child column.
+
+        """
+        kp = np.zeros(self.nlay, dtype=int)
+        kpc = np.repeat(
+            np.arange(self.nplbeg, self.nplend + 1),
+            self.ncppl[self.nplbeg : self.nplend + 1],
+        )
+        kp[: kpc.shape[0]] = kpc
+        ip = self.nprbeg + np.arange(self.nrow) // self.ncpp
+        jp = self.npcbeg + np.arange(self.ncol) // self.ncpp
+        return kp, ip, jp
+
     def get_parent_indices(self, kc, ic, jc):
         """
         Method returns the parent cell indices for this child.
@@ -318,117 +334,203 @@ class Lgr(object):
                 list of connections between parent and child
 
         """
+        exg = self.get_exchange_recarray(angldegx=angldegx, cdist=cdist)
+        return [list(r) for r in exg.tolist()]
 
-        exglist = []
-        nlayc = self.nlay
-        nrowc = self.nrow
-        ncolc = self.ncol
-        delrc = self.delr
-        delcc = self.delc
-        delrp = self.delrp
-        delcp = self.delcp
-        topp = self.topp
-        botp = self.botmp
-        topc = self.top
-        botc = self.botm
+    def get_exchange_recarray(
+        self, angldegx=False, cdist=False, idomainp=None
+    ):
+        """
+        Get a record array of the parent/child connections. The connections
+        are found with array operations on the faces of the child cells
+        that are on the faces of their parent cells.
+
+        Parameters
+        ----------
+        angldegx : bool
+            add the angle of the connections (angldegx)
+        cdist : bool
+            add the distance between the cell centers of the connections
+            (cdist)
+        idomainp : ndarray
+            optional parent idomain used to find the active parent cells,
+            zero for the parent cells of all child grids of the parent.
+            Default is the idomain of this Lgr object.
+
+        Returns
+        -------
+            exg : np.recarray
+                record array with fields cellidm1 (parent cell), cellidm2
+                (child cell), ihc, cl1, cl2, hwva and optionally angldegx
+                and cdist
+
+        """
+        if idomainp is None:
+            idomainp = self.idomain
+        cidomain = self.get_idomain()
+        kpc, ipc, jpc = self._get_parent_index_arrays()
+        kc_all = np.arange(self.nlay)
+        ic_all = np.arange(self.nrow)
+        jc_all = np.arange(self.ncol)
+
+        # child cells on the faces of their parent cells for each direction
+        # of the connection, in the order of get_parent_connections()
+        faces = [
+            (-1, kc_all, ic_all, jc_all[jc_all % self.ncpp == 0]),
+            (1, kc_all, ic_all, jc_all[(jc_all + 1) % self.ncpp == 0]),
+            (2, kc_all, ic_all[ic_all % self.ncpp == 0], jc_all),
+            (-2, kc_all, ic_all[(ic_all + 1) % self.ncpp == 0], jc_all),
+            (-3, kc_all[kc_all + 1 == self.ibcl[kpc]], ic_all, jc_all),
+        ]
+        offsets = {
+            -1: (0, 0, -1),
+            1: (0, 0, 1),
+            2: (0, -1, 0),
+            -2: (0, 1, 0),
+            -3: (1, 0, 0),
+        }
+        conn = []
+        for iorder, (idir, kcs, ics, jcs) in enumerate(faces):
+            kc, ic, jc = [
+                a.ravel() for a in np.meshgrid(kcs, ics, jcs, indexing="ij")
+            ]
+            dk, di, dj = offsets[idir]
+            kp = kpc[kc] + dk
+            ip = ipc[ic] + di
+            jp = jpc[jc] + dj
+            inside = (
+                (kp < self.nlayp)
+                & (ip >= 0)
+                & (ip < self.nrowp)
+                & (jp >= 0)
+                & (jp < self.ncolp)
+            )
+            kc, ic, jc = kc[inside], ic[inside], jc[inside]
+            kp, ip, jp = kp[inside], ip[inside], jp[inside]
+            active = (idomainp[kp, ip, jp] != 0) & (cidomain[kc, ic, jc] != 0)
+            iface = np.full(kc.shape, iorder)
+            conn.append([a[active] for a in (kc, ic, jc, kp, ip, jp, iface)])
+        kc, ic, jc, kp, ip, jp, iface = [np.concatenate(a) for a in zip(*conn)]
+
+        # sort by child cell and by direction
+        node = (kc * self.nrow + ic) * self.ncol + jc
+        order = np.lexsort((iface, node))
+        idir = np.array([face[0] for face in faces])[iface]
+        kc, ic, jc, kp, ip, jp, idir = [
+            a[order] for a in (kc, ic, jc, kp, ip, jp, idir)
+        ]
+        vert = np.abs(idir) == 3
+        xdir = np.abs(idir) == 1
+        ydir = np.abs(idir) == 2
+
+        # horizontal or vertical connection
+        # 1 if a child cell horizontally connected to a parent cell
+        # 2 if more than one child cells horizontally connected to parent
+        #   cell
+        # 0 if a vertical connection
+        ihc = np.where(self.ncppl[kp] > 1, 2, 1)
+        ihc[vert] = 0
+
+        # cell tops and bottoms
+        btp = self.botmp[kp, ip, jp]
+        tpp = np.where(
+            kp > 0,
+            self.botmp[np.maximum(kp - 1, 0), ip, jp],
+            self.topp[ip, jp],
+        )
+        btc = self.botm[kc, ic, jc]
+        tpc = np.where(
+            kc > 0, self.botm[np.maximum(kc - 1, 0), ic, jc], self.top[ic, jc]
+        )
+
+        delrc = self.delr[jc]
+        delcc = self.delc[ic]
+        cl1 = np.where(
+            vert,
+            0.5 * (tpp - btp),
+            np.where(xdir, 0.5 * self.delrp[jp], 0.5 * self.delcp[ip]),
+        )
+        cl2 = np.where(
+            vert, 0.5 * (tpc - btc), np.where(xdir, 0.5 * delrc, 0.5 * delcc)
+        )
+        hwva = np.where(vert, delrc * delcc, np.where(xdir, delcc, delrc))
+
+        names = ["cellidm1", "cellidm2", "ihc", "cl1", "cl2", "hwva"]
+        formats = [object, object, int, float, float, float]
+        if angldegx:
+            names.append("angldegx")
+            formats.append(float)
+        if cdist:
+            names.append("cdist")
+            formats.append(float)
+        exg = np.recarray(kc.shape[0], names=names, formats=formats)
+        exg["cellidm1"] = list(zip(kp.tolist(), ip.tolist(), jp.tolist()))
+        exg["cellidm2"] = list(zip(kc.tolist(), ic.tolist(), jc.tolist()))
+        exg["ihc"] = ihc
+        exg["cl1"] = cl1
+        exg["cl2"] = cl2
+        exg["hwva"] = hwva
+
+        if angldegx:
+            angle = np.full(kc.shape[0], 180.0)  # -x, west
+            angle[idir == 2] = 270.0  # -y, south
+            angle[idir == -1] = 0.0  # +x, east
+            angle[idir == -2] = 90.0  # +y, north
+            exg["angldegx"] = angle
 
         if cdist:
-            # child xy meshgrid
-            xc = np.add.accumulate(delrc) - 0.5 * delrc
-            Ly = np.add.reduce(delcc)
-            yc = Ly - (np.add.accumulate(delcc) - 0.5 * delcc)
+            # child xy cell centers
+            xc = np.add.accumulate(self.delr) - 0.5 * self.delr
+            Ly = np.add.reduce(self.delc)
+            yc = Ly - (np.add.accumulate(self.delc) - 0.5 * self.delc)
             xc += self.xll
             yc += self.yll
-            xc, yc = np.meshgrid(xc, yc)
-
-            # parent xy meshgrid
-            xp = np.add.accumulate(delrp) - 0.5 * delrp
-            Ly = np.add.reduce(delcp)
-            yp = Ly - (np.add.accumulate(delcp) - 0.5 * delcp)
             xc += self.xllp
             yc += self.yllp
-            xp, yp = np.meshgrid(xp, yp)
 
-        cidomain = self.get_idomain()
-
-        for kc in range(nlayc):
-            for ic in range(nrowc):
-                for jc in range(ncolc):
-                    plist = self.get_parent_connections(kc, ic, jc)
-                    for (kp, ip, jp), idir in plist:
-
-                        if cidomain[kc, ic, jc] == 0:
-                            continue
-
-                        # horizontal or vertical connection
-                        # 1 if a child cell horizontally connected to a parent
-                        #   cell
-                        # 2 if more than one child cells horizontally connected
-                        #   to parent cell
-                        # 0 if a vertical connection
-
-                        ihc = 1
-                        if self.ncppl[kp] > 1:
-                            ihc = 2
-                        if abs(idir) == 3:
-                            ihc = 0
-
-                        # angldegx
-                        angle = None
-                        if angldegx:
-                            angle = 180.0  # -x, west
-                            if idir == 2:
-                                angle = 270.0  # -y, south
-                            elif idir == -1:
-                                angle = 0.0  # +x, east
-                            elif idir == -2:
-                                angle = 90.0  # +y, north
-
-                        # vertical connection
-                        cl1 = None
-                        cl2 = None
-                        hwva = None
-
-                        tpp = topp[ip, jp]
-                        btp = botp[kp, ip, jp]
-                        if kp > 0:
-                            tpp = botp[kp - 1, ip, jp]
-
-                        tpc = topc[ic, jc]
-                        btc = botc[kc, ic, jc]
-                        if kc > 0:
-                            tpc = botc[kc - 1, ic, jc]
-
-                        if ihc == 0:
-                            cl1 = 0.5 * (tpp - btp)
-                            cl2 = 0.5 * (tpc - btc)
-                            hwva = delrc[jc] * delcc[ic]
-                        else:
-                            if abs(idir) == 1:
-                                cl1 = 0.5 * delrp[jp]
-                                cl2 = 0.5 * delrc[jc]
-                                hwva = delcc[ic]
-                            elif abs(idir) == 2:
-                                cl1 = 0.5 * delcp[ip]
-                                cl2 = 0.5 * delcc[ic]
-                                hwva = delrc[jc]
-
-                        # connection distance
-                        cd = None
-                        if cdist:
-                            if abs(idir) == 3:
-                                cd = cl1 + cl2
-                            else:
-                                x1 = xc[ic, jc]
-                                y1 = yc[ic, jc]
-                                x2 = xp[ip, jp]
-                                y2 = yp[ip, jp]
-                                cd = np.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
-
-                        exg = [(kp, ip, jp), (kc, ic, jc), ihc, cl1, cl2, hwva]
-                        if angldegx:
-                            exg.append(angle)
-                        if cdist:
-                            exg.append(cd)
-                        exglist.append(exg)
-        return exglist
+            # parent xy cell centers
+            xp = np.add.accumulate(self.delrp) - 0.5 * self.delrp
+            Ly = np.add.reduce(self.delcp)
+            yp = Ly - (np.add.accumulate(self.delcp) - 0.5 * self.delcp)
+
+            cd = np.sqrt((xc[jc] - xp[jp]) ** 2 + (yc[ic] - yp[ip]) ** 2)
+            cd[vert] = cl1[vert] + cl2[vert]
+            exg["cdist"] = cd
+
+        return exg
+
+
+def get_exchange_recarrays(lgrs, angldegx=False, cdist=False):
+    """
+    Get the parent/child connections of several child grids of the same
+    parent grid. Parent cells that are in the area of any of the child
+    grids are not connected to a child grid.
+
+    Parameters
+    ----------
+    lgrs : list of Lgr
+        Lgr objects of the child grids
+    angldegx : bool
+        add the angle of the connections (angldegx)
+    cdist : bool
+        add the distance between the cell centers of the connections
+        (cdist)
+
+    Returns
+    -------
+        list of np.recarray
+            exchange data of each child grid, see
+            Lgr.get_exchange_recarray()
+
+    """
+    idomainp = lgrs[0].idomain
+    for lgr in lgrs[1:]:
+        if lgr.idomain.shape != idomainp.shape:
+            raise ValueError("all child grids must have the same parent grid")
+        idomainp = np.where(lgr.idomain == 0, 0, idomainp)
+    return [
+        lgr.get_exchange_recarray(
+            angldegx=angldegx, cdist=cdist, idomainp=idomainp
+        )
+        for lgr in lgrs
+    ]
@@ -7,6 +7,8 @@ important classes that can be accessed by the user.
 
 """
 
+import os
+import json
 import itertools
 import collections
 import warnings
@@ -15,10 +17,331 @@ import numpy as np
 from numpy.lib.recfunctions import append_fields, stack_arrays
 
 from ..utils.flopy_io import loadtxt
-from ..utils.recarray_utils import ra_slice
 
 
-class PathlineFile:
+def _concatenate_ranges(starts, stops):
+    """
+    Concatenate the integer ranges starts[n]:stops[n] into a single array.
+
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    counts = np.asarray(stops, dtype=np.int64) - starts
+    shift = starts - np.cumsum(counts) + counts
+    return np.arange(counts.sum(), dtype=np.int64) + np.repeat(shift, counts)
+
+
+def _get_cell_keys(cells, shape):
+    """
+    Combine the (k, i, j) or (node,) columns of cells into a single integer
+    key using the shape of the index.
+
+    """
+    keys = np.zeros(cells.shape[0], dtype=np.int64)
+    for n in range(cells.shape[1]):
+        keys = keys * shape[n] + cells[:, n]
+    return keys
+
+
+def _build_cell_index(data, names):
+    """
+    Build a cell index for the (k, i, j) or (node,) columns names of data.
+
+    Returns
+    -------
+    index : tuple
+        shape of the index, the sorted cell keys, and the rows of data in
+        cell key order.
+
+    """
+    cells = np.column_stack([data[name] for name in names]).astype(np.int64)
+    if cells.shape[0] > 0:
+        shape = cells.max(axis=0) + 1
+    else:
+        shape = np.ones(len(names), dtype=np.int64)
+    keys = _get_cell_keys(cells, shape)
+    order = np.argsort(keys, kind="stable")
+    return shape, keys[order], order
+
+
+def _find_cell_rows(index, dest_cells):
+    """
+    Get the sorted rows of data in the cell index that are in dest_cells.
+
+    """
+    shape, keys, order = index
+    dest_cells = np.array(dest_cells)
+    if dest_cells.dtype.names is not None:
+        dest_cells = np.column_stack(
+            [dest_cells[name] for name in dest_cells.dtype.names]
+        )
+    cells = dest_cells.astype(np.int64).reshape(-1, len(shape))
+
+    # cells outside of the index cannot be in data
+    valid = np.all((cells >= 0) & (cells < shape), axis=1)
+    dest_keys = np.unique(_get_cell_keys(cells[valid], shape))
+    rows = _concatenate_ranges(
+        np.searchsorted(keys, dest_keys, side="left"),
+        np.searchsorted(keys, dest_keys, side="right"),
+    )
+    return np.sort(order[rows])
+
+
+class _ModpathFile(object):
+    """
+    Chunked, out-of-core access to the data in a MODPATH output file.
+
+    Subclasses set kijnames and _dest_by_particle and define the version,
+    skiprows, and dtype attributes.
+
+    """
+
+    # destination cell filters select complete particles (True) or
+    # only the records in the destination cells (False)
+    _dest_by_particle = True
+
+    def _read_chunks(self, chunksize):
+        """
+           Read the records in the file in chunks of chunksize records.
+        """
+        f = open(self.fname, "r")
+        for n in range(self.skiprows):
+            f.readline()
+        while True:
+            lines = list(itertools.islice(f, chunksize))
+            if len(lines) < 1:
+                break
+            yield np.loadtxt(lines, dtype=self.dtype, ndmin=1)
+        f.close()
+
+    def _iter_chunks(self, chunksize, cache=None):
+        """
+           Iterate over chunks of zero-based records from the file or
+           from a columnar cache.
+        """
+        if cache is not None:
+            columns = self.get_cache(cache)
+            if columns is None:
+                self.write_cache(cache, chunksize=chunksize)
+                columns = self.get_cache(cache)
+            dtype = np.dtype(
+                [(name, columns[name].dtype) for name in columns.keys()]
+            )
+            nrec = columns[dtype.names[0]].shape[0]
+            for i0 in range(0, nrec, chunksize):
+                i1 = min(i0 + chunksize, nrec)
+                chunk = np.empty(i1 - i0, dtype=dtype)
+                for name in dtype.names:
+                    chunk[name] = columns[name][i0:i1]
+                yield chunk
+        else:
+            for chunk in self._read_chunks(chunksize):
+                # convert layer, row, and column indices; particle id and
+                # group; and line segment indices to zero-based
+                for n in self.kijnames:
+                    if n in chunk.dtype.names:
+                        chunk[n] -= 1
+                yield chunk
+
+    def _get_dest_cell_names(self):
+        if self.version < 7:
+            return ["k", "i", "j"]
+        else:
+            return ["node"]
+
+    def iter_data(
+        self,
+        chunksize=100000,
+        partid=None,
+        particlegroup=None,
+        time_range=None,
+        dest_cells=None,
+        cache=None,
+    ):
+        """
+        Iterate over the data in the file in chunks of records without
+        loading the whole file.
+
+        Parameters
+        ----------
+        chunksize : int
+            Number of records read from the file at a time. The chunks
+            that are returned can be smaller than chunksize if filters
+            are specified. (default is 100000)
+        partid : int or list of ints
+            Zero-based particle ids of the records to return. Default is
+            None (all particles).
+        particlegroup : int or list of ints
+            Zero-based particle groups of the records to return. Default is
+            None (all particle groups).
+        time_range : tuple of floats
+            (tmin, tmax) of the records to return. tmin or tmax can be
+            None. Default is None (all times).
+        dest_cells : list or array of tuples
+            (k, i, j) or (node,) of destination cells (zero-based). For
+            pathline and timeseries files all records for particles that
+            are in dest_cells are returned, which requires an additional
+            pass through the data. For endpoint files the records with
+            final k,i,j (or node) in dest_cells are returned. Default is
+            None.
+        cache : str
+            Directory with a columnar binary cache of the file written by
+            write_cache(). The cache is written if it does not exist or is
+            out of date, and the data are read from memory-mapped cache
+            files. Default is None (read the data from the file).
+
+        Returns
+        -------
+        chunks : generator of numpy record arrays
+            Zero-based records in the file.
+
+        Examples
+        --------
+
+        >>> import flopy
+        >>> pthobj = flopy.utils.PathlineFile('model.mppth', load_data=False)
+        >>> for chunk in pthobj.iter_data(particlegroup=0,
+        ...                               time_range=(0., 3650.)):
+        ...     print(chunk.shape)
+
+        """
+        if partid is not None:
+            partid = np.atleast_1d(partid)
+        if particlegroup is not None:
+            particlegroup = np.atleast_1d(particlegroup)
+        names = self._get_dest_cell_names()
+
+        # find the particles that are in the destination cells
+        if dest_cells is not None and self._dest_by_particle:
+            pids = [np.array([], dtype=np.int32)]
+            for chunk in self._iter_chunks(chunksize, cache=cache):
+                rows = _find_cell_rows(
+                    _build_cell_index(chunk, names), dest_cells
+                )
+                pids.append(np.unique(chunk["particleid"][rows]))
+            pids = np.unique(np.concatenate(pids))
+            if partid is None:
+                partid = pids
+            else:
+                partid = np.intersect1d(partid, pids)
+
+        for chunk in self._iter_chunks(chunksize, cache=cache):
+            idx = np.ones(chunk.shape[0], dtype=bool)
+            if partid is not None:
+                idx &= np.in1d(chunk["particleid"], partid)
+            if particlegroup is not None:
+                idx &= np.in1d(chunk["particlegroup"], particlegroup)
+            if time_range is not None:
+                tmin, tmax = time_range
+                if tmin is not None:
+                    idx &= chunk["time"] >= tmin
+                if tmax is not None:
+                    idx &= chunk["time"] <= tmax
+            if dest_cells is not None and not self._dest_by_particle:
+                isdest = np.zeros(chunk.shape[0], dtype=bool)
+                isdest[
+                    _find_cell_rows(
+                        _build_cell_index(chunk, names), dest_cells
+                    )
+                ] = True
+                idx &= isdest
+            if idx.all():
+                yield chunk.view(np.recarray)
+            elif idx.any():
+                yield chunk[idx].view(np.recarray)
+
+    def write_cache(self, cachedir, chunksize=100000):
+        """
+        Convert the file to a columnar binary cache that can be memory
+        mapped. The file is read in chunks of records and one binary file
+        is written for each column of the zero-based data.
+
+        Parameters
+        ----------
+        cachedir : str
+            Directory for the cache files
+        chunksize : int
+            Number of records read from the file at a time.
+            (default is 100000)
+
+        """
+        if not os.path.isdir(cachedir):
+            os.makedirs(cachedir)
+        files = None
+        nrec = 0
+        for chunk in self._iter_chunks(chunksize):
+            if files is None:
+                dtype = chunk.dtype
+                files = [
+                    open(os.path.join(cachedir, name + ".bin"), "wb")
+                    for name in dtype.names
+                ]
+            for name, f in zip(dtype.names, files):
+                chunk[name].tofile(f)
+            nrec += chunk.shape[0]
+        if files is None:
+            dtype = self.dtype
+            files = []
+        for f in files:
+            f.close()
+
+        # write the cache metadata last so an incomplete cache is not used
+        stat = os.stat(self.fname)
+        meta = {
+            "source": os.path.abspath(self.fname),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "nrec": nrec,
+            "columns": [[name, dtype[name].str] for name in dtype.names],
+        }
+        with open(os.path.join(cachedir, "cache.json"), "w") as f:
+            json.dump(meta, f, indent=1)
+        return
+
+    def get_cache(self, cachedir):
+        """
+        Get memory-mapped columns from a cache written by write_cache().
+
+        Parameters
+        ----------
+        cachedir : str
+            Directory with the cache files
+
+        Returns
+        -------
+        columns : OrderedDict or None
+            numpy memmap (read-only) of each column of the zero-based data.
+            None is returned if the cache does not exist or if the file has
+            changed since the cache was written.
+
+        """
+        fpth = os.path.join(cachedir, "cache.json")
+        if not os.path.isfile(fpth):
+            return None
+        with open(fpth) as f:
+            meta = json.load(f)
+        stat = os.stat(self.fname)
+        if (
+            meta["size"] != stat.st_size
+            or meta["mtime"] != stat.st_mtime
+            or meta["source"] != os.path.abspath(self.fname)
+        ):
+            return None
+        nrec = meta["nrec"]
+        columns = collections.OrderedDict()
+        for name, dtype in meta["columns"]:
+            if nrec > 0:
+                columns[name] = np.memmap(
+                    os.path.join(cachedir, name + ".bin"),
+                    dtype=np.dtype(dtype),
+                    mode="r",
+                    shape=(nrec,),
+                )
+            else:
+                columns[name] = np.zeros(0, dtype=np.dtype(dtype))
+        return columns
+
+
+class PathlineFile(_ModpathFile):
     """
     PathlineFile Class.
 
@@ -28,6 +351,10 @@ class PathlineFile:
         Name of the pathline file
     verbose : bool
         Write information to the screen.  Default is False.
+    load_data : bool
+        Load the data in the file. If False, only the file header is read
+        and the data can be accessed in chunks with iter_data().
+        Default is True.
 
     Examples
     --------
@@ -50,7 +377,7 @@ class PathlineFile:
         "sequencenumber",
     ]
 
-    def __init__(self, filename, verbose=False):
+    def __init__(self, filename, verbose=False, load_data=True):
         """
         Class constructor.
 
@@ -64,6 +391,16 @@ class PathlineFile:
         # set output dtype
         self.outdtype = self._get_outdtype()
 
+        # only set the data dtype if the data are accessed with iter_data()
+        if not load_data:
+            if self.version == 7:
+                self.dtype = self._get_mp7dtypes()[1]
+            else:
+                self.dtype = self._get_dtypes()
+            self._data = None
+            self.file.close()
+            return
+
         # set data dtype and read pathline data
         if self.version == 7:
             self.dtype, self._data = self._get_mp7data()
@@ -79,13 +416,67 @@ class PathlineFile:
             if n in self._data.dtype.names:
                 self._data[n] -= 1
 
-        # set number of particle ids
-        self.nid = np.unique(self._data["particleid"])
+        # group the pathline data by particle id and set the particle ids
+        self._build_particle_index()
 
         # close the input file
         self.file.close()
         return
 
+    def _build_particle_index(self):
+        """
+           Sort the pathline data by particle id (preserving the file order
+           of the points for each particle) and build the offsets of the
+           first point of each particle in the sorted data.
+        """
+        pids = self._data["particleid"]
+        if pids.size > 1 and np.any(pids[1:] < pids[:-1]):
+            self._data = self._data[np.argsort(pids, kind="stable")]
+            pids = self._data["particleid"]
+        self.nid, starts = np.unique(pids, return_index=True)
+        self._offsets = np.append(starts, pids.size)
+
+        # time and cell indexes are built on first use
+        self._time_index = None
+        self._cell_index = None
+        return
+
+    def _get_time_index(self):
+        """
+           Get the rows of the pathline data sorted by time and the sorted
+           times.
+        """
+        if self._time_index is None:
+            order = np.argsort(self._data["time"], kind="stable")
+            self._time_index = (order, self._data["time"][order])
+        return self._time_index
+
+    def _get_time_rows(self, totim, ge=True):
+        """
+           Get the sorted rows of the pathline data with times greater than
+           or equal to (ge=True) or less than or equal to (ge=False) totim.
+        """
+        order, times = self._get_time_index()
+        totim = np.array(totim, dtype=times.dtype)
+        if ge:
+            rows = order[np.searchsorted(times, totim, side="left") :]
+        else:
+            rows = order[: np.searchsorted(times, totim, side="right")]
+        return np.sort(rows)
+
+    def _get_particle_rows(self, partids):
+        """
+           Get the rows of the pathline data for a set of particle ids.
+        """
+        partids = np.asarray(partids)
+        ipos = np.searchsorted(self.nid, partids)
+        found = ipos < self.nid.size
+        found[found] = self.nid[ipos[found]] == partids[found]
+        ipos = ipos[found]
+        return _concatenate_ranges(
+            self._offsets[ipos], self._offsets[ipos + 1]
+        )
+
     def _build_index(self):
         """
            Set position of the start of the pathline data.
@@ -182,7 +573,11 @@ class PathlineFile:
         )
         return outdtype
 
-    def _get_mp7data(self):
+    def _get_mp7dtypes(self):
+        """
+           Build numpy dtypes for the points and the data in the MODPATH 7
+           pathline file.
+        """
         dtyper = np.dtype(
             [
                 ("node", np.int32),
@@ -217,57 +612,90 @@ class PathlineFile:
                 ("timestep", np.int32),
             ]
         )
-        idx = 0
-        part_dict = collections.OrderedDict()
+        return dtyper, dtype
+
+    def _get_mp7data(self):
+        dtyper, dtype = self._get_mp7dtypes()
+
+        # first pass - read the pathline header lines and skip the data
+        self.file.seek(0)
+        for n in range(self.skiprows):
+            self.file.readline()
         ndata = 0
         while True:
-            if idx == 0:
-                for n in range(self.skiprows):
-                    line = self.file.readline()
-            # read header line
-            try:
-                line = self.file.readline().strip()
-                if self.verbose:
-                    print(line)
-                if len(line) < 1:
-                    break
-            except:
+            line = self.file.readline()
+            t = line.split()
+            if len(t) < 4:
                 break
-            t = [int(s) for j, s in enumerate(line.split()) if j < 4]
-            sequencenumber, group, particleid, pathlinecount = t[0:4]
-            ndata += pathlinecount
-            # read in the particle data
-            d = np.loadtxt(
-                itertools.islice(self.file, 0, pathlinecount), dtype=dtyper
-            )
-            key = (idx, sequencenumber, group, particleid, pathlinecount)
-            part_dict[key] = d.copy()
-            idx += 1
+            # skip the pathline points
+            n = int(t[3])
+            next(itertools.islice(self.file, n, n), None)
+            ndata += n
 
-        # create data array
+        # create data array and fill with the chunks from the second pass
         data = np.zeros(ndata, dtype=dtype)
-
-        # fill data
         ipos0 = 0
-        for key, value in part_dict.items():
-            idx, sequencenumber, group, particleid, pathlinecount = key[0:5]
-            ipos1 = ipos0 + pathlinecount
-            # fill constant items for particle
-            # particleid is not necessarily unique for all pathlines - use
-            # sequencenumber which is unique
-            data["particleid"][ipos0:ipos1] = sequencenumber
-            # set particlegroup and sequence number
-            data["particlegroup"][ipos0:ipos1] = group
-            data["sequencenumber"][ipos0:ipos1] = sequencenumber
-            # save particleidloc to particleid
-            data["particleidloc"][ipos0:ipos1] = particleid
-            # fill particle data
-            for name in value.dtype.names:
-                data[name][ipos0:ipos1] = value[name]
+        for d in self._read_chunks(100000):
+            ipos1 = ipos0 + d.shape[0]
+            if ipos1 > ndata:
+                break
+            data[ipos0:ipos1] = d
             ipos0 = ipos1
+        if ipos0 != ndata:
+            errmsg = "{} is not a valid MODPATH 7 pathline file".format(
+                self.fname
+            )
+            raise Exception(errmsg)
 
         return dtype, data
 
+    def _read_chunks(self, chunksize):
+        """
+           Read the pathline points in chunks of complete pathlines with at
+           least chunksize points (except for the last chunk).
+        """
+        if self.version != 7:
+            for chunk in super(PathlineFile, self)._read_chunks(chunksize):
+                yield chunk
+            return
+
+        dtyper, dtype = self._get_mp7dtypes()
+        f = open(self.fname, "r")
+        for n in range(self.skiprows):
+            f.readline()
+        headers, lines = [], []
+        while True:
+            line = f.readline()
+            if self.verbose:
+                print(line.strip())
+            t = line.split()
+            if len(t) >= 4:
+                headers.append([int(s) for s in t[:4]])
+                lines += itertools.islice(f, headers[-1][3])
+            if len(lines) > 0 and (len(lines) >= chunksize or len(t) < 4):
+                headers = np.array(headers, dtype=np.int64)
+                sequencenumber, group, particleid, count = headers.T
+                d = np.loadtxt(lines, dtype=dtyper, ndmin=1)
+                chunk = np.zeros(d.shape[0], dtype=dtype)
+
+                # fill constant items for each pathline
+                # particleid is not necessarily unique for all pathlines -
+                # use sequencenumber which is unique
+                chunk["particleid"] = np.repeat(sequencenumber, count)
+                # set particlegroup and sequence number
+                chunk["particlegroup"] = np.repeat(group, count)
+                chunk["sequencenumber"] = chunk["particleid"]
+                # save particleidloc to particleid
+                chunk["particleidloc"] = np.repeat(particleid, count)
+                # fill particle data
+                for name in dtyper.names:
+                    chunk[name] = d[name]
+                yield chunk
+                headers, lines = [], []
+            if len(t) < 4:
+                break
+        f.close()
+
     def get_maxid(self):
         """
         Get the maximum pathline number in the file pathline file
@@ -330,22 +758,23 @@ class PathlineFile:
         >>> p1 = pthobj.get_data(partid=1)
 
         """
-        # idx = self._data['particleid'] == partid
+        ipos = np.searchsorted(self.nid, partid)
+        if ipos < self.nid.size and self.nid[ipos] == partid:
+            ta = self._data[self._offsets[ipos] : self._offsets[ipos + 1]]
+        else:
+            ta = self._data[:0]
         if totim is not None:
             if ge:
-                idx = (self._data["time"] >= totim) & (
-                    self._data["particleid"] == partid
-                )
+                ta = ta[ta["time"] >= totim]
             else:
-                idx = (self._data["time"] <= totim) & (
-                    self._data["particleid"] == partid
-                )
-        else:
-            idx = self._data["particleid"] == partid
-        self._ta = self._data[idx]
+                ta = ta[ta["time"] <= totim]
+        self._ta = ta
+        return self._to_outdtype(ta)
+
+    def _to_outdtype(self, ta):
         names = ["x", "y", "z", "time", "k", "particleid"]
         return np.rec.fromarrays(
-            (self._ta[name] for name in names), dtype=self.outdtype
+            (ta[name] for name in names), dtype=self.outdtype
         )
 
     def get_alldata(self, totim=None, ge=True):
@@ -384,13 +813,53 @@ class PathlineFile:
         >>> p = pthobj.get_alldata()
 
         """
-        # plist = []
-        # for partid in self.nid:
-        #     plist.append(self.get_data(partid=partid, totim=totim, ge=ge))
-        return [
-            self.get_data(partid=partid, totim=totim, ge=ge)
-            for partid in self.nid
-        ]
+        points, offsets = self.get_segments(totim=totim, ge=ge)
+        return [points[i0:i1] for i0, i1 in zip(offsets[:-1], offsets[1:])]
+
+    def get_segments(self, totim=None, ge=True):
+        """
+        get pathline data from the pathline file for all pathlines as a
+        single record array of points and an array of offsets to the first
+        point of each pathline.
+
+        Parameters
+        ----------
+        totim : float
+            The simulation time. All pathline points that are greater than
+            or equal to (ge=True) or less than or equal to (ge=False) totim
+            will be returned. Default is None
+        ge : bool
+            Boolean that determines if pathline times greater than or equal
+            to or less than or equal to totim is used to create a subset
+            of pathlines. Default is True.
+
+        Returns
+        ----------
+        points : numpy record array
+            A numpy recarray with the x, y, z, time, k, and particleid for
+            all pathlines, sorted by particleid.
+        offsets : numpy array
+            Integer array with len(nid) + 1 entries. The points for the
+            pathline of particle nid[n] are points[offsets[n]:offsets[n + 1]]
+            (which is empty if all of its points were removed by totim).
+
+        Examples
+        --------
+
+        >>> import flopy.utils.modpathfile as mpf
+        >>> pthobj = flopy.utils.PathlineFile('model.mppth')
+        >>> points, offsets = pthobj.get_segments()
+
+        """
+        data = self._data
+        offsets = self._offsets
+        if totim is not None:
+            rows = self._get_time_rows(totim, ge=ge)
+            group = np.searchsorted(offsets, rows, side="right") - 1
+            counts = np.bincount(group, minlength=self.nid.size)
+            offsets = np.append(0, np.cumsum(counts))
+            data = data[rows]
+        return self._to_outdtype(data), offsets.copy()
 
     def get_destination_pathline_data(self, dest_cells, to_recarray=False):
         """
@@ -423,50 +892,30 @@ class PathlineFile:
 
         """
 
-        # create local copy of _data
-        ra = np.array(self._data)
-
         # find the intersection of pathlines and dest_cells
-        # convert dest_cells to same dtype for comparison
         if self.version < 7:
-            try:
-                raslice = ra[["k", "i", "j"]]
-            except:
-                msg = (
-                    "could not extract 'k', 'i', and 'j' keys "
-                    + "from pathline data"
-                )
-                raise KeyError(msg)
+            names = ["k", "i", "j"]
         else:
-            try:
-                raslice = ra[["node"]]
-            except:
-                msg = "could not extract 'node' key from pathline data"
+            names = ["node"]
+        for name in names:
+            if name not in self._data.dtype.names:
+                msg = "could not extract '{}' key from pathline data".format(
+                    name
+                )
                 raise KeyError(msg)
-            if isinstance(dest_cells, (list, tuple)):
-                allint = all(isinstance(el, int) for el in dest_cells)
-                # convert to a list of tuples
-                if allint:
-                    t = []
-                    for el in dest_cells:
-                        t.append((el,))
-                        dest_cells = t
+        if self._cell_index is None:
+            self._cell_index = _build_cell_index(self._data, names)
+        rows = _find_cell_rows(self._cell_index, dest_cells)
 
-        dest_cells = np.array(dest_cells, dtype=raslice.dtype)
-        inds = np.in1d(raslice, dest_cells)
-        epdest = ra[inds].copy().view(np.recarray)
+        # get list of unique particleids in selection
+        partids = np.unique(self._data["particleid"][rows])
 
         if to_recarray:
             # use particle ids to get the rest of the paths
-            inds = np.in1d(ra["particleid"], epdest.particleid)
-            pthldes = ra[inds].copy()
+            pthldes = self._data[self._get_particle_rows(partids)]
             pthldes.sort(order=["particleid", "time"])
             pthldes = pthldes.view(np.recarray)
         else:
-
-            # get list of unique particleids in selection
-            partids = np.unique(epdest["particleid"])
-
             # build list of unique particleids in selection
             pthldes = [self.get_data(partid) for partid in partids]
 
@@ -524,11 +973,7 @@ class PathlineFile:
         else:
             # convert pathline list to a single recarray
             if isinstance(pth, list):
-                s = pth[0]
-                print(s.dtype)
-                for n in range(1, len(pth)):
-                    s = stack_arrays((s, pth[n]))
-                pth = s.view(np.recarray)
+                pth = stack_arrays(pth, usemask=False).view(np.recarray)
 
         pth = pth.copy()
         pth.sort(order=["particleid", "time"])
@@ -555,7 +1000,9 @@ class PathlineFile:
         if epsg is None:
             epsg = mg.epsg
 
-        particles = np.unique(pth.particleid)
+        # offsets to the first point of each particle in the sorted data
+        particles, starts = np.unique(pth.particleid, return_index=True)
+        offsets = np.append(starts, len(pth))
         geoms = []
 
         # create dtype with select attributes in pth
@@ -575,61 +1022,49 @@ class PathlineFile:
 
         # 1 geometry for each path
         if one_per_particle:
+            x, y = geometry.transform(
+                pth.x, pth.y, mg.xoffset, mg.yoffset, mg.angrot_radians
+            )
+            xyz = np.column_stack((x, y, pth.z)).tolist()
+            geoms = [
+                LineString(xyz[i0:i1])
+                for i0, i1 in zip(offsets[:-1], offsets[1:])
+            ]
 
-            loc_inds = 0
+            # starting or ending row of each particle
             if direction == "ending":
-                loc_inds = -1
-
-            pthdata = []
-            for pid in particles:
-                ra = pth[pth.particleid == pid]
+                iloc = offsets[1:] - 1
+            else:
+                iloc = offsets[:-1]
+
+            pthdata = np.zeros(len(particles), dtype=dtype).view(np.recarray)
+            pthdata["particleid"] = particles
+            if "particlegroup" in names:
+                pthdata["particlegroup"] = pth.particlegroup[offsets[:-1]]
+            pthdata["time"] = np.maximum.reduceat(pth.time, offsets[:-1])
+            if "node" in names:
+                pthdata["node"] = pth.node[iloc]
+            else:
+                for att in ("k", "i", "j"):
+                    if att in names:
+                        pthdata[att] = pth[att][iloc]
 
+        # geometry for each row in PathLine file
+        else:
+            if isinstance(mg, StructuredGrid):
                 x, y = geometry.transform(
-                    ra.x, ra.y, mg.xoffset, mg.yoffset, mg.angrot_radians
+                    pth.x, pth.y, mg.xoffset, mg.yoffset, mg.angrot_radians
                 )
-                z = ra.z
-                geoms.append(LineString(list(zip(x, y, z))))
-
-                t = [pid]
-                if "particlegroup" in names:
-                    t.append(ra.particlegroup[0])
-                t.append(ra.time.max())
-                if "node" in names:
-                    t.append(ra.node[loc_inds])
-                else:
-                    if "k" in names:
-                        t.append(ra.k[loc_inds])
-                    if "i" in names:
-                        t.append(ra.i[loc_inds])
-                    if "j" in names:
-                        t.append(ra.j[loc_inds])
-                pthdata.append(tuple(t))
+            else:
+                x, y = mg.transform(pth.x, pth.y)
+            xyz = np.column_stack((x, y, pth.z)).tolist()
 
-            pthdata = np.array(pthdata, dtype=dtype).view(np.recarray)
-
-        # geometry for each row in PathLine file
-        else:
-            dtype = pth.dtype
-            # pthdata = np.empty((0, len(dtype)), dtype=dtype).view(np.recarray)
-            pthdata = []
-            for pid in particles:
-                ra = pth[pth.particleid == pid]
-                if isinstance(mg, StructuredGrid):
-                    x, y = geometry.transform(
-                        ra.x, ra.y, mg.xoffset, mg.yoffset, mg.angrot_radians
-                    )
-                else:
-                    x, y = mg.transform(ra.x, ra.y)
-                z = ra.z
-                geoms += [
-                    LineString(
-                        [(x[i - 1], y[i - 1], z[i - 1]), (x[i], y[i], z[i])]
-                    )
-                    for i in np.arange(1, (len(ra)))
-                ]
-                # pthdata = np.append(pthdata, ra[1:]).view(np.recarray)
-                pthdata += ra[1:].tolist()
-            pthdata = np.array(pthdata, dtype=dtype).view(np.recarray)
+            # a segment ends at every row except the first row of a particle
+            idx = np.ones(len(pth), dtype=bool)
+            idx[offsets[:-1]] = False
+            iend = np.nonzero(idx)[0]
+            geoms = [LineString([xyz[i - 1], xyz[i]]) for i in iend]
+            pthdata = pth[iend].copy().view(np.recarray)
 
         # convert back to one-based
         for n in set(self.kijnames).intersection(set(pthdata.dtype.names)):
@@ -639,7 +1074,7 @@ class PathlineFile:
         recarray2shp(pthdata, geoms, shpname=shpname, epsg=epsg, **kwargs)
 
 
-class EndpointFile:
+class EndpointFile(_ModpathFile):
     """
     EndpointFile Class.
 
@@ -649,6 +1084,10 @@ class EndpointFile:
         Name of the endpoint file
     verbose : bool
         Write information to the screen.  Default is False.
+    load_data : bool
+        Load the data in the file. If False, only the file header is read
+        and the data can be accessed in chunks with iter_data().
+        Default is True.
 
     Examples
     --------
@@ -676,7 +1115,10 @@ class EndpointFile:
         "zone",
     ]
 
-    def __init__(self, filename, verbose=False):
+    # destination cell filters select endpoint records
+    _dest_by_particle = False
+
+    def __init__(self, filename, verbose=False, load_data=True):
         """
         Class constructor.
 
@@ -685,6 +1127,13 @@ class EndpointFile:
         self.verbose = verbose
         self._build_index()
         self.dtype = self._get_dtypes()
+
+        # only the dtype is needed if the data are accessed with iter_data()
+        if not load_data:
+            self._data = None
+            self.file.close()
+            return
+
         self._data = loadtxt(
             self.file, dtype=self.dtype, skiprows=self.skiprows
         )
@@ -700,6 +1149,10 @@ class EndpointFile:
         # set number of particle ids
         self.nid = np.unique(self._data["particleid"]).shape[0]
 
+        # particle and cell indexes are built on first use
+        self._particle_index = None
+        self._cell_index = {}
+
         # close the input file
         self.file.close()
         return
@@ -852,6 +1305,21 @@ class EndpointFile:
         ]
         return np.dtype(dtype)
 
+    def _read_chunks(self, chunksize):
+        """
+           Read the endpoints in chunks of chunksize records and add
+           particle ids for MODPATH 3 and 5 endpoint files.
+        """
+        nrec = 0
+        for chunk in super(EndpointFile, self)._read_chunks(chunksize):
+            if self.version < 6:
+                pids = np.arange(
+                    nrec + 1, nrec + chunk.shape[0] + 1, dtype=np.int32
+                )
+                chunk = append_fields(chunk, "particleid", pids, usemask=False)
+            nrec += chunk.shape[0]
+            yield chunk
+
     def _add_particleid(self):
 
         # add particle ids for earlier version of MODPATH
@@ -980,8 +1448,13 @@ class EndpointFile:
         >>> e1 = endobj.get_data(partid=1)
 
         """
-        idx = self._data["particleid"] == partid
-        ra = self._data[idx]
+        if self._particle_index is None:
+            order = np.argsort(self._data["particleid"], kind="stable")
+            self._particle_index = (order, self._data["particleid"][order])
+        order, pids = self._particle_index
+        i0 = np.searchsorted(pids, partid, side="left")
+        i1 = np.searchsorted(pids, partid, side="right")
+        ra = self._data[np.sort(order[i0:i1])]
         return ra
 
     def get_alldata(self):
@@ -1041,56 +1514,28 @@ class EndpointFile:
 
         """
 
-        # create local copy of _data
-        ra = self.get_alldata()
-
         # find the intersection of endpoints and dest_cells
-        # convert dest_cells to same dtype for comparison
         if self.version < 7:
             if source:
                 keys = ["k0", "i0", "j0"]
             else:
                 keys = ["k", "i", "j"]
-            try:
-                raslice = ra_slice(ra, keys)
-            except:
-                msg = (
-                    "could not extract"
-                    + "'"
-                    + "', '".join(keys)
-                    + "'"
-                    + "from endpoint data."
-                )
-                raise KeyError(msg)
         else:
             if source:
                 keys = ["node0"]
             else:
                 keys = ["node"]
-            try:
-                raslice = ra_slice(ra, keys)
-            except:
-                msg = (
-                    "could not extract '{}' ".format(keys[0])
-                    + "key from endpoint data"
+        for key in keys:
+            if key not in self._data.dtype.names:
+                msg = "could not extract '{}' key from endpoint data".format(
+                    key
                 )
                 raise KeyError(msg)
-            if isinstance(dest_cells, (list, tuple)):
-                allint = all(isinstance(el, int) for el in dest_cells)
-                # convert to a list of tuples
-                if allint:
-                    t = []
-                    for el in dest_cells:
-                        t.append((el,))
-                        dest_cells = t
-        dtype = []
-        for key in keys:
-            dtype.append((key, np.int32))
-        dtype = np.dtype(dtype)
-        dest_cells = np.array(dest_cells, dtype=dtype)
-
-        inds = np.in1d(raslice, dest_cells)
-        epdest = ra[inds].copy().view(np.recarray)
+        index_key = tuple(keys)
+        if index_key not in self._cell_index:
+            self._cell_index[index_key] = _build_cell_index(self._data, keys)
+        rows = _find_cell_rows(self._cell_index[index_key], dest_cells)
+        epdest = self._data[rows].view(np.recarray)
         return epdest
 
     def write_shapefile(
@@ -1183,7 +1628,7 @@ class EndpointFile:
         recarray2shp(epd, geoms, shpname=shpname, epsg=epsg, **kwargs)
 
 
-class TimeseriesFile:
+class TimeseriesFile(_ModpathFile):
     """
     TimeseriesFile Class.
 
@@ -1193,6 +1638,10 @@ class TimeseriesFile:
         Name of the timeseries file
     verbose : bool
         Write information to the screen.  Default is False.
+    load_data : bool
+        Load the data in the file. If False, only the file header is read
+        and the data can be accessed in chunks with iter_data().
+        Default is True.
 
     Examples
     --------
@@ -1215,7 +1664,7 @@ class TimeseriesFile:
         "timepointindex",
     ]
 
-    def __init__(self, filename, verbose=False):
+    def __init__(self, filename, verbose=False, load_data=True):
         """
         Class constructor.
 
@@ -1232,6 +1681,12 @@ class TimeseriesFile:
         # set dtype
         self.dtype = self._get_dtypes()
 
+        # only the dtype is needed if the data are accessed with iter_data()
+        if not load_data:
+            self._data = None
+            self.file.close()
+            return
+
         # read data
         self._data = loadtxt(
             self.file, dtype=self.dtype, skiprows=self.skiprows
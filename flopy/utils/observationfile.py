@@ -1,3 +1,4 @@
+import os
 import numpy as np
 
 from ..utils.utils_def import FlopyBinaryData
@@ -119,6 +120,8 @@ class ObsFiles(FlopyBinaryData):
         if obsname is not None:
             obsname.insert(0, "totim")
             r = get_selection(self.data, obsname)[i0:i1]
+            if isinstance(self.data, np.memmap):
+                r = np.array(r)
         return r
 
     def get_dataframe(
@@ -211,28 +214,55 @@ class ObsFiles(FlopyBinaryData):
                 dti, start=pd.to_datetime(start_datetime), timeunit=timeunit
             )
 
-        df = pd.DataFrame(self.data[i0:i1], index=dti, columns=obsname)
+        df = pd.DataFrame(
+            np.array(get_selection(self.data, obsname)[i0:i1]),
+            index=dti,
+            columns=obsname,
+        )
         return df
 
-    def _read_data(self):
+    def _read_data(self, load_data=True):
+        """
+        Read the data block of a binary observation file. The number of
+        records is calculated from the file size and the fixed record
+        length of the observation file, so the records are read in a single
+        call. Incomplete records at the end of the file are not read.
+
+        Parameters
+        ----------
+        load_data : bool
+            Read the data into memory. If False, the data is a read-only
+            numpy memmap of the data block of the file and only the
+            observations that are selected are read from the file.
+            (default is True)
 
+        """
         if self.data is not None:
             return
 
-        while True:
-            try:
-                r = self.read_record(count=1)
-                if self.data is None:
-                    self.data = r.copy()
-                elif r.size == 0:
-                    break
-                else:
-                    # should be hstack based on (https://mail.scipy.org/pipermail/numpy-discussion/2010-June/051107.html)
-                    self.data = np.hstack((self.data, r))
-            except:
-                break
+        self._data_offset = self.file.tell()
+        nbytes = os.fstat(self.file.fileno()).st_size - self._data_offset
+        nrec = max(nbytes, 0) // self.dtype.itemsize
+        if load_data or nrec == 0:
+            self.data = self.read_record(count=nrec)
+        else:
+            self.data = np.memmap(
+                self.file.name,
+                dtype=self.dtype,
+                mode="r",
+                offset=self._data_offset,
+                shape=(nrec,),
+            )
         return
 
+    def _read_names(self, nobs, nchar):
+        """
+        Read nobs fixed length observation names in a single call.
+        """
+        names = self._read_values(self.character, nobs * nchar)
+        names = names.reshape(nobs, nchar)
+        return [name.tobytes().decode().strip() for name in names]
+
     def _build_dtype(self):
         """
         Build the recordarray and iposarray, which maps the header information
@@ -263,8 +293,13 @@ class Mf6Obs(ObsFiles):
     verbose : boolean
         If true, print additional information to to the screen during the
         extraction.  (default is False)
-    hydlbl_len : int
-        Length of hydmod labels. (default is 20)
+    isBinary : bool
+        Observation file is a binary file. (default is True)
+    load_data : bool
+        Read the observations into memory. If False, the data is a
+        read-only numpy memmap of the file and only the observations that
+        are selected with get_data() are read. Only used for
+        binary files. (default is True)
 
     Returns
     -------
@@ -272,7 +307,7 @@ class Mf6Obs(ObsFiles):
 
     """
 
-    def __init__(self, filename, verbose=False, isBinary=True):
+    def __init__(self, filename, verbose=False, isBinary=True, load_data=True):
         """
         Class constructor.
 
@@ -300,11 +335,7 @@ class Mf6Obs(ObsFiles):
             # self.v.fill(1.0E+32)
 
             # read obsnames
-            obsnames = []
-            for idx in range(0, self.nobs):
-                cid = self.read_text(lenobsname)
-                obsnames.append(cid)
-            self.obsnames = np.array(obsnames)
+            self.obsnames = np.array(self._read_names(self.nobs, lenobsname))
 
             # build dtype
             self._build_dtype()
@@ -313,7 +344,7 @@ class Mf6Obs(ObsFiles):
             self._build_index()
 
             self.data = None
-            self._read_data()
+            self._read_data(load_data)
         else:
             # --open binary head file
             self.file = open(filename, "r")
@@ -374,6 +405,10 @@ class HydmodObs(ObsFiles):
         extraction.  (default is False)
     hydlbl_len : int
         Length of hydmod labels. (default is 20)
+    load_data : bool
+        Read the observations into memory. If False, the data is a
+        read-only numpy memmap of the file and only the observations that
+        are selected with get_data() are read. (default is True)
 
     Returns
     -------
@@ -381,7 +416,7 @@ class HydmodObs(ObsFiles):
 
     """
 
-    def __init__(self, filename, verbose=False, hydlbl_len=20):
+    def __init__(self, filename, verbose=False, hydlbl_len=20, load_data=True):
         """
         Class constructor.
 
@@ -406,11 +441,7 @@ class HydmodObs(ObsFiles):
         ctime = self.read_text(nchar=4)
         self.hydlbl_len = int(hydlbl_len)
         # read HYDLBL
-        hydlbl = []
-        for idx in range(0, self.nobs):
-            cid = self.read_text(self.hydlbl_len)
-            hydlbl.append(cid)
-        self.hydlbl = np.array(hydlbl)
+        self.hydlbl = np.array(self._read_names(self.nobs, self.hydlbl_len))
 
         # build dtype
         self._build_dtype()
@@ -419,7 +450,7 @@ class HydmodObs(ObsFiles):
         self._build_index()
 
         self.data = None
-        self._read_data()
+        self._read_data(load_data)
 
     def _build_dtype(self):
 
@@ -451,6 +482,10 @@ class SwrObs(ObsFiles):
         'single' or 'double'.  Default is 'double'.
     verbose : bool
         Write information to the screen.  Default is False.
+    load_data : bool
+        Read the observations into memory. If False, the data is a
+        read-only numpy memmap of the file and only the observations that
+        are selected with get_data() are read.  Default is True.
 
     Attributes
     ----------
@@ -472,7 +507,9 @@ class SwrObs(ObsFiles):
 
     """
 
-    def __init__(self, filename, precision="double", verbose=False):
+    def __init__(
+        self, filename, precision="double", verbose=False, load_data=True
+    ):
         """
         Class constructor.
 
@@ -503,7 +540,7 @@ class SwrObs(ObsFiles):
 
         # read data
         self.data = None
-        self._read_data()
+        self._read_data(load_data)
 
     def _build_dtype(self):
         vdata = [("totim", self.floattype)]
@@ -123,20 +123,135 @@ def get_transmissivities(
     return T
 
 
-def get_water_table(heads, nodata, per_idx=None):
+# head file of a process in the pool of _map_heads()
+_pool_heads = None
+
+
+def _init_heads_pool(heads):
+    global _pool_heads
+    if isinstance(heads, tuple):
+        # open the head file again, so that the processes do not share
+        # the position of the file
+        cls, filename, text, precision = heads
+        heads = cls(filename, text=text, precision=precision)
+    _pool_heads = heads
+
+
+def _heads_pool_record(args):
+    func, per, fargs = args
+    return func(_get_heads_record(_pool_heads, per), *fargs)
+
+
+def _is_headfile(heads):
+    return hasattr(heads, "get_data") and hasattr(heads, "get_times")
+
+
+def _get_heads_record(heads, per):
+    """
+    Get the 3-D heads array of a stress period of a heads array or of a
+    saved time step of a head file.
+    """
+    if _is_headfile(heads):
+        return heads.get_data(totim=heads.get_times()[per])
+    return heads[per]
+
+
+def _map_heads(func, heads, per_idx, processes, *args):
+    """
+    Apply a function to the 3-D heads array of each stress period of a
+    heads array or each saved time step of a head file, the head file is
+    read one time step at a time.
+
+    Parameters
+    ----------
+    func : function
+        function called with the 3-D heads array and args
+    heads : 3 or 4-D np.ndarray or HeadFile
+        Heads array or head file.
+    per_idx : int or sequence of ints
+        stress periods or time steps. If None, all stress periods or time
+        steps are used.
+    processes : int
+        number of processes. If None or less than 2, the time steps are
+        processed in this process.
+    args : arguments
+        additional arguments of func
+
+    Returns
+    -------
+    list of the results of func
+    """
+    if _is_headfile(heads):
+        nper = len(heads.get_times())
+    else:
+        heads = np.array(heads, ndmin=4)
+        nper = heads.shape[0]
+    if per_idx is None:
+        per_idx = list(range(nper))
+    elif np.isscalar(per_idx):
+        per_idx = [per_idx]
+
+    if processes is None or processes < 2 or len(per_idx) < 2:
+        return [func(_get_heads_record(heads, per), *args) for per in per_idx]
+
+    import multiprocessing as mp
+
+    if _is_headfile(heads):
+        initargs = (
+            (
+                type(heads),
+                heads.filename,
+                heads.text.decode(),
+                heads.precision,
+            ),
+        )
+    else:
+        initargs = (heads,)
+    pool = mp.Pool(processes, initializer=_init_heads_pool, initargs=initargs)
+    try:
+        chunksize = max(len(per_idx) // (4 * processes), 1)
+        results = pool.map(
+            _heads_pool_record,
+            [(func, per, args) for per in per_idx],
+            chunksize=chunksize,
+        )
+    finally:
+        pool.close()
+        pool.join()
+    return results
+
+
+def _get_water_table(hds, nodata):
+    """
+    Water table of a 3-D heads array, the head in the first layer
+    that is not dry.
+    """
+    wet = hds != nodata
+    kfirst = np.argmax(wet, axis=0)
+    wt = np.take_along_axis(hds, kfirst[np.newaxis], axis=0)[0]
+    wt[~wet.any(axis=0)] = nodata
+    return wt
+
+
+def get_water_table(heads, nodata, per_idx=None, processes=None):
     """
     Get a 2D array representing the water table elevation for each
     stress period in heads array.
 
     Parameters
     ----------
-    heads : 3 or 4-D np.ndarray
-        Heads array.
+    heads : 3 or 4-D np.ndarray or HeadFile
+        Heads array, or a head file object that is read one time step at
+        a time.
     nodata : real
         HDRY value indicating dry cells.
     per_idx : int or sequence of ints
-        stress periods to return. If None,
+        stress periods to return, or the zero-based index of the saved
+        time steps of a head file. If None,
         returns all stress periods (default is None).
+    processes : int
+        number of processes used to process the stress periods or time
+        steps. If None (default), they are processed in this process.
 
     Returns
     -------
@@ -144,59 +259,52 @@ def get_water_table(heads, nodata, per_idx=None):
         for each stress period.
 
     """
-    heads = np.array(heads, ndmin=4)
-    nper, nlay, nrow, ncol = heads.shape
-    if per_idx is None:
-        per_idx = list(range(nper))
-    elif np.isscalar(per_idx):
-        per_idx = [per_idx]
-    wt = []
-    for per in per_idx:
-        wt_per = []
-        for i in range(nrow):
-            for j in range(ncol):
-                for k in range(nlay):
-                    if heads[per, k, i, j] != nodata:
-                        wt_per.append(heads[per, k, i, j])
-                        break
-                    elif k == nlay - 1:
-                        wt_per.append(nodata)
-        assert len(wt_per) == nrow * ncol
-        wt.append(np.reshape(wt_per, (nrow, ncol)))
+    wt = _map_heads(_get_water_table, heads, per_idx, processes, nodata)
     return np.squeeze(wt)
 
 
-def get_saturated_thickness(heads, m, nodata, per_idx=None):
+def _get_saturated_thickness(hds, nodata, botm, thickness, is_conf):
+    """
+    Saturated thickness of a 3-D heads array.
+    """
+    dry = hds == nodata
+    sat_thickness = hds - botm
+    conf = (sat_thickness > thickness) | is_conf
+    sat_thickness[conf] = thickness[conf]
+    # convert to nan-filled array, as is expected(!?)
+    sat_thickness[dry] = np.nan
+    return sat_thickness
+
+
+def get_saturated_thickness(heads, m, nodata, per_idx=None, processes=None):
     """
     Calculates the saturated thickness for each cell from the heads
     array for each stress period.
 
     Parameters
     ----------
-    heads : 3 or 4-D np.ndarray
-        Heads array.
+    heads : 3 or 4-D np.ndarray or HeadFile
+        Heads array, or a head file object that is read one time step at
+        a time.
     m : flopy.modflow.Modflow object
         Must have a flopy.modflow.ModflowDis object attached.
     nodata : real
         HDRY value indicating dry cells.
     per_idx : int or sequence of ints
-        stress periods to return. If None,
+        stress periods to return, or the zero-based index of the saved
+        time steps of a head file. If None,
         returns all stress periods (default).
+    processes : int
+        number of processes used to process the stress periods or time
+        steps. If None (default), they are processed in this process.
 
     Returns
     -------
     sat_thickness : 3 or 4-D np.ndarray
         Array of saturated thickness
     """
-    # internal calculations done on a masked array
-    heads = np.ma.array(heads, ndmin=4, mask=heads == nodata)
     botm = m.dis.botm.array
     thickness = m.dis.thickness.array
-    nper, nlay, nrow, ncol = heads.shape
-    if per_idx is None:
-        per_idx = list(range(nper))
-    elif np.isscalar(per_idx):
-        per_idx = [per_idx]
 
     # get confined or unconfined/convertible info
     if m.has_package("BCF6") or m.has_package("LPF") or m.has_package("UPW"):
@@ -222,60 +330,65 @@ def get_saturated_thickness(heads, m, nodata, per_idx=None):
         )
 
     # calculate saturated thickness
-    sat_thickness = []
-    for per in per_idx:
-        hds = heads[per]
-        perthickness = hds - botm
-        conf = np.logical_or(perthickness > thickness, is_conf)
-        perthickness[conf] = thickness[conf]
-        # convert to nan-filled array, as is expected(!?)
-        sat_thickness.append(perthickness.filled(np.nan))
+    sat_thickness = _map_heads(
+        _get_saturated_thickness,
+        heads,
+        per_idx,
+        processes,
+        nodata,
+        botm,
+        thickness,
+        is_conf,
+    )
     return np.squeeze(sat_thickness)
 
 
-def get_gradients(heads, m, nodata, per_idx=None):
+def _get_gradients(hds, nodata, zcentroids):
+    """
+    Vertical hydraulic gradients of a 3-D heads array.
+    """
+    dry = hds == nodata
+    # the head is the center of the saturated part of unsaturated cells
+    zcnt = np.where(zcentroids > hds, hds, zcentroids)
+    dz = np.diff(zcnt, axis=0)
+    dh = np.diff(hds, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        grad = dh / dz
+    # convert to nan-filled array, as is expected(!?)
+    grad[dry[1:] | dry[:-1] | (dz == 0)] = np.nan
+    return grad
+
+
+def get_gradients(heads, m, nodata, per_idx=None, processes=None):
     """
     Calculates the hydraulic gradients from the heads
     array for each stress period.
 
     Parameters
     ----------
-    heads : 3 or 4-D np.ndarray
-        Heads array.
+    heads : 3 or 4-D np.ndarray or HeadFile
+        Heads array, or a head file object that is read one time step at
+        a time.
     m : flopy.modflow.Modflow object
         Must have a flopy.modflow.ModflowDis object attached.
     nodata : real
         HDRY value indicating dry cells.
     per_idx : int or sequence of ints
-        stress periods to return. If None,
+        stress periods to return, or the zero-based index of the saved
+        time steps of a head file. If None,
         returns all stress periods (default).
+    processes : int
+        number of processes used to process the stress periods or time
+        steps. If None (default), they are processed in this process.
 
     Returns
     -------
     grad : 3 or 4-D np.ndarray
         Array of hydraulic gradients
     """
-    # internal calculations done on a masked array
-    heads = np.ma.array(heads, ndmin=4, mask=heads == nodata)
-    nper, nlay, nrow, ncol = heads.shape
-    if per_idx is None:
-        per_idx = list(range(nper))
-    elif np.isscalar(per_idx):
-        per_idx = [per_idx]
-
-    grad = []
-    for per in per_idx:
-        hds = heads[per]
-        zcnt_per = np.ma.array(m.dis.zcentroids, mask=hds.mask)
-        unsat = zcnt_per > hds
-        zcnt_per[unsat] = hds[unsat]
-
-        # apply .diff on data and mask components separately
-        diff_mask = np.diff(hds.mask, axis=0)
-        dz = np.ma.array(np.diff(zcnt_per.data, axis=0), mask=diff_mask)
-        dh = np.ma.array(np.diff(hds.data, axis=0), mask=diff_mask)
-        # convert to nan-filled array, as is expected(!?)
-        grad.append((dh / dz).filled(np.nan))
+    grad = _map_heads(
+        _get_gradients, heads, per_idx, processes, nodata, m.dis.zcentroids
+    )
     return np.squeeze(grad)
 
 
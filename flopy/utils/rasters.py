@@ -63,6 +63,9 @@ class Raster(object):
     INT32 = (int, np.int, np.int32, np.int_)
     INT64 = (np.int64,)
 
+    # maximum number of raster cells processed at once by the tiled methods
+    TILESIZE = 1000000
+
     def __init__(
         self,
         array,
@@ -208,14 +211,21 @@ class Raster(object):
         Method to create np.arrays of the xy-cell centers
         in the raster object
         """
-        arr = None
-        for _, arr in self.__arr_dict.items():
-            break
+        x, y = self._get_xycenters_1d()
+        self.__xcenters, self.__ycenters = np.meshgrid(x, y)
+
+    def _get_xycenters_1d(self):
+        """
+        Internal method to get the x-cell centers of the raster columns
+        and the y-cell centers of the raster rows
 
-        if arr is None:
-            raise AssertionError("No array data was found")
+        Returns
+        -------
+            tuple : (x, y)
 
-        ylen, xlen = arr.shape
+        """
+        ylen = self._meta["height"]
+        xlen = self._meta["width"]
 
         # assume that transform is an unrotated plane
         # if transform indicates a rotated plane additional
@@ -232,7 +242,71 @@ class Raster(object):
 
         x = np.linspace(x0, x1, xlen)
         y = np.linspace(y1, y0, ylen)
-        self.__xcenters, self.__ycenters = np.meshgrid(x, y)
+        return x, y
+
+    def _get_window(self, extent, margin=0):
+        """
+        Internal method to get the window of raster rows and columns with
+        cell centers in an extent
+
+        Parameters
+        ----------
+        extent : tuple
+            (xmin, xmax, ymin, ymax) of the area of interest
+        margin : int
+            number of raster cells added around the extent
+
+        Returns
+        -------
+            tuple : (row0, row1, col0, col1) of the window, row1 and col1
+            are exclusive
+
+        """
+        x, y = self._get_xycenters_1d()
+        xmin, xmax, ymin, ymax = extent
+        xd = abs(self._meta["transform"][0])
+        yd = abs(self._meta["transform"][4])
+        col0 = np.searchsorted(x, xmin - margin * xd, side="left")
+        col1 = np.searchsorted(x, xmax + margin * xd, side="right")
+        # y-cell centers decrease with the row number
+        row0 = np.searchsorted(-y, -(ymax + margin * yd), side="left")
+        row1 = np.searchsorted(-y, -(ymin - margin * yd), side="right")
+        return row0, row1, col0, col1
+
+    @staticmethod
+    def _get_extent(obj):
+        """
+        Internal method to get the extent (xmin, xmax, ymin, ymax) of a
+        model grid, a polygon or an extent tuple
+
+        Parameters
+        ----------
+        obj : Grid, shapely geometry, GeoJSON-like dict, list or tuple
+            model grid, polygon or polygon vertices [(x0, y0), ...,
+            (xn, yn)], or a (xmin, xmax, ymin, ymax) tuple
+
+        Returns
+        -------
+            tuple : (xmin, xmax, ymin, ymax)
+
+        """
+        if hasattr(obj, "grid_type") and hasattr(obj, "extent"):
+            return obj.extent
+        elif hasattr(obj, "bounds") and hasattr(obj, "geom_type"):
+            xmin, ymin, xmax, ymax = obj.bounds
+            return xmin, xmax, ymin, ymax
+        elif isinstance(obj, dict):
+            obj = obj["geometry"]["coordinates"]
+
+        xy = np.array(obj, dtype=float)
+        if xy.ndim == 1:
+            if xy.size != 4:
+                raise ValueError(
+                    "extent must be defined as (xmin, xmax, ymin, ymax)"
+                )
+            return tuple(xy)
+        xy = xy.reshape(-1, 2)
+        return xy[:, 0].min(), xy[:, 0].max(), xy[:, 1].min(), xy[:, 1].max()
 
     def sample_point(self, x, y, band):
         """
@@ -347,7 +421,8 @@ class Raster(object):
         method : str
             scipy interpolation method options
 
-            "linear" for bi-linear interpolation
+            "linear" for bi-linear interpolation between the four
+            raster cell centers around a point
             "nearest" for nearest neighbor
             "cubic" for bi-cubic interpolation
 
@@ -366,9 +441,16 @@ class Raster(object):
         data_shape = xc.shape
         xc = xc.flatten()
         yc = yc.flatten()
-        # step 1: create grid from raster bounds
-        rxc = self.xcenters
-        ryc = self.ycenters
+        # step 1: create grid from raster bounds, nearest and linear
+        # interpolation only use the raster cells around the points
+        x, y = self._get_xycenters_1d()
+        if method == "cubic":
+            window = (0, y.size, 0, x.size)
+        else:
+            extent = (np.min(xc), np.max(xc), np.min(yc), np.max(yc))
+            window = self._get_window(extent, margin=2)
+        row0, row1, col0, col1 = window
+        rxc, ryc = np.meshgrid(x[col0:col1], y[row0:row1])
 
         # step 2: flatten grid
         rxc = rxc.flatten()
@@ -376,13 +458,29 @@ class Raster(object):
 
         # step 3: get array
         if method == "cubic":
-            arr = self.get_array(band, masked=False)
+            arr = self._get_array_window(band, window, masked=False)
         else:
-            arr = self.get_array(band, masked=True)
+            arr = self._get_array_window(band, window, masked=True)
         arr = arr.flatten()
 
         # step 3: use griddata interpolation to snap to grid
-        data = griddata((rxc, ryc), arr, (xc, yc), method=method)
+        if method == "linear":
+            from scipy.interpolate import RegularGridInterpolator
+
+            # bi-linear interpolation on the regular grid of raster cell
+            # centers does not depend on the window, unlike a linear
+            # interpolation on a triangulation of the cell centers
+            arr.shape = (row1 - row0, col1 - col0)
+            interp = RegularGridInterpolator(
+                (y[row0:row1][::-1], x[col0:col1]),
+                arr[::-1],
+                method="linear",
+                bounds_error=False,
+                fill_value=np.nan,
+            )
+            data = interp(np.column_stack((yc, xc)))
+        else:
+            data = griddata((rxc, ryc), arr, (xc, yc), method=method)
 
         # step 4: return grid to user in shape provided
         data.shape = data_shape
@@ -392,6 +490,358 @@ class Raster(object):
 
         return data
 
+    def get_grid_weights(self, modelgrid):
+        """
+        Method to get the sparse weight matrix that assigns the raster
+        cells (pixels) to the cells of a model grid. The weight of a pixel
+        in a model cell is the fraction of the area of the pixel that is
+        inside the model cell, so that the statistics of the model cells
+        are area-weighted, also for model cells that are smaller than the
+        pixels. The matrix is computed once for each combination of raster
+        geometry and model grid and is cached on the model grid, it is only
+        recomputed if the coordinate information of the model grid changes.
+
+        Parameters
+        ----------
+        modelgrid : flopy.discretization.StructuredGrid or VertexGrid
+            model grid in the coordinate system of the raster
+
+        Returns
+        -------
+            scipy.sparse.csr_matrix of shape (number of model cells,
+            number of pixels) with the fraction of each pixel that is
+            in each model cell
+
+        """
+        if scipy is None:
+            msg = (
+                "Raster().get_grid_weights(): error "
+                + 'importing scipy - try "pip install scipy"'
+            )
+            raise ImportError(msg)
+        else:
+            from scipy.sparse import csr_matrix
+
+        from ..discretization.grid import CachedData
+
+        if modelgrid.grid_type not in ("structured", "vertex"):
+            raise TypeError(
+                "Raster().get_grid_weights(): grid type {} is not "
+                "supported".format(modelgrid.grid_type)
+            )
+
+        key = (
+            tuple(self._meta["transform"])[:6],
+            self._meta["height"],
+            self._meta["width"],
+        )
+        cache_index = "raster_weights"
+        cache = modelgrid._cache_dict.get(cache_index)
+        if cache is None or cache.out_of_date:
+            cache = CachedData({})
+            modelgrid._cache_dict[cache_index] = cache
+        weights = cache.data_nocopy
+        if key not in weights:
+            height = self._meta["height"]
+            width = self._meta["width"]
+            xd = abs(self._meta["transform"][0])
+            yd = abs(self._meta["transform"][4])
+            xmin, xmax, ymin, ymax = self.bounds
+
+            # vertex rings of the model cells in raster coordinates
+            index = modelgrid.get_spatial_index()
+            xv, yv = modelgrid.get_coords(index.xv, index.yv)
+            xv = np.asarray(xv, dtype=float).reshape(index.xv.shape)
+            yv = np.asarray(yv, dtype=float).reshape(index.yv.shape)
+
+            # pixels overlapped by the bounding box of each cell
+            col0 = np.clip(np.floor((xv.min(axis=1) - xmin) / xd), 0, width)
+            col1 = np.clip(np.ceil((xv.max(axis=1) - xmin) / xd), 0, width)
+            row0 = np.clip(np.floor((ymax - yv.max(axis=1)) / yd), 0, height)
+            row1 = np.clip(np.ceil((ymax - yv.min(axis=1)) / yd), 0, height)
+            col0, col1 = col0.astype(int), col1.astype(int)
+            row0, row1 = row0.astype(int), row1.astype(int)
+            ncol = col1 - col0
+            npix = ncol * (row1 - row0)
+
+            # overlap areas of the cells and pixels, processed in tiles of
+            # cells to limit the size of the clipped vertex arrays
+            npair = max(self.TILESIZE // (8 * max(xv.shape[1], 1)), 1)
+            bounds = np.searchsorted(
+                np.cumsum(npix), np.arange(npair, npix.sum(), npair)
+            )
+            cells = []
+            pixels = []
+            fractions = []
+            for icells in np.split(np.arange(index.ncell), bounds):
+                icells = icells[npix[icells] > 0]
+                if icells.size == 0:
+                    continue
+                icell = np.repeat(icells, npix[icells])
+                local = np.arange(icell.size) - np.repeat(
+                    np.cumsum(npix[icells]) - npix[icells], npix[icells]
+                )
+                irow = row0[icell] + local // ncol[icell]
+                icol = col0[icell] + local % ncol[icell]
+                # cell vertices relative to the lower left pixel corner
+                x = xv[icell] - (xmin + icol * xd)[:, None]
+                y = yv[icell] - (ymax - (irow + 1) * yd)[:, None]
+                x, y = self._clip_polygons(x, y, 0.0, 0, False)
+                x, y = self._clip_polygons(x, y, xd, 0, True)
+                x, y = self._clip_polygons(x, y, 0.0, 1, False)
+                x, y = self._clip_polygons(x, y, yd, 1, True)
+                area = 0.5 * np.abs(
+                    np.sum(
+                        x * np.roll(y, -1, axis=1)
+                        - np.roll(x, -1, axis=1) * y,
+                        axis=1,
+                    )
+                )
+                fraction = area / (xd * yd)
+                # pixels that only touch a cell
+                keep = fraction > 1e-9
+                cells.append(icell[keep])
+                pixels.append(irow[keep] * width + icol[keep])
+                fractions.append(fraction[keep])
+            if cells:
+                cells = np.concatenate(cells)
+                pixels = np.concatenate(pixels)
+                fractions = np.concatenate(fractions)
+            else:
+                cells = pixels = np.zeros(0, dtype=int)
+                fractions = np.zeros(0, dtype=float)
+            weights[key] = csr_matrix(
+                (fractions, (cells, pixels)),
+                shape=(index.ncell, width * height),
+            )
+        return weights[key]
+
+    @staticmethod
+    def _clip_polygons(x, y, value, axis, upper):
+        """
+        Internal method to clip polygons to a half plane with the
+        Sutherland-Hodgman algorithm.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            (npolygon, nvert) array with the x-coordinates of the vertex
+            rings of the polygons, rings can be padded with repeated
+            vertices
+        y : np.ndarray
+            (npolygon, nvert) array with the y-coordinates
+        value : float
+            coordinate of the boundary of the half plane
+        axis : int
+            0 for a boundary at x = value and 1 for y = value
+        upper : bool
+            keep the part of the polygons with coordinates less than
+            value if True and greater than value if False
+
+        Returns
+        -------
+            tuple : (x, y) padded vertex rings of the clipped polygons,
+            polygons outside of the half plane have all vertices at (0, 0)
+
+        """
+        c = x if axis == 0 else y
+        inside = c <= value if upper else c >= value
+        xn = np.roll(x, -1, axis=1)
+        yn = np.roll(y, -1, axis=1)
+        cn = xn if axis == 0 else yn
+        inside_n = np.roll(inside, -1, axis=1)
+
+        # intersection of the edges that cross the boundary
+        cross = inside != inside_n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(cross, (value - c) / (cn - c), 0.0)
+        if axis == 0:
+            xi = np.full(x.shape, float(value))
+            yi = y + t * (yn - y)
+        else:
+            xi = x + t * (xn - x)
+            yi = np.full(y.shape, float(value))
+
+        # each edge adds the intersection or the end vertex if the end
+        # vertex is inside, and the end vertex if the edge enters the
+        # half plane
+        npoly, nvert = x.shape
+        xo = np.stack((np.where(cross, xi, xn), xn), axis=2)
+        yo = np.stack((np.where(cross, yi, yn), yn), axis=2)
+        valid = np.stack((inside | inside_n, ~inside & inside_n), axis=2)
+        xo = xo.reshape(npoly, 2 * nvert)
+        yo = yo.reshape(npoly, 2 * nvert)
+        valid = valid.reshape(npoly, 2 * nvert)
+
+        # move the vertices to the front of the rings and pad the rings
+        # with their first vertex
+        count = valid.sum(axis=1)
+        nmax = max(count.max() if npoly > 0 else 0, 1)
+        irow, icol = np.nonzero(valid)
+        position = np.cumsum(valid, axis=1)[irow, icol] - 1
+        x = np.zeros((npoly, nmax), dtype=float)
+        y = np.zeros((npoly, nmax), dtype=float)
+        x[irow, position] = xo[irow, icol]
+        y[irow, position] = yo[irow, icol]
+        pad = np.arange(nmax)[None, :] >= count[:, None]
+        xo = np.where(pad, x[:, :1], x)
+        yo = np.where(pad, y[:, :1], y)
+        return xo, yo
+
+    def resample_to_modelgrid(self, modelgrid, band, method="mean"):
+        """
+        Method to compute statistics of the raster values in each cell
+        of a model grid. The raster values are assigned to the model cells
+        with the weight matrix from get_grid_weights(), which weights the
+        values by the area of the pixels in the model cells. Raster values
+        that are equal to a nodata value are ignored.
+
+        Parameters
+        ----------
+        modelgrid : flopy.discretization.StructuredGrid or VertexGrid
+            model grid in the coordinate system of the raster
+        band : int or list of int
+            raster band(s) to re-sample
+        method : str
+            statistic of the raster values in a model cell
+
+            "mean" for the area-weighted mean value
+            "median" for the area-weighted median value
+            "min" for the minimum value
+            "max" for the maximum value
+            "mode" for the value with the largest area, the smallest
+            value if more than one value has the largest area
+
+        Returns
+        -------
+            np.ndarray with a value for each model cell, model cells
+            without raster values are set to the first nodata value.
+            A dictionary of arrays by band is returned if band is a list.
+
+        """
+        methods = ("mean", "median", "min", "max", "mode")
+        if method not in methods:
+            raise ValueError(
+                "Raster().resample_to_modelgrid(): method must be one of "
+                "{}".format(", ".join(methods))
+            )
+
+        if isinstance(band, (list, tuple)):
+            return {
+                b: self.resample_to_modelgrid(modelgrid, b, method)
+                for b in band
+            }
+
+        weights = self.get_grid_weights(modelgrid)
+        ncell = weights.shape[0]
+
+        arr = self.get_array(band, masked=False).ravel().astype(float)
+        valid = ~np.isnan(arr)
+        for v in self.nodatavals:
+            if v is not None:
+                valid &= arr != v
+
+        if method == "mean":
+            total = weights.dot(np.where(valid, arr, 0.0))
+            count = weights.dot(valid.astype(float))
+            data = np.full(ncell, np.nan)
+            has_data = count > 0
+            data[has_data] = total[has_data] / count[has_data]
+        else:
+            data = self._get_cell_statistic(weights, arr, valid, method)
+
+        nodata = self.nodatavals[0]
+        if nodata is not None:
+            data[np.isnan(data)] = nodata
+
+        if modelgrid.grid_type == "structured":
+            data.shape = (modelgrid.nrow, modelgrid.ncol)
+        return data
+
+    @staticmethod
+    def _get_cell_statistic(weights, arr, valid, method):
+        """
+        Internal method to compute the area-weighted median, minimum,
+        maximum or mode of the raster values in each model cell from the
+        pixels of each row of the weight matrix.
+
+        Parameters
+        ----------
+        weights : scipy.sparse.csr_matrix
+            pixel weights of the model cells
+        arr : np.ndarray
+            flattened raster values
+        valid : np.ndarray
+            boolean array, False for nodata values
+        method : str
+            "median", "min", "max" or "mode"
+
+        Returns
+        -------
+            np.ndarray with a value for each model cell, np.nan for
+            model cells without raster values
+
+        """
+        ncell = weights.shape[0]
+        cells = np.repeat(np.arange(ncell), np.diff(weights.indptr))
+        pixels = weights.indices
+        ok = valid[pixels]
+        cells = cells[ok]
+        values = arr[pixels[ok]]
+        fractions = weights.data[ok]
+
+        # sort the values of each cell
+        order = np.lexsort((values, cells))
+        cells = cells[order]
+        values = values[order]
+        fractions = fractions[order]
+        start = np.searchsorted(cells, np.arange(ncell), side="left")
+        stop = np.searchsorted(cells, np.arange(ncell), side="right")
+        has_data = stop > start
+
+        data = np.full(ncell, np.nan)
+        if method == "min":
+            data[has_data] = values[start[has_data]]
+        elif method == "max":
+            data[has_data] = values[stop[has_data] - 1]
+        elif method == "median":
+            # first values where the cumulative weight of each cell reaches
+            # and passes half of the weight of the cell, the mean of two
+            # values if half of the weight is reached at the end of a value
+            n = stop - start
+            cumulative = np.append(0.0, np.cumsum(fractions))
+            position = cumulative[1:] - np.repeat(cumulative[start], n)
+            half = 0.5 * (cumulative[stop] - cumulative[start])
+            tol = np.repeat(1e-9 * half, n)
+            half = np.repeat(half, n)
+            lo = start + np.bincount(
+                cells, weights=position < half - tol, minlength=ncell
+            ).astype(int)
+            hi = start + np.bincount(
+                cells, weights=position <= half + tol, minlength=ncell
+            ).astype(int)
+            hi = np.minimum(hi, stop - 1)
+            data[has_data] = 0.5 * (
+                values[lo[has_data]] + values[hi[has_data]]
+            )
+        elif method == "mode":
+            # runs of equal values in each cell
+            if values.shape[0] > 0:
+                new_run = np.ones(values.shape[0], dtype=bool)
+                new_run[1:] = (cells[1:] != cells[:-1]) | (
+                    values[1:] != values[:-1]
+                )
+                irun = np.nonzero(new_run)[0]
+                count = np.add.reduceat(fractions, irun)
+                # run with the largest weight of each cell, the first run
+                # for ties
+                order = np.lexsort((-count, cells[irun]))
+                runcells = cells[irun][order]
+                first = np.ones(order.shape[0], dtype=bool)
+                first[1:] = runcells[1:] != runcells[:-1]
+                data[runcells[first]] = values[irun][order][first]
+        return data
+
     def crop(self, polygon, invert=False):
         """
         Method to crop a new raster object
@@ -443,36 +893,14 @@ class Raster(object):
 
             mask = self._intersection(polygon, invert)
 
-            xc = self.xcenters
-            yc = self.ycenters
-            # step 4: find bounding box
-            xba = np.copy(xc)
-            yba = np.copy(yc)
-            xba[~mask] = np.nan
-            yba[~mask] = np.nan
-
-            xmin = np.nanmin(xba)
-            xmax = np.nanmax(xba)
-            ymin = np.nanmin(yba)
-            ymax = np.nanmax(yba)
-
-            bbox = [(xmin, ymin), (xmin, ymax), (xmax, ymax), (xmax, ymin)]
-
-            # step 5: use bounding box to crop array
-            xind = []
-            yind = []
-            for pt in bbox:
-                xt = (pt[0] - xc) ** 2
-                yt = (pt[1] - yc) ** 2
-                hypot = np.sqrt(xt + yt)
-                ind = np.where(hypot == np.min(hypot))
-                yind.append(ind[0][0])
-                xind.append(ind[1][0])
-
-            xmii = np.min(xind)
-            xmai = np.max(xind)
-            ymii = np.min(yind)
-            ymai = np.max(yind)
+            # step 4: find bounding box of the raster cells in the mask
+            x, y = self._get_xycenters_1d()
+            cols = np.nonzero(np.any(mask, axis=0))[0]
+            rows = np.nonzero(np.any(mask, axis=1))[0]
+            xmii, xmai = cols[0], cols[-1]
+            ymii, ymai = rows[0], rows[-1]
+            xmin = x[xmii]
+            ymax = y[ymii]
 
             crp_mask = mask[ymii : ymai + 1, xmii : xmai + 1]
             nodata = self._meta["nodata"]
@@ -497,7 +925,7 @@ class Raster(object):
             xmin -= xd / 2.0
             ymax += yd / 2.0
 
-            # step 6: update metadata including a new Affine
+            # step 5: update metadata including a new Affine
             self._meta["height"] = crp_mask.shape[0]
             self._meta["width"] = crp_mask.shape[1]
             transform = self._meta["transform"]
@@ -588,7 +1016,8 @@ class Raster(object):
         ----------
         polygon : (shapely.geometry.Polygon or GeoJSON-like dict)
             The values should be a GeoJSON-like dict or object
-            implements the Python geo interface protocal.
+            implements the Python geo interface protocal. Polygons
+            with holes and multipolygons are supported.
 
             Alternatively if the user supplies the vectors
             of a polygon in the format [(x0, y0), ..., (xn, yn)]
@@ -604,45 +1033,146 @@ class Raster(object):
             mask : np.ndarray (dtype = bool)
 
         """
-        if shapely is None:
-            msg = (
-                "Raster()._intersection(): error "
-                + 'importing shapely try "pip install shapely"'
+        # step 1: get the vertex rings of the polygon(s)
+        rings = self._get_polygon_rings(polygon)
+        xy = np.concatenate(rings)
+        extent = (
+            xy[:, 0].min(),
+            xy[:, 0].max(),
+            xy[:, 1].min(),
+            xy[:, 1].max(),
+        )
+
+        # step 2: find the window of raster cells in the polygon extent
+        x, y = self._get_xycenters_1d()
+        row0, row1, col0, col1 = self._get_window(extent)
+
+        # step 3: do intersection in tiles of raster rows
+        mask = np.zeros((y.size, x.size), dtype=bool)
+        nrow = max(self.TILESIZE // max(col1 - col0, 1), 1)
+        for i0 in range(row0, row1, nrow):
+            i1 = min(i0 + nrow, row1)
+            mask[i0:i1, col0:col1] = self._rasterize_polygon(
+                x[col0:col1], y[i0:i1], rings
             )
-            raise ImportError(msg)
-        else:
-            from shapely import geometry
+        if invert:
+            mask = np.invert(mask)
+
+        return mask
 
-        # step 1: check the data type in shapes
-        if isinstance(polygon, geometry.Polygon):
-            polygon = list(polygon.exterior.coords)
+    @staticmethod
+    def _get_polygon_rings(polygon):
+        """
+        Internal method to get the exterior and interior vertex rings of a
+        polygon or multipolygon
 
-        elif isinstance(polygon, dict):
-            # geojson, get coordinates=
-            if polygon["geometry"]["type"].lower() == "polygon":
-                polygon = [
-                    [x, y] for x, y in polygon["geometry"]["coordinates"]
-                ]
+        Parameters
+        ----------
+        polygon : (shapely.geometry.Polygon or GeoJSON-like dict)
+            shapely Polygon or MultiPolygon, a GeoJSON-like dict or object
+            that implements the Python geo interface protocal, a list of
+            polygon vertices [(x0, y0), ..., (xn, yn)] or a list of
+            vertex rings
 
+        Returns
+        -------
+            list of (n, 2) np.ndarray vertex rings
+
+        """
+        if hasattr(polygon, "__geo_interface__"):
+            polygon = {"geometry": polygon.__geo_interface__}
+
+        if isinstance(polygon, dict):
+            # geojson, get coordinates
+            geom = polygon.get("geometry", polygon)
+            geom_type = geom["type"].lower()
+            if geom_type == "polygon":
+                coords = [geom["coordinates"]]
+            elif geom_type == "multipolygon":
+                coords = geom["coordinates"]
             else:
                 raise TypeError("Shape type must be a polygon")
+            rings = []
+            for part in coords:
+                if np.ndim(part[0]) == 1:
+                    # a single ring of vertices
+                    part = [part]
+                rings += [np.array(ring, dtype=float) for ring in part]
 
-        elif isinstance(polygon, np.ndarray):
-            # numpy array, change to a list
-            polygon = list(polygon)
+        elif np.ndim(polygon[0][0]) == 0:
+            # a list or array of polygon vertices
+            rings = [np.array(polygon, dtype=float)]
 
         else:
-            # this is a list of coordinates
-            pass
+            # a list of vertex rings
+            rings = [np.array(ring, dtype=float) for ring in polygon]
 
-        # step 2: create a grid of centoids
-        xc = self.xcenters
-        yc = self.ycenters
+        return [ring[:, :2] for ring in rings if len(ring) > 0]
 
-        # step 3: do intersection
-        mask = self._point_in_polygon(xc, yc, polygon)
-        if invert:
-            mask = np.invert(mask)
+    @staticmethod
+    def _rasterize_polygon(x, y, rings):
+        """
+        Scanline rasterization of polygons on the cell centers of a raster.
+        The crossings of the polygon edges with the raster rows are
+        computed for the rows that each edge spans, and the raster cells
+        between pairs of crossings are inside the polygon (even-odd rule,
+        so holes and multipolygons are supported).
+
+        Parameters
+        ----------
+        x : np.ndarray
+            increasing x-cell centers of the raster columns
+        y : np.ndarray
+            decreasing y-cell centers of the raster rows
+        rings : list
+            list of (n, 2) np.ndarray polygon vertex rings, rings can
+            be open or closed
+
+        Returns
+        -------
+        mask: np.array
+            True value means cell center is in polygon!
+
+        """
+        nrow, ncol = y.size, x.size
+        xi, yi, xj, yj = [], [], [], []
+        for ring in rings:
+            # edges from vertex j to vertex i, including the closing edge
+            xi.append(ring[:, 0])
+            yi.append(ring[:, 1])
+            xj.append(np.roll(ring[:, 0], 1))
+            yj.append(np.roll(ring[:, 1], 1))
+        xi, yi, xj, yj = [np.concatenate(a) for a in (xi, yi, xj, yj)]
+
+        # rows spanned by each edge: min(yi, yj) <= y < max(yi, yj)
+        row0 = np.searchsorted(-y, -np.maximum(yi, yj), side="right")
+        row1 = np.searchsorted(-y, -np.minimum(yi, yj), side="right")
+        count = np.maximum(row1 - row0, 0)
+        iedge = np.repeat(np.arange(count.size), count)
+        irow = np.arange(count.sum()) - np.repeat(
+            np.cumsum(count) - count, count
+        )
+        irow += row0[iedge]
+
+        # x-coordinate of the crossings of the edges with the rows
+        yr = y[irow]
+        xi, yi, xj, yj = xi[iedge], yi[iedge], xj[iedge], yj[iedge]
+        xcross = xi + (xj - xi) * (yr - yi) / (yj - yi)
+
+        # cells between the even and odd crossings of a row are inside
+        order = np.lexsort((xcross, irow))
+        irow = irow[order]
+        xcross = xcross[order]
+        rank = np.arange(irow.size) - np.searchsorted(irow, irow, side="left")
+        icol = np.searchsorted(x, xcross, side="left")
+        sign = np.where(rank % 2 == 0, 1, -1)
+
+        toggle = np.bincount(
+            irow * (ncol + 1) + icol,
+            weights=sign,
+            minlength=nrow * (ncol + 1),
+        ).reshape(nrow, ncol + 1)
+        mask = np.cumsum(toggle, axis=1)[:, :ncol] > 0
 
         return mask
 
@@ -656,11 +1186,12 @@ class Raster(object):
         Parameters
         ----------
         xc : np.ndarray
-            array of xpoints
+            2d array of raster x-cell centers
         yc : np.ndarray
-            array of ypoints
+            2d array of raster y-cell centers
         polygon : iterable (list)
-            polygon vertices [(x0, y0),....(xn, yn)]
+            polygon vertices [(x0, y0),....(xn, yn)] or a list of vertex
+            rings
             note: polygon can be open or closed
 
         Returns
@@ -669,34 +1200,8 @@ class Raster(object):
             True value means point is in polygon!
 
         """
-        x0, y0 = polygon[0]
-        xt, yt = polygon[-1]
-
-        # close polygon if it isn't already
-        if (x0, y0) != (xt, yt):
-            polygon.append((x0, y0))
-
-        ray_count = np.zeros(xc.shape, dtype=int)
-        num = len(polygon)
-        j = num - 1
-        for i in range(num):
-
-            tmp = polygon[i][0] + (polygon[j][0] - polygon[i][0]) * (
-                yc - polygon[i][1]
-            ) / (polygon[j][1] - polygon[i][1])
-
-            comp = np.where(
-                ((polygon[i][1] > yc) ^ (polygon[j][1] > yc)) & (xc < tmp)
-            )
-
-            j = i
-            if len(comp[0]) > 0:
-                ray_count[comp[0], comp[1]] += 1
-
-        mask = np.ones(xc.shape, dtype=bool)
-        mask[ray_count % 2 == 0] = False
-
-        return mask
+        rings = Raster._get_polygon_rings(polygon)
+        return Raster._rasterize_polygon(xc[0, :], yc[:, 0], rings)
 
     def get_array(self, band, masked=True):
         """
@@ -716,14 +1221,46 @@ class Raster(object):
         -------
             np.ndarray
 
+        """
+        return self._get_array_window(band, masked=masked)
+
+    def _get_array_window(self, band, window=None, masked=True):
+        """
+        Internal method to get the values of a raster band in a window
+        of raster rows and columns, only the window is read from raster
+        datasets
+
+        Parameters
+        ----------
+        band : int
+            band number from the raster
+        window : tuple
+            (row0, row1, col0, col1) of the window, None for the whole
+            raster
+        masked : bool
+            determines if nodatavals will be returned as np.nan to
+            the user
+
+        Returns
+        -------
+            np.ndarray
+
         """
         if band not in self.bands:
             raise ValueError("Band {} not a valid value")
 
+        if window is None:
+            window = (0, self._meta["height"], 0, self._meta["width"])
+        row0, row1, col0, col1 = window
+
         if self._dataset is None:
-            array = np.copy(self.__arr_dict[band])
+            array = np.copy(self.__arr_dict[band][row0:row1, col0:col1])
         else:
-            array = self._dataset.read(band)
+            from rasterio.windows import Window
+
+            array = self._dataset.read(
+                band, window=Window(col0, row0, col1 - col0, row1 - row0)
+            )
 
         if masked:
             for v in self.nodatavals:
@@ -757,7 +1294,7 @@ class Raster(object):
                 foo.write(arr, band)
 
     @staticmethod
-    def load(raster):
+    def load(raster, extent=None):
         """
         Static method to load a raster file
         into the raster object
@@ -765,6 +1302,11 @@ class Raster(object):
         Parameters
         ----------
         raster : str
+        extent : Grid, polygon or tuple
+            optional area of interest, only the raster cells that cover
+            the extent of a model grid, of a polygon (shapely polygon,
+            GeoJSON-like dict or list of vertices) or of a
+            (xmin, xmax, ymin, ymax) tuple are read from the file
 
         Returns
         -------
@@ -779,15 +1321,37 @@ class Raster(object):
             raise ImportError(msg)
 
         dataset = rasterio.open(raster)
-        array = dataset.read()
         bands = dataset.indexes
         meta = dataset.meta
+        transform = meta["transform"]
+        if extent is None:
+            array = dataset.read()
+        else:
+            from rasterio.windows import Window, from_bounds
+
+            xmin, xmax, ymin, ymax = Raster._get_extent(extent)
+            window = from_bounds(xmin, ymin, xmax, ymax, transform=transform)
+            col0 = max(int(np.floor(window.col_off)), 0)
+            row0 = max(int(np.floor(window.row_off)), 0)
+            col1 = min(
+                int(np.ceil(window.col_off + window.width)), dataset.width
+            )
+            row1 = min(
+                int(np.ceil(window.row_off + window.height)), dataset.height
+            )
+            if col1 <= col0 or row1 <= row0:
+                raise ValueError(
+                    "Raster().load(): extent does not overlap the raster"
+                )
+            window = Window(col0, row0, col1 - col0, row1 - row0)
+            array = dataset.read(window=window)
+            transform = dataset.window_transform(window)
 
         return Raster(
             array,
             bands,
             meta["crs"],
-            meta["transform"],
+            transform,
             meta["nodata"],
             meta["driver"],
         )
@@ -0,0 +1,458 @@
+"""
+Module to collect time step telemetry of a model run from the model stdout
+and the model listing files while the model is running.
+
+"""
+import os
+import re
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# lines that report the time step they belong to
+_step_re = (
+    re.compile(
+        r"time\s+step\s+(\d+)\s*,?\s*(?:in\s+)?stress\s+period\s+(\d+)", re.I
+    ),
+    re.compile(r"stress\s+period\s+(\d+)\s*,?\s*time\s+step\s+(\d+)", re.I),
+)
+# "9 CALLS TO NUMERICAL SOLUTION IN TIME STEP 1 STRESS PERIOD 1" (MF6) and
+# "5 CALLS TO PCG ROUTINE FOR TIME STEP 1 IN STRESS PERIOD 1" (MF2005)
+_calls_re = re.compile(
+    r"^\s*(\d+)\s+calls\s+to\s+.*?time\s+step\s+(\d+)\s*,?\s*"
+    r"(?:in\s+)?stress\s+period\s+(\d+)",
+    re.I,
+)
+_total_iterations_re = re.compile(r"^\s*(\d+)\s+total\s+iterations", re.I)
+# MODFLOW-NWT solver summary
+_nwt_outer_re = re.compile(
+    r"nwt\s+required\s+(\d+)\s+outer\s+iterations", re.I
+)
+_nwt_inner_re = re.compile(r"total\s+of\s+(\d+)\s+inner\s+iterations", re.I)
+# maximum change tables of the MODFLOW solvers, the values are followed
+# by the layer, row and column of the cell on the same line (SIP, SOR and
+# PCG2) or the lines of values and of cells alternate (PCG)
+_change_table_re = re.compile(
+    r"maximum\s+(?:head\s+)?change\s+for\s+each\s+iteration", re.I
+)
+_change_value_re = re.compile(
+    r"([-+]?(?:\d+\.?\d*|\.\d+)(?:[ed][-+]?\d+)?)\s*\(\s*\d+\s*,", re.I
+)
+_change_cell_re = re.compile(r"^\s*(?:\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\)\s*)+$")
+_budget_re = re.compile(r"budget\s+for\s+entire\s+model", re.I)
+_discrepancy_re = re.compile(
+    r"percent\s+discrepancy\s*=\s*(\S+)\s+percent\s+discrepancy\s*=\s*(\S+)",
+    re.I,
+)
+
+
+def _to_float(s):
+    try:
+        return float(s.lower().replace("d", "e"))
+    except ValueError:
+        return None
+
+
+def _get_listing_files(model_ws, namefile):
+    """
+    Get the listing files of a model from the LIST entry of the namefile,
+    or mfsim.lst and the listing files of the models of a MODFLOW 6
+    simulation if namefile is None
+
+    """
+    if namefile is not None:
+        fpth = os.path.join(model_ws, namefile)
+        if os.path.isfile(fpth):
+            with open(fpth) as f:
+                for line in f:
+                    t = line.split()
+                    if len(t) > 2 and t[0].upper() == "LIST":
+                        return [os.path.join(model_ws, t[2])]
+        return []
+
+    listing_files = [os.path.join(model_ws, "mfsim.lst")]
+    fpth = os.path.join(model_ws, "mfsim.nam")
+    if not os.path.isfile(fpth):
+        return listing_files
+    model_namefiles = []
+    with open(fpth) as f:
+        block = None
+        for line in f:
+            t = line.split()
+            if not t or t[0].startswith("#"):
+                continue
+            if t[0].upper() == "BEGIN" and len(t) > 1:
+                block = t[1].upper()
+            elif t[0].upper() == "END":
+                block = None
+            elif block == "MODELS" and len(t) > 1:
+                model_namefiles.append(t[1])
+    for nam in model_namefiles:
+        lst = os.path.splitext(nam)[0] + ".lst"
+        fpth = os.path.join(model_ws, nam)
+        if os.path.isfile(fpth):
+            with open(fpth) as f:
+                for line in f:
+                    t = line.split()
+                    if t and t[0].upper() == "BEGIN":
+                        if len(t) > 1 and t[1].upper() != "OPTIONS":
+                            break
+                    elif len(t) > 1 and t[0].upper() == "LIST":
+                        lst = t[1]
+                        break
+        listing_files.append(os.path.join(model_ws, lst))
+    return listing_files
+
+
+class _ListingParser(object):
+    """
+    Incremental parser of a listing file that is being written by a model
+
+    """
+
+    def __init__(self, telemetry, fpth):
+        self._telemetry = telemetry
+        self.fpth = fpth
+        self.last_step = None
+        self._offset = 0
+        self._partial = b""
+        self._calls_step = None
+        self._budget_step = None
+        self._pending = {}
+        self._change_table = False
+        self._mf6_table = False
+        self._table_rows = False
+
+    def read(self, t0=None):
+        """
+        Parse the lines that have been added to the listing file since the
+        last call, files older than t0 are not parsed
+
+        """
+        try:
+            stat = os.stat(self.fpth)
+        except OSError:
+            return
+        if self._offset == 0 and t0 is not None and stat.st_mtime < t0 - 1:
+            # listing file of a previous run
+            return
+        if stat.st_size < self._offset:
+            # the listing file has been rewritten
+            self.__init__(self._telemetry, self.fpth)
+        if stat.st_size == self._offset:
+            return
+        with open(self.fpth, "rb") as f:
+            f.seek(self._offset)
+            data = self._partial + f.read()
+            self._offset = f.tell()
+        lines = data.split(b"\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._parse_line(line.decode(errors="replace"))
+
+    def _set_step(self, key):
+        """
+        Set the time step of the solver values that did not report it
+        """
+        if self.last_step is None or key > self.last_step:
+            self.last_step = key
+        for name, value in self._pending.items():
+            self._telemetry._set_value(key, name, value)
+        self._pending = {}
+
+    @staticmethod
+    def _get_change(line):
+        """
+        Get the last maximum change of a row of a maximum change table
+        """
+        values = _change_value_re.findall(line)
+        if values:
+            return _to_float(values[-1])
+        # values without cells, the values may be preceded by integer
+        # flags that indicate the first inner iteration
+        t = line.split()
+        if t and not t[-1].lstrip("+-").isdigit():
+            if all(_to_float(i) is not None for i in t):
+                return _to_float(t[-1])
+        return None
+
+    def _parse_line(self, line):
+        if not line.strip():
+            # tables end at the first blank line after the table rows
+            if self._table_rows:
+                self._change_table = self._mf6_table = False
+                self._table_rows = False
+            return
+
+        if self._change_table or self._mf6_table:
+            if self._change_table:
+                value = self._get_change(line)
+                if value is None and _change_cell_re.match(line):
+                    # cells of the preceding line of values
+                    return
+            else:
+                # MF6 outer iteration summary, the maximum change is
+                # followed by the model and cell id of the change
+                t = line.split()
+                value = None
+                if len(t) > 2 and _to_float(t[-1]) is None:
+                    value = _to_float(t[-2])
+            if value is not None:
+                self._pending["max_change"] = value
+                self._table_rows = True
+                return
+            elif self._table_rows:
+                self._change_table = self._mf6_table = False
+                self._table_rows = False
+
+        if _change_table_re.search(line):
+            self._change_table = True
+            self._table_rows = False
+            return
+        if "OUTER ITERATION SUMMARY" in line.upper():
+            self._mf6_table = True
+            self._table_rows = False
+            return
+
+        match = _calls_re.match(line)
+        if match is not None:
+            key = (int(match.group(3)) - 1, int(match.group(2)) - 1)
+            self._set_step(key)
+            self._telemetry._add_value(key, "outer", int(match.group(1)))
+            self._calls_step = key
+            return
+        match = _total_iterations_re.match(line)
+        if match is not None:
+            if self._calls_step is not None:
+                self._telemetry._add_value(
+                    self._calls_step, "inner", int(match.group(1))
+                )
+                self._calls_step = None
+            return
+        match = _nwt_outer_re.search(line)
+        if match is not None:
+            self._pending["outer"] = int(match.group(1))
+            return
+        match = _nwt_inner_re.search(line)
+        if match is not None:
+            self._pending["inner"] = int(match.group(1))
+            return
+
+        match = _discrepancy_re.search(line)
+        if match is not None:
+            if self._budget_step is not None:
+                # percent discrepancy of the rates of the time step
+                value = _to_float(match.group(2))
+                if value is not None:
+                    self._telemetry._set_discrepancy(self._budget_step, value)
+                self._budget_step = None
+            return
+
+        for ix, step_re in enumerate(_step_re):
+            match = step_re.search(line)
+            if match is not None:
+                kstp, kper = match.group(1), match.group(2)
+                if ix == 1:
+                    kstp, kper = kper, kstp
+                key = (int(kper) - 1, int(kstp) - 1)
+                self._set_step(key)
+                if _budget_re.search(line):
+                    self._budget_step = key
+                break
+
+
+class RunTelemetry(object):
+    """
+    Collect time step telemetry of a model run: the wall time of each time
+    step from the model stdout and the solver iterations, maximum change
+    and budget percent discrepancy from the listing files, which are
+    parsed while they are written.
+
+    A RunTelemetry object is passed as the callback of run_model(),
+    run_model_async(), BaseModel.run_model() or
+    MFSimulation.run_simulation(). It can also be used to summarize the
+    listing files of a model that has already been run.
+
+    Parameters
+    ----------
+    model_ws : str
+        model workspace (default is the current working directory)
+    namefile : str
+        namefile of the model, None for a MODFLOW 6 simulation, in which
+        case mfsim.lst and the listing files of the models are parsed
+        (default is None)
+    callback : function
+        function called with a record of the summary for each time step
+        when the time step has finished (default is None)
+    listing_files : list
+        listing files to parse, overrides the listing files found from
+        the namefile (default is None)
+
+    Attributes
+    ----------
+    dtype : np.dtype
+        dtype of the summary records: zero-based kper and kstp, walltime
+        in seconds, outer and inner solver iterations (-1 if not
+        reported), max_change of the last outer iteration and the percent
+        discrepancy of the rates of the budget of the time step (nan if
+        not reported)
+
+    Notes
+    -----
+    Outer and inner iterations are read from MODFLOW 6 and MODFLOW-2005
+    style "calls to ... total iterations" summaries and from the
+    MODFLOW-NWT iteration summary. The maximum change is read from the
+    MODFLOW 6 outer iteration summary and the maximum head change tables
+    of the MODFLOW-2005 solvers, which must be printed to the listing
+    file. The percent discrepancy is only available for time steps for
+    which the budget is printed.
+
+    Values that have not yet been written to the listing files when a
+    time step is passed to the callback are missing in the callback
+    record, the summary after the run holds all values.
+
+    Examples
+    --------
+
+    >>> import flopy
+    >>> sim = flopy.mf6.MFSimulation.load(sim_ws='model')
+    >>> telemetry = flopy.utils.RunTelemetry('model', callback=print)
+    >>> success, buff = sim.run_simulation(callback=telemetry)
+    >>> summary = telemetry.get_summary()
+    >>> slowest = summary[np.argsort(summary.walltime)[::-1][:10]]
+
+    """
+
+    dtype = np.dtype(
+        [
+            ("kper", int),
+            ("kstp", int),
+            ("walltime", float),
+            ("outer", int),
+            ("inner", int),
+            ("max_change", float),
+            ("discrepancy", float),
+        ]
+    )
+
+    def __init__(
+        self, model_ws=".", namefile=None, callback=None, listing_files=None
+    ):
+        self.model_ws = model_ws
+        self.callback = callback
+        if listing_files is None:
+            listing_files = _get_listing_files(model_ws, namefile)
+        self._listings = [_ListingParser(self, f) for f in listing_files]
+        self._records = OrderedDict()
+        self._start = {}
+        self._current = None
+        self._reported = set()
+        self._t0 = None
+        self.success = None
+
+    @property
+    def listing_files(self):
+        """
+        Paths of the listing files that are parsed
+        """
+        return [parser.fpth for parser in self._listings]
+
+    def _get_record(self, key):
+        record = self._records.get(key)
+        if record is None:
+            record = self._records[key] = [
+                key[0],
+                key[1],
+                np.nan,
+                -1,
+                -1,
+                np.nan,
+                np.nan,
+            ]
+        return record
+
+    def _set_value(self, key, name, value):
+        self._get_record(key)[self.dtype.names.index(name)] = value
+
+    def _add_value(self, key, name, value):
+        # solver calls of multiple solutions or repeated time steps add up
+        record = self._get_record(key)
+        ix = self.dtype.names.index(name)
+        record[ix] = value if record[ix] < 0 else record[ix] + value
+
+    def _set_discrepancy(self, key, value):
+        # keep the largest discrepancy of the models of a simulation
+        record = self._get_record(key)
+        if not abs(record[6]) >= abs(value):
+            record[6] = value
+
+    def _end_step(self, elapsed):
+        if self._current is not None:
+            self._set_value(
+                self._current, "walltime", elapsed - self._start[self._current]
+            )
+            self._current = None
+
+    def __call__(self, event):
+        """
+        Process a flopy.mbase.RunEvent of the model run
+
+        """
+        if self._t0 is None:
+            self._t0 = time.time() - event.elapsed
+        if event.kind == "timestep":
+            key = (event.kper, event.kstp)
+            if key == self._current:
+                return
+            self._end_step(event.elapsed)
+            self._get_record(key)
+            # keep the start of repeated time steps
+            self._start.setdefault(key, event.elapsed)
+            self._current = key
+            self._report(final=False)
+        elif event.kind == "finished":
+            self._end_step(event.elapsed)
+            self.success = event.success
+            self._report(final=True)
+
+    def _read_listings(self):
+        for parser in self._listings:
+            parser.read(self._t0)
+
+    def _report(self, final=False):
+        """
+        Pass the records of the finished time steps to the callback
+        """
+        self._read_listings()
+        if self.callback is None:
+            return
+        last = [p.last_step for p in self._listings if p.last_step is not None]
+        last = max(last) if last else None
+        for key, record in self._records.items():
+            if key in self._reported or key == self._current:
+                continue
+            if not final:
+                if np.isnan(record[2]):
+                    continue
+                # wait for the listing files to reach the time step
+                if self._listings and (last is None or last <= key):
+                    continue
+            self._reported.add(key)
+            record = np.array([tuple(record)], dtype=self.dtype)
+            self.callback(record.view(np.recarray)[0])
+
+    def get_summary(self):
+        """
+        Get the telemetry of each time step
+
+        Returns
+        -------
+        np.recarray
+            telemetry of each time step sorted by stress period and time
+            step, see the dtype attribute
+
+        """
+        self._read_listings()
+        records = [tuple(self._records[key]) for key in sorted(self._records)]
+        return np.array(records, dtype=self.dtype).view(np.recarray)
@@ -1,3 +1,7 @@
+import os
+import json
+import warnings
+import collections
 import numpy as np
 
 
@@ -13,6 +17,11 @@ class SfrFile:
         Ignored
     verbose : any
         Ignored
+    cache : str
+        Directory with a columnar binary cache of the file written by
+        write_cache(). The cache is written if it does not exist or is out
+        of date, and results are read from the memory-mapped cache files.
+        Default is None (read the results from the file).
 
     Attributes
     ----------
@@ -45,7 +54,7 @@ class SfrFile:
         "reach": int,
     }
 
-    def __init__(self, filename, geometries=None, verbose=False):
+    def __init__(self, filename, geometries=None, verbose=False, cache=None):
         """
         Class constructor.
         """
@@ -114,10 +123,22 @@ class SfrFile:
                 self.names.append("gw_head")
         if has_elevation:
             self.names.append("strtop")
-        self.times = self.get_times()
         self.geoms = None  # not implemented yet
+        self.cache = cache
+        self._times = None
+        self._columns = None
+        self._index = None
         self._df = None
 
+    @property
+    def times(self):
+        """
+        List of kstp, kper tuples in the file
+        """
+        if self._times is None:
+            self._times = self.get_times()
+        return self._times
+
     def get_times(self):
         """
         Parse the stress period/timestep headers.
@@ -128,15 +149,219 @@ class SfrFile:
             list of kstp, kper tuples
 
         """
+        if self._times is not None:
+            return list(self._times)
         kstpkper = []
         with open(self.filename) as input:
             for line in input:
                 if "STEP" in line:
-                    line = line.strip().split()
-                    kper, kstp = int(line[3]) - 1, int(line[5]) - 1
-                    kstpkper.append((kstp, kper))
+                    kstpkper.append(self._parse_header(line))
         return kstpkper
 
+    @staticmethod
+    def _parse_header(line):
+        line = line.strip().split()
+        kper, kstp = int(line[3]) - 1, int(line[5]) - 1
+        return kstp, kper
+
+    @property
+    def dtype(self):
+        """
+        numpy dtype of the results, with the zero-based kstp and kper of
+        each record
+        """
+        return np.dtype(
+            [(name, self.dtypes.get(name, float)) for name in self.names]
+            + [("kstp", int), ("kper", int)]
+        )
+
+    def _parse_lines(self, lines):
+        """
+        Parse a block of data lines with the same number of columns in a
+        single call.
+        """
+        ncol = self.ncol
+        with warnings.catch_warnings():
+            # blocks that can not be parsed in bulk are handled below
+            warnings.simplefilter("ignore", DeprecationWarning)
+            values = np.fromstring("".join(lines), dtype=float, sep=" ")
+        if values.size != len(lines) * ncol:
+            # skip lines with a different number of values
+            rows = [line.split() for line in lines]
+            rows = [row for row in rows if len(row) == ncol]
+            values = np.array(rows, dtype=float)
+        return values.reshape(-1, ncol)[:, : len(self.names)]
+
+    def _iter_chunks(self, chunksize=100000):
+        """
+        Stream the file in blocks of chunksize lines and parse the data
+        lines of each block in bulk.
+        """
+        dtype = self.dtype
+        times = []
+        kstpkper = None
+        with open(self.filename) as f:
+            while True:
+                block = f.readlines(chunksize * 160)
+                if not block:
+                    break
+                ihdr = [i for i, line in enumerate(block) if "STEP" in line]
+                bounds = [0] + ihdr + [len(block)]
+                values = []
+                steps = []
+                for i0, i1 in zip(bounds[:-1], bounds[1:]):
+                    if i0 in ihdr:
+                        kstpkper = self._parse_header(block[i0])
+                        times.append(kstpkper)
+                        i0 += 1
+                    lines = [
+                        line
+                        for line in block[i0:i1]
+                        if line.lstrip()[:1].isdigit()
+                    ]
+                    if lines and kstpkper is not None:
+                        v = self._parse_lines(lines)
+                        values.append(v)
+                        steps.append(np.tile(kstpkper, (v.shape[0], 1)))
+                if not values:
+                    continue
+                values = np.concatenate(values)
+                steps = np.concatenate(steps)
+                chunk = np.empty(values.shape[0], dtype=dtype)
+                for icol, name in enumerate(self.names):
+                    chunk[name] = values[:, icol]
+                chunk["kstp"] = steps[:, 0]
+                chunk["kper"] = steps[:, 1]
+                yield chunk
+        self._times = times
+
+    def iter_data(self, chunksize=100000):
+        """
+        Iterate over the results in chunks of records without loading the
+        whole file.
+
+        Parameters
+        ----------
+        chunksize : int
+            Approximate number of lines read from the file at a time.
+            (default is 100000)
+
+        Returns
+        -------
+        chunks : generator of numpy recarrays
+            results with the zero-based kstp and kper of each record
+
+        """
+        columns = self._get_columns()
+        if columns is None:
+            for chunk in self._iter_chunks(chunksize):
+                yield chunk.view(np.recarray)
+        else:
+            nrec = len(next(iter(columns.values())))
+            for i0 in range(0, nrec, chunksize):
+                chunk = np.empty(min(chunksize, nrec - i0), self.dtype)
+                for name in chunk.dtype.names:
+                    chunk[name] = columns[name][i0 : i0 + chunksize]
+                yield chunk.view(np.recarray)
+
+    def write_cache(self, cachedir, chunksize=100000):
+        """
+        Convert the file to a columnar binary cache that can be memory
+        mapped. The file is streamed in blocks and one binary file is
+        written for each column of the results.
+
+        Parameters
+        ----------
+        cachedir : str
+            Directory for the cache files
+        chunksize : int
+            Approximate number of lines read from the file at a time.
+            (default is 100000)
+
+        """
+        if not os.path.isdir(cachedir):
+            os.makedirs(cachedir)
+        dtype = self.dtype
+        files = [
+            open(os.path.join(cachedir, name + ".bin"), "wb")
+            for name in dtype.names
+        ]
+        nrec = 0
+        for chunk in self._iter_chunks(chunksize):
+            for name, f in zip(dtype.names, files):
+                chunk[name].tofile(f)
+            nrec += chunk.shape[0]
+        for f in files:
+            f.close()
+
+        # write the cache metadata last so an incomplete cache is not used
+        stat = os.stat(self.filename)
+        meta = {
+            "source": os.path.abspath(self.filename),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "nrec": nrec,
+            "times": [list(kstpkper) for kstpkper in self._times],
+            "columns": [[name, dtype[name].str] for name in dtype.names],
+        }
+        with open(os.path.join(cachedir, "cache.json"), "w") as f:
+            json.dump(meta, f, indent=1)
+        return
+
+    def get_cache(self, cachedir):
+        """
+        Get memory-mapped columns from a cache written by write_cache().
+
+        Parameters
+        ----------
+        cachedir : str
+            Directory with the cache files
+
+        Returns
+        -------
+        columns : OrderedDict or None
+            numpy memmap (read-only) of each column of the results. None
+            is returned if the cache does not exist or if the file has
+            changed since the cache was written.
+
+        """
+        fpth = os.path.join(cachedir, "cache.json")
+        if not os.path.isfile(fpth):
+            return None
+        with open(fpth) as f:
+            meta = json.load(f)
+        stat = os.stat(self.filename)
+        if (
+            meta["size"] != stat.st_size
+            or meta["mtime"] != stat.st_mtime
+            or meta["source"] != os.path.abspath(self.filename)
+        ):
+            return None
+        nrec = meta["nrec"]
+        columns = collections.OrderedDict()
+        for name, dtype in meta["columns"]:
+            if nrec > 0:
+                columns[name] = np.memmap(
+                    os.path.join(cachedir, name + ".bin"),
+                    dtype=np.dtype(dtype),
+                    mode="r",
+                    shape=(nrec,),
+                )
+            else:
+                columns[name] = np.zeros(0, dtype=np.dtype(dtype))
+        if self._times is None:
+            self._times = [tuple(kstpkper) for kstpkper in meta["times"]]
+        return columns
+
+    def _get_columns(self):
+        # memory-mapped columns of the cache, written if necessary
+        if self._columns is None and self.cache is not None:
+            self._columns = self.get_cache(self.cache)
+            if self._columns is None:
+                self.write_cache(self.cache)
+                self._columns = self.get_cache(self.cache)
+        return self._columns
+
     @property
     def df(self):
         if self._df is None:
@@ -170,46 +395,88 @@ class SfrFile:
             SFR output as a pandas dataframe
 
         """
-
-        df = self.pd.read_csv(
-            self.filename,
-            delim_whitespace=True,
-            header=None,
-            names=self.names,
-            error_bad_lines=False,
-            skiprows=self.sr,
-            low_memory=False,
-        )
-
-        # drop text between stress periods; convert to numeric
-        df["layer"] = self.pd.to_numeric(df.layer, errors="coerce")
-        df.dropna(axis=0, inplace=True)
-
-        # convert to proper dtypes
-        for c in df.columns:
-            df[c] = df[c].astype(self.dtypes.get(c, float))
-
-        # add time, reachID, and reach geometry (if it exists)
+        columns = self._get_columns()
+        if columns is None:
+            chunks = list(self._iter_chunks())
+            if chunks:
+                data = np.concatenate(chunks)
+            else:
+                data = np.zeros(0, dtype=self.dtype)
+            columns = {name: data[name] for name in data.dtype.names}
+        df = self._get_dataframe(columns)
+
+        # add reach geometry (if it exists)
         self.nstrm = self.get_nstrm(df)
-        dftimes = []
-        times = self.get_times()
-        newper = df.segment.diff().fillna(0).values < 0
-        kstpkper = times.pop(0)
-        for per in newper:
-            if per:
-                kstpkper = times.pop(0)
-            dftimes.append(kstpkper)
-        df["kstpkper"] = dftimes
-        df["k"] = df["layer"] - 1
-        df["i"] = df["row"] - 1
-        df["j"] = df["column"] - 1
-
         if self.geoms is not None:
             geoms = self.geoms * self.nstrm
             df["geometry"] = geoms
         self._df = df
         return df
 
+    def _get_dataframe(self, columns, rows=None):
+        # dataframe with time and zero-based k, i, j of all or a selection
+        # of the records
+        names = self.names + ["kstp", "kper"]
+        if rows is None:
+            data = {name: np.array(columns[name]) for name in names}
+        else:
+            data = {name: columns[name][rows] for name in names}
+        df = self.pd.DataFrame(
+            {name: data[name] for name in self.names},
+            columns=self.names,
+            index=rows,
+        )
+        df["kstpkper"] = list(
+            zip(data["kstp"].tolist(), data["kper"].tolist())
+        )
+        df["k"] = df["layer"] - 1
+        df["i"] = df["row"] - 1
+        df["j"] = df["column"] - 1
+        return df
+
+    def _get_index(self):
+        """
+        Build the index of the records of each (segment, reach). If all
+        time steps have the same reaches in the same order, the position of
+        each reach in a time step is stored.
+        """
+        if self._index is not None:
+            return self._index
+        columns = self._get_columns()
+        if columns is None:
+            segment = self.df.segment.values
+            reach = self.df.reach.values
+        else:
+            segment = np.asarray(columns["segment"])
+            reach = np.asarray(columns["reach"])
+        nrec = segment.shape[0]
+        if nrec == 0:
+            self._index = {}
+            return self._index
+        nreach = reach.max() + 1
+        keys = segment.astype(np.int64) * nreach + reach
+
+        # number of reaches in the first time step
+        nstrm = np.nonzero(keys == keys[0])[0]
+        nstrm = nstrm[1] if nstrm.size > 1 else nrec
+        if nrec % nstrm == 0 and np.all(
+            keys.reshape(-1, nstrm) == keys[:nstrm]
+        ):
+            self._ntimestep = nrec // nstrm
+            self._nstrm = nstrm
+            pos = np.arange(nstrm)
+            ukeys, ipos = keys[:nstrm], pos
+        else:
+            self._nstrm = None
+            order = np.argsort(keys, kind="stable")
+            ukeys, ipos = np.unique(keys[order], return_index=True)
+            ipos = np.split(order, ipos[1:])
+        self._index = {
+            (int(key // nreach), int(key % nreach)): i
+            for key, i in zip(ukeys.tolist(), ipos)
+        }
+        return self._index
+
     def _get_result(self, segment, reach):
         """
 
@@ -224,9 +491,15 @@ class SfrFile:
         -------
 
         """
-        return self.df.loc[
-            (self.df.segment == segment) & (self.df.reach == reach)
-        ].copy()
+        rows = self._get_index().get((segment, reach))
+        if rows is None:
+            rows = np.zeros(0, dtype=int)
+        elif self._nstrm is not None:
+            rows = rows + self._nstrm * np.arange(self._ntimestep)
+        columns = self._get_columns()
+        if columns is None:
+            return self.df.iloc[rows].copy()
+        return self._get_dataframe(columns, rows)
 
     def get_results(self, segment, reach):
         """
@@ -251,11 +524,15 @@ class SfrFile:
             results = self._get_result(segment, reach)
         except:
             locsr = list(zip(segment, reach))
-            results = self.pd.DataFrame()
+            results = []
             for s, r in locsr:
                 srresults = self._get_result(s, r)
                 if len(srresults) > 0:
-                    results = results.append(srresults)
+                    results.append(srresults)
                 else:
                     print("No results for segment {}, reach {}!".format(s, r))
+            if results:
+                results = self.pd.concat(results)
+            else:
+                results = self.pd.DataFrame()
         return results
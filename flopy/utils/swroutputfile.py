@@ -1,3 +1,4 @@
+import os
 import sys
 import numpy as np
 from collections import OrderedDict
@@ -276,18 +277,18 @@ class SwrFile(FlopyBinaryData):
 
         Parameters
         ----------
-        irec : int
+        irec : int or list of ints
             is the zero-based reach (stage, qm, qaq) or reach group number
             (budget) to retrieve. (default is 0)
-        iconn : int
+        iconn : int or list of ints
             is the zero-based connection number for reach (irch) to retrieve
             qm data. iconn is only used if qm data is being read.
             (default is 0)
-        klay : int
+        klay : int or list of ints
             is the zero-based layer number for reach (irch) to retrieve
             qaq data . klay is only used if qaq data is being read.
             (default is 0)
-        klay : int
+        istr : int or list of ints
             is the zero-based structure number for reach (irch) to retrieve
             structure data . isrt is only used if structure data is being read.
             (default is 0)
@@ -298,7 +299,9 @@ class SwrFile(FlopyBinaryData):
             Array has size (ntimes, nitems).  The first column in the
             data array will contain time (totim). nitems is 2 for stage
             data, 15 for budget data, 3 for qm data, and 11 for qaq
-            data.
+            data. If a list of reaches is passed, the array has size
+            (ntimes, nreach) and the time series of all reaches are read
+            at once.
 
         See Also
         --------
@@ -313,7 +316,7 @@ class SwrFile(FlopyBinaryData):
 
         """
 
-        if irec + 1 > self.nrecord:
+        if np.max(irec) + 1 > self.nrecord:
             err = "Error: specified irec ({}) ".format(
                 irec
             ) + "exceeds the total number of records ()".format(self.nrecord)
@@ -402,132 +405,97 @@ class SwrFile(FlopyBinaryData):
         self.out_dtype = np.dtype(temp)
         return
 
-    def _read_header(self):
-        nitems = 0
-        if self.type == "exchange" or self.type == "structure":
-            itemlist = np.zeros(self.nrecord, np.int)
-            try:
-                for i in range(self.nrecord):
-                    itemlist[i] = self.read_integer()
-                    nitems += itemlist[i]
-                self.nitems = nitems
-            except:
-                if self.verbose:
-                    sys.stdout.write("\nCould not read itemlist")
-                return 0.0, 0.0, 0, 0, 0, False
-        try:
-            totim = self.read_real()
-            dt = self.read_real()
-            kper = self.read_integer() - 1
-            kstp = self.read_integer() - 1
-            kswr = self.read_integer() - 1
-            if self.type == "exchange" or self.type == "structure":
-                self.nentries[totim] = (nitems, itemlist)
-            return totim, dt, kper, kstp, kswr, True
-        except:
-            return 0.0, 0.0, 0, 0, 0, False
-
     def _get_ts(self, irec=0):
 
-        # create array
-        gage_record = np.zeros(self._ntimes, dtype=self.out_dtype)
-
-        # iterate through the record dictionary
-        idx = 0
-        for key, value in self.recorddict.items():
-            totim = np.array(key)
-            gage_record["totim"][idx] = totim
+        # gather the records of the reaches at all times
+        data = self._data["data"][:, irec]
 
-            self.file.seek(value)
-            r = self._get_data()
-            for name in r.dtype.names:
-                gage_record[name][idx] = r[name][irec]
-            idx += 1
+        # create array
+        gage_record = np.zeros(data.shape, dtype=self.out_dtype)
+        gage_record["totim"] = self._times.reshape(
+            (-1,) + (1,) * (data.ndim - 1)
+        )
+        for name in self.dtype.names:
+            gage_record[name] = data[name]
 
         return gage_record.view(dtype=self.out_dtype)
 
     def _get_ts_qm(self, irec=0, iconn=0):
 
+        # find correct entry for reach and connection
+        irec, iconn = np.broadcast_arrays(irec, iconn)
+        match = (self.connectivity[:, 1] == irec.reshape(-1, 1)) & (
+            self.connectivity[:, 2] == iconn.reshape(-1, 1)
+        )
+        found = match.any(axis=1)
+        i = match.argmax(axis=1)
+
         # create array
-        gage_record = np.zeros(self._ntimes, dtype=self.out_dtype)
-
-        # iterate through the record dictionary
-        idx = 0
-        for key, value in self.recorddict.items():
-            totim = key
-            gage_record["totim"][idx] = totim
-
-            self.file.seek(value)
-            r = self._get_data()
-
-            # find correct entry for reach and connection
-            for i in range(self.nrecord):
-                inode = self.connectivity[i, 1]
-                ic = self.connectivity[i, 2]
-                if irec == inode and ic == iconn:
-                    for name in r.dtype.names:
-                        gage_record[name][idx] = r[name][i]
-                    break
-            idx += 1
+        gage_record = np.zeros((self._ntimes, irec.size), dtype=self.out_dtype)
+        gage_record["totim"] = self._times[:, np.newaxis]
+        data = self._data["data"][:, i[found]]
+        for name in self.dtype.names:
+            gage_record[name][:, found] = data[name]
 
+        gage_record.shape = (self._ntimes,) + irec.shape
         return gage_record.view(dtype=self.out_dtype)
 
     def _get_ts_qaq(self, irec=0, klay=0):
-
-        # create array
-        gage_record = np.zeros(self._ntimes, dtype=self.out_dtype)
-
-        # iterate through the record dictionary
-        idx = 0
-        for key, value in self.recorddict.items():
-            totim = key
-            gage_record["totim"][idx] = totim
-
-            self.nitems, self.itemlist = self.nentries[key]
-
-            self.file.seek(value)
-            r = self._get_data()
-
-            # find correct entry for record and layer
-            ilen = np.shape(r)[0]
-            for i in range(ilen):
-                ir = r["reach"][i]
-                il = r["layer"][i]
-                if ir == irec and il == klay:
-                    for name in r.dtype.names:
-                        gage_record[name][idx] = r[name][i]
-                    break
-            idx += 1
-
-        return gage_record.view(dtype=self.out_dtype)
+        return self._get_ts_items(irec, klay, "layer")
 
     def _get_ts_structure(self, irec=0, istr=0):
+        return self._get_ts_items(irec, istr, "structure")
 
-        # create array
-        gage_record = np.zeros(self._ntimes, dtype=self.out_dtype)
-
-        # iterate through the record dictionary
-        idx = 0
-        for key, value in self.recorddict.items():
-            totim = key
-            gage_record["totim"][idx] = totim
-
-            self.nitems, self.itemlist = self.nentries[key]
-
-            self.file.seek(value)
-            r = self._get_data()
-
-            # find correct entry for record and structure number
-            ilen = np.shape(r)[0]
-            for i in range(ilen):
-                ir = r["reach"][i]
-                il = r["structure"][i]
-                if ir == irec and il == istr:
-                    for name in r.dtype.names:
-                        gage_record[name][idx] = r[name][i]
-                    break
-            idx += 1
+    def _get_ts_items(self, irec, item, field):
+        """
+        Get the time series of exchange or structure items. The items of
+        the reaches are gathered from the file for all times at once.
+        """
+        irec, item = np.broadcast_arrays(irec, item)
+        shape = irec.shape
+        nts = irec.size
+        irec = irec.ravel()
+        item = item.ravel()
+
+        # items of each reach and time
+        count = self._itemlist[:, irec].ravel()
+        start = self._itemstart[:, irec].ravel()
+        ipair = np.repeat(np.arange(count.size), count)
+        k = np.arange(ipair.size) - np.repeat(np.cumsum(count) - count, count)
+        pos = self._offsets[ipair // nts]
+        pos += (start[ipair] + k) * self._itembytes
+        if field == "structure":
+            # the structure number is the position in the items of a reach
+            keep = k == item[ipair % nts]
+            ipair, k, pos = ipair[keep], k[keep], pos[keep]
+
+        # read the items
+        buf = np.memmap(self.file.name, dtype=np.uint8, mode="r")
+        nbytes = self.dtype.itemsize
+        items = buf[pos[:, np.newaxis] + np.arange(nbytes)]
+        items = items.view(self.dtype).ravel()
+
+        # find correct entry for record and layer or structure number
+        if field == "layer":
+            items["layer"] -= 1
+            keep = items["layer"] == item[ipair % nts]
+        else:
+            keep = np.ones(ipair.size, dtype=bool)
+        idx = np.nonzero(keep)[0]
+        ipair, ifirst = np.unique(ipair[idx], return_index=True)
+        items = items[idx[ifirst]]
 
+        # create array
+        gage_record = np.zeros((self._ntimes, nts), dtype=self.out_dtype)
+        gage_record["totim"] = self._times[:, np.newaxis]
+        gage_record = gage_record.ravel()
+        gage_record["reach"][ipair] = irec[ipair % nts]
+        if field == "structure":
+            gage_record["structure"][ipair] = item[ipair % nts]
+        for name in self.dtype.names:
+            gage_record[name][ipair] = items[name]
+
+        gage_record.shape = (self._ntimes,) + shape
         return gage_record.view(dtype=self.out_dtype)
 
     def _get_data(self):
@@ -547,18 +515,8 @@ class SwrFile(FlopyBinaryData):
         # add reach number to qaq data
         r = np.zeros(self.nitems, dtype=self.qaq_dtype)
 
-        # build array with reach numbers
-        reaches = np.zeros(self.nitems, dtype=np.int32)
-        idx = 0
-        for irch in range(self.nrecord):
-            klay = self.itemlist[irch]
-            for k in range(klay):
-                # r[idx, 0] = irch
-                reaches[idx] = irch
-                idx += 1
-
         # add reach to array returned
-        r["reach"] = reaches.copy()
+        r["reach"] = np.repeat(np.arange(self.nrecord), self.itemlist)
 
         # add read data to array returned
         for idx, k in enumerate(self.dtype.names):
@@ -573,20 +531,12 @@ class SwrFile(FlopyBinaryData):
         # add reach and structure number to structure data
         r = np.zeros(self.nitems, dtype=self.str_dtype)
 
-        # build array with reach numbers
-        reaches = np.zeros(self.nitems, dtype=np.int32)
-        struct = np.zeros(self.nitems, dtype=np.int32)
-        idx = 0
-        for irch in range(self.nrecord):
-            nstr = self.itemlist[irch]
-            for n in range(nstr):
-                reaches[idx] = irch
-                struct[idx] = n
-                idx += 1
-
-        # add reach to array returned
-        r["reach"] = reaches.copy()
-        r["structure"] = struct.copy()
+        # add reach and structure number to array returned
+        istart = np.cumsum(self.itemlist) - self.itemlist
+        r["reach"] = np.repeat(np.arange(self.nrecord), self.itemlist)
+        r["structure"] = np.arange(self.nitems) - np.repeat(
+            istart, self.itemlist
+        )
 
         # add read data to array returned
         for idx, k in enumerate(self.dtype.names):
@@ -595,55 +545,102 @@ class SwrFile(FlopyBinaryData):
 
     def _build_index(self):
         """
-        Build the recordarray recarray and recorddict dictionary, which map
-        the header information to the position in the binary file.
+        Build the offset table of the records in the binary file, the
+        recordarray recarray and the recorddict dictionary, which map the
+        header information to the position in the binary file.
         """
-        self.file.seek(self.datastart)
         if self.verbose:
             sys.stdout.write("Generating SWR binary data time list\n")
-        self._ntimes = 0
-        self._times = []
-        self._kswrkstpkper = []
-        self.recorddict = OrderedDict()
-
-        idx = 0
-        while True:
-            # --output something to screen so it is possible to determine
-            #  that the time list is being created
-            idx += 1
-            if self.verbose:
-                v = divmod(float(idx), 72.0)
-                if v[1] == 0.0:
-                    sys.stdout.write(".")
-            # read header
-            totim, dt, kper, kstp, kswr, success = self._read_header()
-            if success:
-                if self.type == "exchange":
-                    bytes = self.nitems * (
-                        self.integerbyte + 8 * self.realbyte
-                    )
-                elif self.type == "structure":
-                    bytes = self.nitems * (5 * self.realbyte)
-                else:
-                    bytes = self.nrecord * self.items * self.realbyte
-                ipos = self.file.tell()
-                self.file.seek(bytes, 1)
-                # save data
-                self._ntimes += 1
-                self._times.append(totim)
-                self._kswrkstpkper.append((kswr, kstp, kper))
-                header = (totim, kswr, kstp, kper)
-                self.recorddict[totim] = ipos
-                self._recordarray.append(header)
-            else:
-                if self.verbose:
-                    sys.stdout.write("\n")
-                self._recordarray = np.array(
-                    self._recordarray, dtype=self.header_dtype
+        hdr_dtype = np.dtype(
+            [
+                ("totim", self.floattype),
+                ("dt", self.floattype),
+                ("kper", "i4"),
+                ("kstp", "i4"),
+                ("kswr", "i4"),
+            ]
+        )
+        if self.type == "exchange" or self.type == "structure":
+            headers = self._scan_records(hdr_dtype)
+            self._data = None
+        else:
+            # records with a fixed size are memory-mapped
+            rec_dtype = np.dtype(
+                [("header", hdr_dtype), ("data", self.dtype, (self.nrecord,))]
+            )
+            nbytes = os.fstat(self.file.fileno()).st_size - self.datastart
+            ntimes = max(nbytes, 0) // rec_dtype.itemsize
+            if ntimes > 0:
+                self._data = np.memmap(
+                    self.file.name,
+                    dtype=rec_dtype,
+                    mode="r",
+                    offset=self.datastart,
+                    shape=(ntimes,),
                 )
-                self._times = np.array(self._times)
-                self._kswrkstpkper = np.array(self._kswrkstpkper)
-                return
+            else:
+                self._data = np.zeros(0, dtype=rec_dtype)
+            headers = np.array(self._data["header"])
+            self._offsets = (
+                self.datastart
+                + np.arange(ntimes, dtype=np.int64) * rec_dtype.itemsize
+                + hdr_dtype.itemsize
+            )
+
+        self._ntimes = headers.shape[0]
+        self._times = headers["totim"].copy()
+        self._recordarray = np.zeros(self._ntimes, dtype=self.header_dtype)
+        self._recordarray["totim"] = self._times
+        for name in ("kswr", "kstp", "kper"):
+            self._recordarray[name] = headers[name] - 1
+        self._kswrkstpkper = np.column_stack(
+            [self._recordarray[name] for name in ("kswr", "kstp", "kper")]
+        ).astype(int)
+        self.recorddict = OrderedDict(
+            zip(self._times.tolist(), self._offsets.tolist())
+        )
+        return
+
+    def _scan_records(self, hdr_dtype):
+        """
+        Scan the headers of exchange and structure records, which have a
+        variable number of items, in one pass through the file.
+        """
+        if self.type == "exchange":
+            self._itembytes = self.integerbyte + 8 * self.realbyte
+        else:
+            self._itembytes = 5 * self.realbyte
+        buf = np.memmap(self.file.name, dtype=np.uint8, mode="r")
+        nlist = self.nrecord * self.integerbyte
+        nhead = nlist + hdr_dtype.itemsize
+        headers = []
+        offsets = []
+        itemlists = []
+        ipos = self.datastart
+        while ipos + nhead <= buf.shape[0]:
+            itemlist = np.frombuffer(
+                buf, dtype=np.int32, count=self.nrecord, offset=ipos
+            ).astype(int)
+            header = np.frombuffer(
+                buf, dtype=hdr_dtype, count=1, offset=ipos + nlist
+            )
+            ipos += nhead
+            nitems = itemlist.sum()
+            self.nentries[header["totim"][0]] = (nitems, itemlist)
+            headers.append(header)
+            offsets.append(ipos)
+            itemlists.append(itemlist)
+            ipos += nitems * self._itembytes
+        del buf
+
+        self._offsets = np.array(offsets, dtype=np.int64)
+        self._itemlist = np.array(itemlists, dtype=int).reshape(
+            -1, self.nrecord
+        )
+        self._itemstart = np.cumsum(self._itemlist, axis=1) - self._itemlist
+        if headers:
+            return np.concatenate(headers)
+        return np.zeros(0, dtype=hdr_dtype)
 
 
 class SwrStage(SwrFile):
@@ -1140,24 +1140,21 @@ class MfList(DataInterface, DataListInterface):
             else:
                 raise Exception("MfList: something bad happened")
 
+        # cell indices of all records, used to accumulate values with
+        # unbuffered (np.add.at) sums so duplicate cells are handled
+        if unstructured:
+            idx_rec = (sarr["node"].astype(int),)
+        else:
+            idx_rec = (
+                sarr["k"].astype(int),
+                sarr["i"].astype(int),
+                sarr["j"].astype(int),
+            )
+
         for name, arr in arrays.items():
-            if unstructured:
-                cnt = np.zeros(
-                    (self._model.nlay * self._model.ncpl,), dtype=np.float
-                )
-            else:
-                cnt = np.zeros(
-                    (self._model.nlay, self._model.nrow, self._model.ncol),
-                    dtype=np.float,
-                )
-            # print(name,kper)
-            for rec in sarr:
-                if unstructured:
-                    arr[rec["node"]] += rec[name]
-                    cnt[rec["node"]] += 1.0
-                else:
-                    arr[rec["k"], rec["i"], rec["j"]] += rec[name]
-                    cnt[rec["k"], rec["i"], rec["j"]] += 1.0
+            cnt = np.zeros(arr.shape, dtype=np.float)
+            np.add.at(arr, idx_rec, sarr[name])
+            np.add.at(cnt, idx_rec, 1.0)
             # average keys that should not be added
             if name not in ("cond", "flux"):
                 idx = cnt > 0.0
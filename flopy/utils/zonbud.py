@@ -1,11 +1,27 @@
 import os
+import re
 import copy
+import warnings
 import numpy as np
 from .binaryfile import CellBudgetFile
 from itertools import groupby
 from collections import OrderedDict
 from ..utils.utils_def import totim_to_datetime
 
+# flow budget header of an original style zonebudget output file
+_zb_txt_hdr_re = re.compile(
+    rb"flow budget for zone\s*(\d+)\s*at time step\s*(\d+)\s*"
+    rb"of stress period\s*(\d+)"
+)
+# time step header with the zone header on the next line, in/out marker or
+# "label, values" line of a zonebudget csv output file
+_zb_csv1_re = re.compile(
+    rb"^[ \t]*time step,\s*(\d+),\s*stress period,\s*(\d+),.*\n(.*)"
+    rb"|^[ \t]*,[ \t]*(in|out)[ \t]*,"
+    rb"|^[ \t]*([^,\n]*?)[ \t]*,(.*)",
+    re.M,
+)
+
 
 class ZoneBudget(object):
     """
@@ -1838,6 +1854,109 @@ def get_totim_modflow6(tdis):
     return totim
 
 
+def _last_index(mask):
+    """
+    Get the index of the last True entry of a boolean array at or before
+    each position, positions before the first True entry get index 0
+
+    """
+    ix = np.where(mask, np.arange(mask.size), 0)
+    return np.maximum.accumulate(ix)
+
+
+def _iter_chunks(f, marker, chunksize):
+    """
+    Read a zonebudget output file in lower case chunks of at least
+    chunksize bytes. Chunks end at the start of the last line with the
+    marker, so that every flow budget is read in a single chunk.
+
+    Parameters
+    ----------
+    f : file object
+        file opened in binary mode
+    marker : bytes
+        lower case text at the start of each flow budget
+    chunksize : int
+        number of bytes read at once
+
+    Yields
+    ------
+    tuple : (offset, text) position of the chunk in the file and the lower
+        case text of the chunk
+
+    """
+    offset = 0
+    text = b""
+    while True:
+        data = f.read(chunksize)
+        if not data:
+            if text:
+                yield offset, text
+            return
+        text += data.lower()
+        ix = text.rfind(marker)
+        ix = text.rfind(b"\n", 0, max(ix, 0)) + 1
+        if ix > 0:
+            yield offset, text[:ix]
+            offset += ix
+            text = text[ix:]
+
+
+def _find_bytes(buffer, pattern, anchor=0):
+    """
+    Find the positions of a byte string in a uint8 array of file contents.
+    Candidates are located with the byte at index anchor of the pattern,
+    which should be a rare byte for speed.
+
+    """
+    n = len(pattern)
+    anchor %= n
+    pos = np.flatnonzero(
+        buffer[anchor : buffer.size - n + anchor + 1] == pattern[anchor]
+    )
+    for i in range(n):
+        if i != anchor:
+            pos = pos[buffer[pos + i] == pattern[i]]
+    return pos
+
+
+def _read_csv_array(f, ncol):
+    """
+    Read the rows of a comma separated zonebudget output file into a
+    (nrow, ncol) float array in a single pass. The empty column of files
+    with a trailing comma on each line is filled with nan.
+
+    Parameters
+    ----------
+    f : file object
+        open file positioned after the header
+    ncol : int
+        number of columns in the header
+
+    Returns
+    -------
+        np.ndarray
+
+    """
+    text = f.read().strip()
+    nempty = 1 if text.endswith(",") else 0
+    nval = ncol - nempty
+    if nempty:
+        text = text.rstrip(",").replace(",\n", "\n")
+    text = text.replace("\n", ",")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        array = np.fromstring(text, dtype=float, sep=",")
+    if nval < 1 or array.size % nval != 0:
+        # fall back to the slower reader for irregular files
+        f.seek(0)
+        return np.genfromtxt(f, delimiter=",", skip_header=1)
+    array = array.reshape(-1, nval)
+    if nempty:
+        array = np.column_stack((array, np.full(len(array), np.nan)))
+    return array
+
+
 class ZBNetOutput(object):
     """
     Class that holds zonebudget netcdf output and allows export utilities
@@ -1881,6 +2000,9 @@ class ZoneBudgetOutput(object):
 
     """
 
+    # number of bytes of the zonebudget output file read at once
+    _chunksize = 2 ** 22
+
     def __init__(self, f, dis, zones):
         import pandas as pd
         from ..modflow import ModflowDis
@@ -1994,232 +2116,220 @@ class ZoneBudgetOutput(object):
         Read original style zonebudget output file
 
         """
+        chunks = []
+        with open(self._filename, "rb") as foo:
+            for offset, text in _iter_chunks(
+                foo, b"flow budget for zone", self._chunksize
+            ):
+                chunk = self._read_chunk1(text, offset)
+                if chunk is not None:
+                    chunks.append(chunk)
+
+        data_in, data_out = self._merge_chunks(chunks)
+        self._data = self._net_flux(data_in, data_out)
+
+    def _read_chunk1(self, text, offset):
+        """
+        Method to read the flow budgets in a chunk of an original style
+        zonebudget output file
 
-        with open(self._filename) as foo:
-
-            data_in = {}
-            data_out = {}
-            read_in = False
-            read_out = False
-            flow_budget = False
-            empty = 0
-            while True:
-                line = foo.readline().strip().lower()
-
-                if "flow budget for zone" in line:
-                    flow_budget = True
-                    read_in = False
-                    read_out = False
-                    empty = 0
-                    t = line.split()
-                    zone = int(t[4])
-                    if len(t[7]) > 4:
-                        t.insert(8, t[7][4:])
-                    kstp = int(t[8]) - 1
-                    if len(t[11]) > 6:
-                        t.append(t[11][6:])
-                    kper = int(t[12]) - 1
-                    if "zone" not in data_in:
-                        data_in["zone"] = [zone]
-                        data_in["kstp"] = [kstp]
-                        data_in["kper"] = [kper]
-                    else:
-                        data_in["zone"].append(zone)
-                        data_in["kstp"].append(kstp)
-                        data_in["kper"].append(kper)
-
-                    if self._steady[kper]:
-                        try:
-                            data_in["storage"].append(0.0)
-                            data_out["storage"].append(0.0)
-                        except KeyError:
-                            data_in["storage"] = [0.0]
-                            data_out["storage"] = [0.0]
-
-                elif line in ("", " "):
-                    empty += 1
-
-                elif read_in:
-                    if "=" in line:
-                        t = line.split("=")
-                        label = t[0].strip()
-                        if "zone" in line:
-                            # currently we do not support zone to zone
-                            # flow for option 1
-                            pass
-                        else:
-                            if "total" in line:
-                                label = "total"
-
-                            if label in data_in:
-                                data_in[label].append(float(t[1]))
-                            else:
-                                data_in[label] = [float(t[1])]
-
-                    elif "out:" in line:
-                        read_out = True
-                        read_in = False
-
-                    else:
-                        pass
-
-                elif read_out:
-                    if "=" in line:
-                        t = line.split("=")
-                        label = t[0].strip()
-                        if "zone" in line:
-                            # currently we do not support zone to zone
-                            # flow for option 1
-                            pass
-
-                        elif "in - out" in line:
-                            pass
-
-                        elif "percent discrepancy" in line:
-                            pass
-
-                        else:
-                            if "total" in line:
-                                label = "total"
-
-                            if label in data_out:
-                                data_out[label].append(float(t[1]))
-                            else:
-                                data_out[label] = [float(t[1])]
-                    else:
-                        pass
-
-                elif flow_budget:
-                    if "in:" in line:
-                        read_in = True
-                        flow_budget = False
-
-                else:
-                    pass
-
-                if empty >= 30:
-                    break
+        Parameters
+        ----------
+        text : bytes
+            lower case chunk of the file
+        offset : int
+            position of the chunk in the file
 
-        data = self._net_flux(data_in, data_out)
+        Returns
+        -------
+        tuple or None
+        """
+        buffer = np.frombuffer(text, dtype=np.uint8)
+        hdr = np.array(_zb_txt_hdr_re.findall(text)).astype(int)
+        if hdr.size == 0:
+            return None
+
+        # the IN: and OUT: sections of each flow budget
+        inpos = _find_bytes(buffer, b"in:", anchor=-1)
+        outpos = _find_bytes(buffer, b"out:", anchor=-1)
+        sections = np.column_stack((inpos, outpos)).ravel()
+        if not len(hdr) == inpos.size == outpos.size or np.any(
+            np.diff(sections) < 0
+        ):
+            raise Exception(
+                "Could not read the flow budgets in {}".format(self._filename)
+            )
+        zone, kstp, kper = hdr.T
+        kstp -= 1
+        kper -= 1
+
+        # "label = value" lines, split at the first "=" of each line
+        newline = np.flatnonzero(buffer == ord("\n"))
+        pos = np.flatnonzero(buffer == ord("="))
+        iline = np.searchsorted(newline, pos)
+        first = np.ones(pos.size, dtype=bool)
+        first[1:] = iline[1:] != iline[:-1]
+
+        # currently we do not support zone to zone flow for option 1
+        iszone = np.zeros(newline.size + 1, dtype=bool)
+        iszone[np.searchsorted(newline, _find_bytes(buffer, b"zone"))] = True
+
+        # IN: sections are at odd and OUT: sections at even section numbers
+        isection = np.searchsorted(sections, pos)
+        keep = np.nonzero(first & ~iszone[iline] & (isection > 0))[0]
+        pos, iline, isection = pos[keep], iline[keep], isection[keep]
+        isin = isection % 2 == 1
+        irow = (isection - 1) // 2
+        linestart = np.append(0, newline + 1)[iline]
+        lineend = np.append(newline, buffer.size)[iline]
+
+        ilabel, names = self.__pd.factorize(
+            [text[i0:i1] for i0, i1 in zip(linestart.tolist(), pos.tolist())]
+        )
+        names = [i.decode().strip() for i in names]
+        skip_out = np.array(
+            [i in ("in - out", "percent discrepancy") for i in names],
+            dtype=bool,
+        )
+        names = ["total" if "total" in i else i for i in names]
+        keep = isin | ~skip_out[ilabel]
+        pos, irow, isin = pos[keep], irow[keep], isin[keep]
+        ilabel, lineend = ilabel[keep], lineend[keep]
+
+        # gather the values after the "=" and parse them at once
+        nchar = lineend - pos
+        ichar = np.repeat(lineend - np.cumsum(nchar), nchar) + np.arange(
+            nchar.sum()
+        )
+        values = buffer[ichar]
+        # the "=" of each record separates the values
+        values[np.cumsum(nchar) - nchar] = ord(" ")
+        values = np.fromstring(values.tobytes(), dtype=float, sep=" ")
+        if values.size != pos.size:
+            raise ValueError(
+                "Could not read the budget values in {}".format(self._filename)
+            )
 
-        self._data = data
+        index = OrderedDict([("zone", zone), ("kstp", kstp), ("kper", kper)])
+        return (index, inpos + offset) + self._get_flux_arrays(
+            len(hdr), irow, names, ilabel, isin, values, pos + offset
+        )
 
     def _read_file2(self):
         """
         Method to read csv output type 1
 
         """
-        with open(self._filename) as foo:
-            data_in = {}
-            data_out = {}
-            zone_header = False
-            read_in = False
-            read_out = False
-            empty = 0
-            while True:
-                line = foo.readline().strip().lower()
-
-                if "time step" in line:
-                    t = line.split(",")
-                    kstp = int(t[1]) - 1
-                    kper = int(t[3]) - 1
-                    if "kstp" not in data_in:
-                        data_in["kstp"] = []
-                        data_in["kper"] = []
-                        data_in["zone"] = []
-
-                    zone_header = True
-                    empty = 0
-
-                elif zone_header:
-                    t = line.split(",")
-                    zones = [
-                        int(i.split()[-1]) for i in t[1:] if i not in ("",)
-                    ]
-
-                    for zone in zones:
-                        data_in["kstp"].append(kstp)
-                        data_in["kper"].append(kper)
-                        data_in["zone"].append(zone)
-                        if self._steady[kper]:
-                            try:
-                                data_in["storage"].append(0.0)
-                                data_out["storage"].append(0.0)
-                            except KeyError:
-                                data_in["storage"] = [0.0]
-                                data_out["storage"] = [0.0]
-
-                    zone_header = False
-                    read_in = True
-
-                elif read_in:
-                    t = line.split(",")
-                    if "in" in t[1]:
-                        pass
-
-                    elif "out" in t[1]:
-                        read_in = False
-                        read_out = True
-
-                    else:
-                        if "zone" in t[0]:
-                            label = " ".join(t[0].split()[1:])
-
-                        elif "total" in t[0]:
-                            label = "total"
-
-                        else:
-                            label = t[0]
-
-                        if label not in data_in:
-                            data_in[label] = []
-
-                        for val in t[1:]:
-                            if val in ("",):
-                                continue
-
-                            data_in[label].append(float(val))
-
-                elif read_out:
-                    t = line.split(",")
-
-                    if "percent error" in line:
-                        read_out = False
-
-                    elif "in-out" in line:
-                        pass
-
-                    else:
-                        if "zone" in t[0]:
-                            label = " ".join(t[0].split()[1:])
-
-                        elif "total" in t[0]:
-                            label = "total"
-
-                        else:
-                            label = t[0]
-
-                        if label not in data_out:
-                            data_out[label] = []
-
-                        for val in t[1:]:
-                            if val in ("",):
-                                continue
-
-                            data_out[label].append(float(val))
-
-                elif line in ("", " "):
-                    empty += 1
-
-                else:
-                    pass
+        chunks = []
+        with open(self._filename, "rb") as foo:
+            for offset, text in _iter_chunks(
+                foo, b"time step", self._chunksize
+            ):
+                chunk = self._read_chunk2(text, offset)
+                if chunk is not None:
+                    chunks.append(chunk)
+
+        data_in, data_out = self._merge_chunks(chunks)
+        self._data = self._net_flux(data_in, data_out)
+
+    def _read_chunk2(self, text, offset):
+        """
+        Method to read the flow budgets in a chunk of a csv output type 1
+        file
 
-                if empty >= 25:
-                    break
+        Parameters
+        ----------
+        text : bytes
+            lower case chunk of the file
+        offset : int
+            position of the chunk in the file
 
-        data = self._net_flux(data_in, data_out)
+        Returns
+        -------
+        tuple or None
+        """
+        # kstp, kper, zone header, in/out marker, budget term label and
+        # the comma separated values of the budget term for each zone
+        columns = list(zip(*_zb_csv1_re.findall(text)))
+        if not columns:
+            return None
+        kstp, kper, marker, label = [
+            np.array(columns[ix]) for ix in (0, 1, 3, 4)
+        ]
+        ishdr = kstp != b""
+        ihdr = np.nonzero(ishdr)[0]
+        if ihdr.size == 0:
+            return None
+        kstp = kstp[ihdr].astype(int) - 1
+        kper = kper[ihdr].astype(int) - 1
+        zones = [
+            [
+                int(i.split()[-1])
+                for i in columns[2][ix].split(b",")[1:]
+                if i.strip()
+            ]
+            for ix in ihdr
+        ]
+        nzone = np.array([len(i) for i in zones], dtype=int)
+        rowstart = np.cumsum(nzone) - nzone
+
+        # section of each token: 0 after the percent error, 1 for the
+        # inflows that follow the zone header and 2 for the outflows
+        section = np.zeros(label.size, dtype=int)
+        section[ishdr | (marker == b"in")] = 1
+        section[marker == b"out"] = 2
+        isend = label == b"percent error"
+        section = section[_last_index(ishdr | (marker != b"") | isend)]
+        iblock = np.cumsum(ishdr) - 1
+
+        names, ilabel = np.unique(label, return_inverse=True)
+        names = [i.decode() for i in names]
+        names = [
+            " ".join(i.split()[1:])
+            if "zone" in i
+            else "total"
+            if "total" in i
+            else i
+            for i in names
+        ]
+        skip = (label == b"") | (label == b"in-out") | isend
+        irec = np.nonzero(~skip & (iblock >= 0) & (section > 0))[0]
 
-        self._data = data
+        # parse the values of all records at once
+        values = b",".join(
+            [columns[5][ix].rstrip().rstrip(b",") for ix in irec]
+        )
+        values = np.fromstring(values, dtype=float, sep=",")
+        nval = nzone[iblock[irec]]
+        if values.size != nval.sum():
+            raise ValueError(
+                "Number of budget values in {} does not match the "
+                "number of zones".format(self._filename)
+            )
+        rec = np.repeat(irec, nval)
+        irow = np.repeat(rowstart[iblock[irec]], nval)
+        irow += np.arange(values.size)
+        irow -= np.repeat(np.cumsum(nval) - nval, nval)
+
+        index = OrderedDict(
+            [
+                ("kstp", np.repeat(kstp, nzone)),
+                ("kper", np.repeat(kper, nzone)),
+                ("zone", np.array([z for i in zones for z in i], dtype=int)),
+            ]
+        )
+        # token positions are offset by the chunk position to keep them
+        # increasing over the chunks of the file
+        rowpos = np.repeat(ihdr, nzone) + offset
+        return (index, rowpos) + self._get_flux_arrays(
+            nzone.sum(),
+            irow,
+            names,
+            ilabel[rec],
+            section[rec] == 1,
+            values,
+            rec + offset,
+        )
 
     def _read_file3(self):
         """
@@ -2236,7 +2346,7 @@ class ZoneBudgetOutput(object):
             header = foo.readline().lower().strip().split(",")
             header = [i.strip() for i in header]
 
-            array = np.genfromtxt(foo, delimiter=",").T
+            array = _read_csv_array(foo, len(header)).T
 
         for ix, label in enumerate(header):
             if label in ("totim", "in-out", "percent error"):
@@ -2304,6 +2414,112 @@ class ZoneBudgetOutput(object):
 
         self._data = data
 
+    @staticmethod
+    def _get_flux_arrays(nrow, irow, names, ilabel, isin, values, position):
+        """
+        Method to scatter budget records into a typed array of inflows and
+        outflows for each budget term
+
+        Parameters
+        ----------
+        nrow : int
+            number of zone budget rows
+        irow : np.ndarray
+            row of each record
+        names : list
+            budget term names, may contain duplicates
+        ilabel : np.ndarray
+            index of the budget term name of each record
+        isin : np.ndarray
+            boolean array, True for inflow records
+        values : np.ndarray
+            value of each record
+        position : np.ndarray
+            increasing position of each record in the file
+
+        Returns
+        -------
+        tuple : (names, first, flux) unique budget term names, position of
+            the first inflow record of each budget term (inf if there are
+            none) and a (2, nrow, len(names)) array of inflows and outflows
+        """
+        # merge budget terms with the same name
+        unique = list(OrderedDict.fromkeys(names))
+        ilabel = np.array([unique.index(i) for i in names], dtype=int)[ilabel]
+
+        first = np.full(len(unique), np.inf)
+        ifirst = np.unique(ilabel[isin], return_index=True)
+        first[ifirst[0]] = position[isin][ifirst[1]]
+
+        flux = np.zeros((2, nrow, len(unique)), dtype=float)
+        flux[np.where(isin, 0, 1), irow, ilabel] = values
+        return unique, first, flux
+
+    def _merge_chunks(self, chunks):
+        """
+        Method to merge the flow budgets read from the chunks of a
+        zonebudget output file into dictionaries of inflow and outflow
+        arrays. Budget terms are ordered by the position of their first
+        inflow record and budget terms without inflow records are dropped.
+        Steady state flow budgets get a zero storage term.
+
+        Parameters
+        ----------
+        chunks : list
+            (index, rowpos, names, first, flux) tuple for each chunk with
+            an OrderedDict of zone, kstp and kper arrays, the position of
+            each row in the file and the results of _get_flux_arrays
+
+        Returns
+        -------
+        tuple : (data_in, data_out) OrderedDicts of budget term arrays
+        """
+        if not chunks:
+            raise Exception(
+                "No flow budgets found in {}".format(self._filename)
+            )
+        index = OrderedDict(
+            (key, np.concatenate([chunk[0][key] for chunk in chunks]))
+            for key in chunks[0][0]
+        )
+        rowpos = np.concatenate([chunk[1] for chunk in chunks])
+
+        lookup = OrderedDict()
+        first = []
+        for chunk in chunks:
+            for name, pos in zip(chunk[2], chunk[3]):
+                if name in lookup:
+                    ix = lookup[name]
+                    first[ix] = min(first[ix], pos)
+                else:
+                    lookup[name] = len(first)
+                    first.append(pos)
+
+        steady = np.asarray(self._steady, dtype=bool)[index["kper"]]
+        if steady.any():
+            if "storage" not in lookup:
+                lookup["storage"] = len(first)
+                first.append(np.inf)
+            ix = lookup["storage"]
+            first[ix] = min(first[ix], rowpos[np.argmax(steady)])
+
+        flux = np.zeros((2, rowpos.size, len(first)), dtype=float)
+        row = 0
+        for chunk in chunks:
+            nrow = chunk[4].shape[1]
+            flux[:, row : row + nrow, [lookup[i] for i in chunk[2]]] = chunk[4]
+            row += nrow
+
+        names = list(lookup)
+        data_in = OrderedDict(index)
+        data_out = OrderedDict()
+        for ix in np.argsort(first, kind="stable"):
+            if np.isinf(first[ix]):
+                continue
+            data_in[names[ix]] = flux[0, :, ix]
+            data_out[names[ix]] = flux[1, :, ix]
+        return data_in, data_out
+
     def _net_flux(self, data_in, data_out):
         """
         Method to create a single dictionary of net flux data
@@ -2330,15 +2546,17 @@ class ZoneBudgetOutput(object):
 
         kstp = data["kstp"]
         kper = data["kper"]
-        tslen = np.array(
-            [self._tslen[(stp, kper[ix])] for ix, stp in enumerate(kstp)]
-        )
-        totim = np.array(
-            [self._totim[(stp, kper[ix])] for ix, stp in enumerate(kstp)]
-        )
-
-        data["tslen"] = tslen
-        data["totim"] = totim
+        nstp = np.asarray(self._nstp, dtype=int)
+        if np.any((kper < 0) | (kper >= nstp.size)) or np.any(
+            (kstp < 0) | (kstp >= nstp[kper])
+        ):
+            raise KeyError(
+                "Zonebudget output contains time steps that are not in "
+                "the model discretization"
+            )
+        istp = (np.cumsum(nstp) - nstp)[kper] + kstp
+        data["tslen"] = np.array(list(self._tslen.values()))[istp]
+        data["totim"] = np.array(list(self._totim.values()))[istp]
 
         return data
 
@@ -2391,7 +2609,7 @@ class ZoneBudgetOutput(object):
         oudic = {"zbud": zbncfobj}
         return output_helper(f, ml, oudic, **kwargs)
 
-    def volumetric_flux(self, extrapolate_kper=False):
+    def volumetric_flux(self, extrapolate_kper=False, cumulative=False):
         """
         Method to generate a volumetric budget table based on flux information
 
@@ -2405,82 +2623,88 @@ class ZoneBudgetOutput(object):
             volumetric budget per stress period
 
             if False, calculates volumes from available flux data
+        cumulative : bool
+            flag to accumulate the volumes of each zone over time. If True,
+            the budget terms of the returned dataframe are cumulative
+            volumes. Default is False
 
         Returns
         -------
             pd.DataFrame
 
         """
-        nper = len(self._nstp)
         volumetric_data = {}
 
-        for key in self._data:
-            volumetric_data[key] = []
-
         if extrapolate_kper:
-            volumetric_data.pop("tslen")
-            volumetric_data.pop("kstp")
-            volumetric_data["perlen"] = []
-
-            perlen = []
-            for per in range(nper):
-                tslen = 0
-                for stp in range(self._nstp[per]):
-                    tslen += self._tslen[(stp, per)]
-
-                perlen.append(tslen)
-
+            nper = len(self._nstp)
+            iper = np.repeat(np.arange(nper), self._nstp)
+            tslen = np.array(list(self._tslen.values()))
+            perlen = np.bincount(iper, weights=tslen, minlength=nper)
             totim = np.add.accumulate(perlen)
 
-            for per in range(nper):
-                idx = np.where(self._data["kper"] == per)[0]
-
-                if len(idx) == 0:
-                    continue
-
-                temp = self._data["zone"][idx]
-
-                for zone in self.zones:
-                    if zone == 0:
-                        continue
-
-                    zix = np.where(temp == zone)[0]
-
-                    if len(zix) == 0:
-                        raise Exception
-
-                    for key, value in self._data.items():
-                        if key == "totim":
-                            volumetric_data[key].append(totim[per])
-
-                        elif key == "tslen":
-                            volumetric_data["perlen"].append(perlen[per])
-
-                        elif key == "kstp":
-                            continue
-
-                        elif key == "kper":
-                            volumetric_data[key].append(per)
+            # first record of each zone in each stress period
+            kper = self._data["kper"]
+            zone = self._data["zone"]
+            zones = self.zones[self.zones != 0]
+            valid = (kper >= 0) & (kper < nper)
+            if zones.size > 0:
+                iz = np.searchsorted(zones, zone).clip(0, zones.size - 1)
+                irec = np.nonzero(valid & (zones[iz] == zone))[0]
+                _, ifirst = np.unique(
+                    kper[irec] * zones.size + iz[irec], return_index=True
+                )
+                irec = irec[ifirst]
+            else:
+                irec = np.array([], dtype=int)
+            per = kper[irec]
 
-                        elif key == "zone":
-                            volumetric_data[key].append(zone)
+            count = np.bincount(per, minlength=nper)
+            missing = np.unique(kper[valid])
+            missing = missing[count[missing] != zones.size]
+            if missing.size > 0:
+                raise Exception(
+                    "Not all zones have budget data in stress "
+                    "period {}".format(missing[0])
+                )
 
-                        else:
-                            tv = value[idx]
-                            zv = tv[zix]
-                            for i in zv:
-                                vol = i * perlen[per]
-                                volumetric_data[key].append(vol)
-                                break
+            for key, value in self._data.items():
+                if key in ("kstp", "tslen"):
+                    continue
+                elif key == "totim":
+                    volumetric_data[key] = totim[per]
+                elif key == "kper":
+                    volumetric_data[key] = per
+                elif key == "zone":
+                    volumetric_data[key] = zone[irec]
+                else:
+                    volumetric_data[key] = value[irec] * perlen[per]
+            volumetric_data["perlen"] = perlen[per]
 
         else:
 
             for key, value in self._data.items():
-                if key in ("zone", "kstp", "kper", "tslen"):
+                if key in ("zone", "kstp", "kper", "tslen", "totim"):
                     volumetric_data[key] = value
                 else:
                     volumetric_data[key] = value * self._data["tslen"]
 
+        keys = [
+            key
+            for key in volumetric_data
+            if key not in ("zone", "kstp", "kper", "tslen", "totim", "perlen")
+        ]
+        if cumulative and keys:
+            # cumulative volumes in one pass over the rows of each zone
+            zone = volumetric_data["zone"]
+            time = volumetric_data["totim"]
+            volumes = np.column_stack([volumetric_data[key] for key in keys])
+            for z in np.unique(zone):
+                ix = np.nonzero(zone == z)[0]
+                ix = ix[np.argsort(time[ix], kind="stable")]
+                volumes[ix] = np.cumsum(volumes[ix], axis=0)
+            for i, key in enumerate(keys):
+                volumetric_data[key] = volumes[:, i]
+
         return self.__pd.DataFrame.from_dict(volumetric_data)
 
     def dataframe_to_netcdf_fmt(self, df, flux=True):